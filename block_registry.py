@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+PyCraft Blok/Eşya ID Kayıt Defteri
+blocks, tools ve items sözlüklerinden başlangıçta bir kez derlenir.
+
+Her öğeye küçük bir tamsayı ID atanır ve sık kullanılan özellikler düz
+tablolar halinde sunulur. Böylece kırma süresi, yüz görünürlüğü ve düşen
+eşya gibi sıcak yollar string karşılaştırması yerine dizi indekslemesi yapar.
+"""
+
+import numpy as np
+
+# Yüz sırası (mesher ile AYNI olmalı)
+FACE_TOP = 0     # Üst (y+1)
+FACE_BOTTOM = 1  # Alt (y-1)
+FACE_RIGHT = 2   # Sağ (x+1)
+FACE_LEFT = 3    # Sol (x-1)
+FACE_FRONT = 4   # Ön (z+1)
+FACE_BACK = 5    # Arka (z-1)
+FACE_COUNT = 6
+
+# Doku atlası satırları (texture_gen.create_atlas sırası ile AYNI olmalı)
+ATLAS_ROWS = [
+    'grass',                # 0: Side
+    'grass_top',            # 1: Top
+    'dirt',                 # 2: Dirt
+    'stone',                # 3: Stone
+    'wood',                 # 4: Wood planks
+    'log',                  # 5: Side
+    'log_top',              # 6: Top
+    'leaves',               # 7: Leaves
+    'bedrock',              # 8: Bedrock
+    'crafting_table',       # 9: Crafting Table Side
+    'crafting_table_top',   # 10: Crafting Table Top
+    'crafting_table_front', # 11: Crafting Table Front
+    'coal_ore',             # 12: Coal
+    'iron_ore',             # 13: Iron
+    'diamond_ore',          # 14: Diamond
+    'wool',                 # 15: Wool
+]
+
+# Yüzlere göre özel atlas satırları: {blok: (üst, alt, yan)}
+_FACE_ROW_OVERRIDES = {
+    'grass': ('grass_top', 'dirt', 'grass'),
+    'log': ('log_top', 'log_top', 'log'),
+    # Tüm yan yüzlerde (ön, arka, sağ, sol) aletlerin olduğu dokuyu (front) kullan
+    'crafting_table': ('crafting_table_top', 'wood', 'crafting_table_front'),
+}
+
+# Alet kategorileri (blocks['preferred_tool'] değerleri)
+TOOL_CATEGORIES = [None, 'pickaxe', 'shovel', 'axe', 'shears']
+
+# Alet seviyesine göre hız çarpanı (isimde geçen malzeme)
+_TIER_MULTIPLIERS = (('diamond', 8.0), ('iron', 5.0), ('stone', 3.0))
+_DEFAULT_TOOL_MULTIPLIER = 3.0
+
+
+class BlockRegistry:
+    """
+    Blok ve eşyalar için ID tablosu.
+
+    ID 0 "boş" anlamına gelir (hava / boş el). Bloklar 1'den başlar,
+    böylece blok ID'leri voxel dizilerinde uint8 olarak saklanabilir.
+    Blok olmayan eşyalar blokların ardından numaralandırılır.
+    """
+
+    def __init__(self, blocks, tools, items):
+        self.names = [None] + list(blocks)
+        self.block_count = len(self.names)
+        for name in list(tools) + list(items):
+            if name not in self.names:
+                self.names.append(name)
+        if self.block_count > 256:
+            raise ValueError("Blok ID'leri uint8 sınırını aşıyor")
+
+        self.ids = {name: i for i, name in enumerate(self.names) if name}
+        n_blocks = self.block_count
+        n_items = len(self.names)
+
+        # --- BLOK TABLOLARI (indeks: blok ID) ---
+        self.passable = np.zeros(n_blocks, dtype=bool)
+        self.solid = np.zeros(n_blocks, dtype=bool)
+        self.base_break_time = np.full(n_blocks, 0.5, dtype=np.float32)
+        self.preferred_tool = np.zeros(n_blocks, dtype=np.uint8)
+        self.drop_item = np.zeros(n_blocks, dtype=np.uint16)
+        self.atlas_rows = np.zeros((n_blocks, FACE_COUNT), dtype=np.uint8)
+
+        for name, data in blocks.items():
+            bid = self.ids[name]
+            self.passable[bid] = data.get('is_passable', False)
+            self.solid[bid] = not self.passable[bid]
+            base = data['base_break_time']
+            self.base_break_time[bid] = np.inf if base < 0 else base
+            self.preferred_tool[bid] = TOOL_CATEGORIES.index(data.get('preferred_tool'))
+            self.drop_item[bid] = self.ids[data.get('drop', name)]
+            self.atlas_rows[bid] = self._face_rows(name)
+
+        # --- EŞYA TABLOLARI (indeks: eşya ID) ---
+        self.is_tool = np.zeros(n_items, dtype=bool)
+        self.tool_multiplier = np.ones(n_items, dtype=np.float32)
+        # tool_matches[eşya, kategori]: alet bu kategoride sayılıyor mu?
+        self.tool_matches = np.zeros((n_items, len(TOOL_CATEGORIES)), dtype=bool)
+        for name in tools:
+            iid = self.ids[name]
+            self.is_tool[iid] = True
+            self.tool_multiplier[iid] = next(
+                (m for tier, m in _TIER_MULTIPLIERS if tier in name), _DEFAULT_TOOL_MULTIPLIER)
+            for ci, category in enumerate(TOOL_CATEGORIES):
+                if category and category in name:
+                    self.tool_matches[iid, ci] = True
+
+        # Kırma süresi tablosu: [blok ID, tutulan eşya ID]
+        self.break_times = self._build_break_times()
+
+        # Yüz görünürlüğü: face_visible[blok, komşu] bu yüz çizilir mi?
+        self.face_visible = self._build_face_visibility()
+
+    def _face_rows(self, name):
+        if name in _FACE_ROW_OVERRIDES:
+            top, bottom, side = (ATLAS_ROWS.index(r) for r in _FACE_ROW_OVERRIDES[name])
+        else:
+            top = bottom = side = ATLAS_ROWS.index(name) if name in ATLAS_ROWS else 0
+        return (top, bottom, side, side, side, side)
+
+    def _build_break_times(self):
+        base = self.base_break_time[:, None]
+        preferred = self.preferred_tool[:, None]
+        # Doğru alet: seviye çarpanı kadar hızlı
+        matches = self.tool_matches[:, self.preferred_tool].T & (preferred > 0)
+        with_tool = base / self.tool_multiplier[None, :]
+        # Blok veya çıplak el: uygun alet gerekiyorsa daha yavaş
+        no_tool = np.where(preferred > 0, base * 1.5, base)
+        times = np.where(self.is_tool[None, :], np.where(matches, with_tool, base), no_tool)
+        times[0, :] = 0.5  # Bilinmeyen blok
+        return times.astype(np.float32)
+
+    def _build_face_visibility(self):
+        ids = np.arange(self.block_count)
+        block_p = self.passable[:, None]
+        # Komşu hava ise her zaman çiz; passable blok sadece farklı komşuya karşı,
+        # katı blok sadece passable komşuya karşı görünür
+        visible = np.where(block_p, ids[:, None] != ids[None, :], self.passable[None, :])
+        visible[:, 0] = True
+        visible[0, :] = False  # Havanın yüzü yok
+        return visible
+
+    # --- ERİŞİM ---
+    def id_of(self, name):
+        """Öğe adının ID'sini döndürür (None veya bilinmeyen = 0)"""
+        return self.ids.get(name, 0)
+
+    def is_block(self, item_id):
+        return 0 < item_id < self.block_count
+
+    def get_break_time(self, block_id, item_id):
+        return float(self.break_times[block_id, item_id])
+
+    def get_drop(self, block_id):
+        """Blok kırıldığında düşen eşyanın adı"""
+        return self.names[self.drop_item[block_id]]
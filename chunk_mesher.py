@@ -0,0 +1,378 @@
+# -*- coding: utf-8 -*-
+"""
+PyCraft Vektörel Chunk Mesher
+Chunk mesh'ini blok blok Python döngüsü yerine NumPy dizi kaydırmalarıyla üretir.
+
+Girdi VoxelWorld.padded_chunk_array çıktısıdır: chunk dizisi + komşu
+chunk'lardan 1 blokluk dolgu (18, 66, 18). Her yüz yönü için merkez dizi ile
+o yöne kaydırılmış komşu dizisi registry.face_visible tablosundan (düz
+uint16 indeksle) geçirilir; altı yönün maskeleri tek dizide toplanır ve tüm
+görünür yüzlerin köşe ve UV'leri tek seferde float32 tamponlara yazılır.
+Mesh'ler indekslidir: dörtgen başına 4 köşe + 6 üçgen indeksi. Normal modda
+her dörtgenin yüz anahtarı (hücre, yön) da döndürülür; tek blok
+düzenlemelerinde mesh yeniden üretilmeden yamanabilir (mesh_patch).
+
+Köşe sırası, üçgen sarımı ve atlas UV'leri eski add_face_data ile birebir
+aynıdır. Bu modül ursina'ya bağlı değildir (işçi süreçlerde de kullanılabilir).
+
+Açgözlü (greedy) modda aynı düzlemdeki, aynı atlas satırını kullanan komşu
+yüzler tek dörtgende birleştirilir. Atlas dikey şerit olduğundan birleşik
+dörtgen dokuyu UV sarmalamasıyla tekrarlayamaz; bu modda UV'ler blok
+biriminde "karo" koordinatıdır ve atlas satırı V'ye kodlanır:
+    u = karo_u,  v = satır * ROW_STRIDE + TILE_BIAS + karo_v
+Parça gölgelendiricisi (main.py: greedy_chunk_shader) fract() ile karoyu
+satırın dolgulu aralığına eşler; 1x1 yüzde sonuç normal mod ile aynıdır.
+
+Uzak chunk'lar için surface_lod() voxel dizisi yerine sütun yükseklik
+haritasından seyreltilmiş bir yüzey üretir (aynı karo UV kodlamasıyla).
+"""
+
+import numpy as np
+
+from block_registry import ATLAS_ROWS, FACE_COUNT
+from voxel_world import CHUNK_SIZE, MIN_Y, NEIGHBOR_OFFSETS, WORLD_HEIGHT
+
+# Atlas kenar boşlukları (komşu satırın dokusu sızmasın diye)
+PADDING_U = 0.02
+PADDING_V = 0.005
+ATLAS_UV_HEIGHT = 1.0 / len(ATLAS_ROWS)
+
+# Yüz köşeleri v0..v3 (bloğun alt-sol-arka köşesine göre), yüz sırası block_registry ile aynı
+QUAD_CORNERS = np.array([
+    [(0, 1, 1), (1, 1, 1), (1, 1, 0), (0, 1, 0)],  # Üst (y+1)
+    [(0, 0, 0), (1, 0, 0), (1, 0, 1), (0, 0, 1)],  # Alt (y-1)
+    [(1, 0, 0), (1, 1, 0), (1, 1, 1), (1, 0, 1)],  # Sağ (x+1)
+    [(0, 0, 1), (0, 1, 1), (0, 1, 0), (0, 0, 0)],  # Sol (x-1)
+    [(1, 0, 1), (1, 1, 1), (0, 1, 1), (0, 0, 1)],  # Ön (z+1)
+    [(0, 0, 0), (0, 1, 0), (1, 1, 0), (1, 0, 0)],  # Arka (z-1)
+], dtype=np.float32)
+
+# Üçgenler: (v2, v1, v0) ve (v0, v3, v2)
+TRIANGLE_ORDER = np.array((2, 1, 0, 0, 3, 2), dtype=np.uint32)
+# Köşe UV'leri: v0..v3 sırasıyla uv3, uv0, uv1, uv2 alır
+# uv0=(u_min, v_max) uv1=(u_max, v_max) uv2=(u_max, v_min) uv3=(u_min, v_min)
+_CORNER_U = np.array([PADDING_U, PADDING_U, 1 - PADDING_U, 1 - PADDING_U], dtype=np.float32)
+_CORNER_V_TOP = np.array([False, True, True, False])
+
+# Greedy mod UV kodlaması (karo_v en fazla dünya yüksekliği kadar taşar)
+ROW_STRIDE = 256.0
+TILE_BIAS = 128.0
+# Köşe başına karo UV'si (v0..v3, normal moddaki köşe UV'leriyle aynı yönde)
+QUAD_TILE_UV = np.array([(0, 0), (0, 1), (1, 1), (1, 0)], dtype=np.float32)
+# Yüz normal ekseni (0=x, 1=y, 2=z), yüz sırasıyla
+FACE_AXIS = (1, 1, 0, 0, 2, 2)
+
+
+def _tile_uv_maps():
+    """Yüz başına köşe ofsetinden (3,) karo UV'sine (2,) afin dönüşüm: uv = ofset @ A + b"""
+    maps = []
+    for face in range(len(QUAD_CORNERS)):
+        plane = [axis for axis in range(3) if axis != FACE_AXIS[face]]
+        corners = QUAD_CORNERS[face][:3].astype(np.float64)
+        system = np.column_stack((corners[:, plane], np.ones(3)))
+        solved = np.linalg.solve(system, QUAD_TILE_UV[:3].astype(np.float64))
+        scale = np.zeros((3, 2))
+        scale[plane] = solved[:2]
+        maps.append((scale.astype(np.float32), solved[2].astype(np.float32)))
+    return maps
+
+
+TILE_UV_MAPS = _tile_uv_maps()
+
+
+def face_keys(xs, ys, zs, face):
+    """Chunk-yerel hücre (ys dizi indeksi) ve yön için tekil yüz anahtarı"""
+    xs, ys, zs = (np.asarray(a, dtype=np.int64) for a in (xs, ys, zs))
+    return ((xs * WORLD_HEIGHT + ys) * CHUNK_SIZE + zs) * FACE_COUNT + face
+
+
+class MeshBuffers:
+    """
+    Tek bir mesh'in düz tamponları.
+
+    vertices (4N, 3) ve uvs (4N, 2) float32; indices (6N,) uint32 üçgen indeksleri;
+    keys (N,) int64 dörtgen başına yüz anahtarı (greedy modda None)
+    """
+
+    def __init__(self, vertices, uvs, indices, source_faces=None, keys=None):
+        self.vertices = vertices
+        self.uvs = uvs
+        self.indices = indices
+        self.keys = keys
+        # Birleştirme öncesi görünür yüz sayısı (greedy modda farklıdır)
+        self.source_faces = self.face_count if source_faces is None else source_faces
+
+    @property
+    def triangle_count(self):
+        return len(self.indices) // 3
+
+    @property
+    def face_count(self):
+        return len(self.vertices) // 4
+
+    @property
+    def source_triangle_count(self):
+        return self.source_faces * 2
+
+
+class ChunkMesher:
+    """Registry tablolarından hazırlanan, durum tutmayan (thread-safe) mesher"""
+
+    def __init__(self, registry):
+        self.face_visible = registry.face_visible
+        # Düz tablo: indeks = blok * blok_sayısı + komşu (uint8 ID'lerle uint16'ya sığar)
+        self.block_count = registry.face_visible.shape[0]
+        self.visible_flat = np.ascontiguousarray(registry.face_visible).ravel()
+        self.passable = registry.passable
+        self.atlas_rows = registry.atlas_rows
+        # Blok/yüz başına atlas satırının V sınırları
+        rows = registry.atlas_rows.astype(np.float64)
+        self.v_max = (1.0 - rows * ATLAS_UV_HEIGHT - PADDING_V).astype(np.float32)
+        self.v_min = (1.0 - (rows + 1) * ATLAS_UV_HEIGHT + PADDING_V).astype(np.float32)
+
+    def face_masks(self, padded):
+        """
+        Yüz yönü başına görünürlük maskesi.
+
+        Returns:
+            (y0, center, masks): center chunk dizisinin dolu katmanları
+            (dizi indeksi y0'dan başlar), masks (FACE_COUNT,) + center.shape
+            bool dizi; chunk tamamen havaysa None
+        """
+        center = padded[1:-1, 1:-1, 1:-1]
+        # Tamamen hava olan katmanlar hiç taranmaz
+        layers = np.flatnonzero(center.any(axis=(0, 2)))
+        if not len(layers):
+            return None
+        y0, y1 = int(layers[0]), int(layers[-1]) + 1
+        center = center[:, y0:y1]
+        sx, sz = center.shape[0], center.shape[2]
+
+        rows = center.astype(np.uint16) * self.block_count
+        masks = np.empty((FACE_COUNT,) + center.shape, dtype=bool)
+        for face, (dx, dy, dz) in enumerate(NEIGHBOR_OFFSETS):
+            neighbor = padded[1 + dx:1 + dx + sx, 1 + y0 + dy:1 + y1 + dy, 1 + dz:1 + dz + sz]
+            np.take(self.visible_flat, rows + neighbor, out=masks[face])
+        return y0, center, masks
+
+    def visible_faces(self, padded):
+        """
+        Tüm görünür yüzler, yön sırasıyla.
+
+        Returns:
+            (faces, xs, ys, zs, ids): yüz başına yön ve chunk-yerel hücre
+            (ys dizi indeksi, dünya y'si = MIN_Y + ys)
+        """
+        found = self.face_masks(padded)
+        if found is None:
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty, empty, empty, empty.astype(np.uint8)
+        y0, center, masks = found
+        faces, xs, ys, zs = np.nonzero(masks)
+        return faces, xs, ys + y0, zs, center[xs, ys, zs]
+
+    def build(self, padded, origin_x, origin_z, greedy=False):
+        """
+        Dolgulu chunk dizisinden katı ve geçilebilir mesh tamponları.
+
+        Args:
+            origin_x, origin_z: chunk'ın dünya koordinatındaki başlangıcı
+            greedy: True ise aynı düzlem/doku yüzleri birleştirilir (karo UV'leri)
+        Returns:
+            (solid: MeshBuffers, passable: MeshBuffers)
+        """
+        if greedy:
+            return self.build_greedy(padded, origin_x, origin_z)
+        origin = np.array((origin_x, MIN_Y, origin_z), dtype=np.float32)
+        parts = ([], [])
+        self._emit_faces(parts, *self.visible_faces(padded), origin)
+        return tuple(_buffers(*_join_parts(target)) for target in parts)
+
+    def cell_quads(self, xs, ys, zs, ids, neighbors, origin_x, origin_z):
+        """
+        Birkaç hücrenin görünür yüzleri (tek blok düzenlemesi yaması için).
+
+        Args:
+            xs, ys, zs: chunk-yerel hücreler (ys dizi indeksi), ids: blok ID'leri
+            neighbors: (n, 6) NEIGHBOR_OFFSETS sırasıyla komşu blok ID'leri
+        Returns:
+            ((keys, vertices (m, 4, 3), uvs (m, 4, 2)) katı, (...) geçilebilir)
+        """
+        origin = np.array((origin_x, MIN_Y, origin_z), dtype=np.float32)
+        xs, ys, zs = (np.asarray(a, dtype=np.intp) for a in (xs, ys, zs))
+        ids = np.asarray(ids, dtype=np.uint8)
+        neighbors = np.asarray(neighbors, dtype=np.uint8)
+        parts = ([], [])
+        # Yön sırasıyla (build ile aynı düzen)
+        faces, cells = np.nonzero(self.face_visible[ids[:, None], neighbors].T)
+        self._emit_faces(parts, faces, xs[cells], ys[cells], zs[cells], ids[cells], origin)
+        quads = []
+        for target in parts:
+            vertices, uvs, keys = _join_parts(target)
+            quads.append((keys, vertices.reshape(-1, 4, 3), uvs.reshape(-1, 4, 2)))
+        return tuple(quads)
+
+    def _emit_faces(self, parts, faces, xs, ys, zs, ids, origin):
+        """Yüzlerin (faces: yüz başına yön) dörtgenlerini hedef mesh'lerin parça listelerine ekler"""
+        if not len(ids):
+            return
+        face_verts = np.empty((len(ids), 4, 3), dtype=np.float32)
+        face_verts[:, :, 0] = xs[:, None]
+        face_verts[:, :, 1] = ys[:, None]
+        face_verts[:, :, 2] = zs[:, None]
+        face_verts += origin
+        face_verts += QUAD_CORNERS[faces]  # (n, 4, 3)
+        face_uvs = np.empty((len(ids), 4, 2), dtype=np.float32)  # (n, 4, 2)
+        face_uvs[..., 0] = _CORNER_U
+        face_uvs[..., 1] = np.where(_CORNER_V_TOP, self.v_max[ids, faces][:, None], self.v_min[ids, faces][:, None])
+        keys = face_keys(xs, ys, zs, faces)
+        passable = self.passable[ids]
+        for target, mask in ((0, ~passable), (1, passable)):
+            if mask.any():
+                parts[target].append((face_verts[mask].reshape(-1, 3), face_uvs[mask].reshape(-1, 2), keys[mask]))
+
+    def build_greedy(self, padded, origin_x, origin_z):
+        """Birleştirilmiş dörtgenlerle mesh tamponları (UV'ler karo kodlamalı, bkz. modül notu)"""
+        origin = np.array((origin_x, MIN_Y, origin_z), dtype=np.float32)
+        parts = ([], [])
+        source = [0, 0]
+        found = self.face_masks(padded)
+        if found is not None:
+            y0, center, masks = found
+            origin[1] += y0
+            rows = self.atlas_rows[center]
+            passable = self.passable[center]
+            for face, mask in enumerate(masks):
+                # Birleştirme anahtarı: atlas satırı + hedef mesh (0 = yüz yok)
+                merge_keys = np.where(mask, 1 + rows[..., face].astype(np.int16) * 2 + passable, 0)
+                for target in (0, 1):
+                    source[target] += int(np.count_nonzero(mask & (passable == bool(target))))
+                cells, sizes, quad_keys = _merge_quads(merge_keys, FACE_AXIS[face])
+                if not len(quad_keys):
+                    continue
+                quad_verts, quad_uvs = _tiled_quads(face, cells, sizes, (quad_keys - 1) // 2, origin)
+                targets = (quad_keys - 1) % 2
+                for target in (0, 1):
+                    pick = targets == target
+                    if pick.any():
+                        parts[target].append((quad_verts[pick].reshape(-1, 3), quad_uvs[pick].reshape(-1, 2)))
+        # Birleşik dörtgenlerin tekil yüz anahtarı yoktur (yamalanamaz)
+        return tuple(_buffers(*_join_parts(parts[i])[:2], None, source[i]) for i in (0, 1))
+
+    def surface_lod(self, heights, ids, origin_x, origin_z, step):
+        """
+        Uzak chunk için yükseklik haritası yüzeyi: step x step sütun tek hücre.
+
+        Hücre yüksekliği sütunlarının en yükseğidir. Üst yüzler ve alçak komşu
+        hücreye bakan duvarlar çizilir; duvarlar farklı adımlı komşu halkalarla
+        çatlak kalmasın diye step kadar aşağı uzatılır. UV'ler karo kodlamalıdır.
+
+        Args:
+            heights: (CHUNK_SIZE + 2 * step) kare, sütunların en üst blok y'si;
+                her yönde step sütunluk komşu dolgusuyla
+            ids: (CHUNK_SIZE, CHUNK_SIZE) sütunların üst blok ID'si
+        Returns:
+            MeshBuffers (tek mesh)
+        """
+        n = CHUNK_SIZE // step
+        cells = heights.reshape(n + 2, step, n + 2, step).max(axis=(1, 3))
+        inner = cells[1:-1, 1:-1]
+        # Hücrenin bloğu: en yüksek sütunun üst bloğu
+        columns = heights[step:-step, step:-step].reshape(n, step, n, step).transpose(0, 2, 1, 3).reshape(n, n, -1)
+        blocks = ids.reshape(n, step, n, step).transpose(0, 2, 1, 3).reshape(n, n, -1)
+        top_ids = np.take_along_axis(blocks, columns.argmax(axis=2)[..., None], axis=2)[..., 0]
+
+        origin = np.array((origin_x, 0, origin_z), dtype=np.float32)
+        ix, iz = np.meshgrid(np.arange(n) * step, np.arange(n) * step, indexing='ij')
+        parts = []
+        sizes = np.full((n * n, 3), (step, 1, step), dtype=np.float32)
+        top_cells = np.stack((ix, inner, iz), axis=-1).reshape(-1, 3).astype(np.float32)
+        parts.append(_tiled_quads(0, top_cells, sizes, self.atlas_rows[top_ids.ravel(), 0], origin))
+        for face in range(2, FACE_COUNT):
+            dx, _, dz = NEIGHBOR_OFFSETS[face]
+            neighbor = cells[1 + dx:n + 1 + dx, 1 + dz:n + 1 + dz]
+            mask = neighbor < inner
+            if not mask.any():
+                continue
+            bottom = neighbor[mask] + 1 - step
+            wall_cells = np.stack((ix[mask], bottom, iz[mask]), axis=-1).astype(np.float32)
+            wall_sizes = np.stack((np.full(len(bottom), step), inner[mask] + 1 - bottom,
+                                   np.full(len(bottom), step)), axis=-1).astype(np.float32)
+            parts.append(_tiled_quads(face, wall_cells, wall_sizes, self.atlas_rows[top_ids[mask], face], origin))
+        vertices, uvs = (np.concatenate(column) for column in zip(*parts))
+        return _buffers(vertices.reshape(-1, 3), uvs.reshape(-1, 2))
+
+
+def _merge_quads(keys, normal_axis):
+    """
+    Anahtar ızgarasındaki eşit komşu hücreleri dikdörtgenlere birleştirir.
+
+    Önce düzlemin ikinci ekseni boyunca eşit anahtar koşuları bulunur, sonra
+    aynı başlangıç/uzunluk/anahtara sahip ardışık satırlardaki koşular üst üste
+    eklenir. İki adım da vektöreldir.
+
+    Returns:
+        (cells (n, 3), sizes (n, 3), keys (n,)): dörtgenin başlangıç hücresi,
+        eksen başına boyutu (normal ekseninde 1) ve anahtarı
+    """
+    a_axis, b_axis = (axis for axis in range(3) if axis != normal_axis)
+    grid = keys.transpose(normal_axis, a_axis, b_axis)
+    n_len, a_len, b_len = grid.shape
+
+    # 1) Koşular: satır sonuna eklenen 0 sütunu koşuların satır aşmasını engeller
+    flat = np.zeros((n_len * a_len, b_len + 1), dtype=grid.dtype)
+    flat[:, :b_len] = grid.reshape(-1, b_len)
+    flat = flat.ravel()
+    starts = np.flatnonzero(np.concatenate(([True], flat[1:] != flat[:-1])))
+    lengths = np.diff(np.append(starts, len(flat)))
+    run_keys = flat[starts]
+    filled = run_keys != 0
+    starts, lengths, run_keys = starts[filled], lengths[filled], run_keys[filled]
+    row, b = np.divmod(starts, b_len + 1)
+    n, a = np.divmod(row, a_len)
+
+    # 2) Ardışık satırlardaki aynı koşuları birleştir
+    order = np.lexsort((a, run_keys, lengths, b, n))
+    n, a, b, lengths, run_keys = n[order], a[order], b[order], lengths[order], run_keys[order]
+    new_quad = np.ones(len(n), dtype=bool)
+    new_quad[1:] = ((n[1:] != n[:-1]) | (b[1:] != b[:-1]) | (lengths[1:] != lengths[:-1])
+                    | (run_keys[1:] != run_keys[:-1]) | (a[1:] != a[:-1] + 1))
+    first = np.flatnonzero(new_quad)
+    heights = np.diff(np.append(first, len(n)))
+
+    cells = np.zeros((len(first), 3), dtype=np.float32)
+    sizes = np.ones((len(first), 3), dtype=np.float32)
+    cells[:, normal_axis] = n[first]
+    cells[:, a_axis] = a[first]
+    cells[:, b_axis] = b[first]
+    sizes[:, a_axis] = heights
+    sizes[:, b_axis] = lengths[first]
+    return cells, sizes, run_keys[first]
+
+
+def _tiled_quads(face, cells, sizes, rows, origin):
+    """Başlangıç hücresi + eksen boyutlarından karo UV'li dörtgenler: (n, 4, 3), (n, 4, 2)"""
+    scaled = QUAD_CORNERS[face] * sizes[:, None, :]
+    vertices = cells[:, None, :] + origin + scaled
+    scale, bias = TILE_UV_MAPS[face]
+    uvs = scaled @ scale + bias
+    uvs[..., 1] += (rows * ROW_STRIDE + TILE_BIAS)[:, None]
+    return vertices, uvs
+
+
+def quad_indices(quad_count):
+    """Ardışık dörtgenler (4 köşe) için üçgen indeks tamponu (6 * quad_count,)"""
+    starts = np.arange(quad_count, dtype=np.uint32)[:, None] * 4
+    return (starts + TRIANGLE_ORDER).ravel()
+
+
+def _join_parts(parts):
+    """[(vertices, uvs, keys), ...] parçalarını tek dizilere birleştirir"""
+    if not parts:
+        return (np.zeros((0, 3), dtype=np.float32), np.zeros((0, 2), dtype=np.float32),
+                np.zeros(0, dtype=np.int64))
+    return tuple(np.concatenate(column) for column in zip(*parts))
+
+
+def _buffers(vertices, uvs, keys=None, source_faces=None):
+    return MeshBuffers(vertices, uvs, quad_indices(len(vertices) // 4), source_faces, keys)
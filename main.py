@@ -17,20 +17,30 @@ Gelişmiş 3D voxel tabanlı sandbox oyunu
 from ursina import *
 import ursina
 from ursina.prefabs.first_person_controller import FirstPersonController
-from perlin_noise import PerlinNoise
 import random
-import threading
+import numpy as np
 import math
 import time
 from collections import deque
+from functools import partial
 import os
+import atexit
 import heapq
+import tracemalloc
 import platform
 from datetime import datetime
 import ctypes
 import psutil
 import importlib.metadata
 from ursina.lights import DirectionalLight
+from voxel_world import VoxelWorld, MIN_Y, MAX_Y, WORLD_HEIGHT, NEIGHBOR_OFFSETS
+from terrain_cache import TerrainCache
+from world_save import load_or_create_seed
+from terrain_gen import TerrainGenerator, ChunkGenerationQueue, generate_chunks, benchmark_workers
+from mesh_workers import create_mesh_pool, benchmark_mesh_workers, MeshUploadQueue
+from chunk_mesher import ChunkMesher, face_keys, quad_indices, ROW_STRIDE, TILE_BIAS, PADDING_U, PADDING_V, ATLAS_UV_HEIGHT
+from mesh_patch import PatchableMesh, EditLatencyStats, upload_mesh, upload_patch, rebuild_from_patch, read_mesh, elapsed_since
+from block_registry import BlockRegistry, FACE_COUNT
 
 # Çökmeyi önlemek için bounds güncellemelerini durdur
 DirectionalLight.update_bounds = lambda self: None
@@ -56,7 +66,10 @@ mouse.visible = False  # Fare imleci gizli (FPS oyunları için - kamera kontrol
 
 # Sahne Ayarları
 # BGR değişimine karşı güvenli olması ve daha temiz görünmesi için beyaz sis
-scene.fog_density = (20, 60) 
+view_distance = 8 # Görüş mesafesi (chunk halkası); yakın halkalar tam mesh, uzaklar LOD yüzeyi
+lod_full_radius = 3 # Bu halkaya kadar chunk'lar tam meshlenir ve görünür; ötesini LOD yüzeyleri çizer
+clear_fog_density = (20, view_distance * 16) # Açık havada sis (başlangıç, bitiş)
+scene.fog_density = clear_fog_density
 scene.fog_color = color.white 
 
 # Sky ayarları - hata payını azaltmak için sadeleştirildi
@@ -817,7 +830,7 @@ class SimpleRainSystem:
         self.rain_particles.clear()
         
         # Atmosfer efektlerini sıfırla
-        scene.fog_density = (20, 60)
+        scene.fog_density = clear_fog_density
         
         print("[YAĞMUR] Yağmur durdu!")
     
@@ -1022,6 +1035,7 @@ day_night_cycle = EnhancedDayNightCycle()
 
 # Kaplamaları Yükle - Her bloğun özellikleri: kaplama, temel kırma süresi (saniye), tercih edilen alet
 # tercih_edilen_alet: None = el yeterli, 'pickaxe' (kazma), 'shovel' (kürek), 'axe' (balta)
+# drop: Kırılınca düşen eşya (belirtilmezse bloğun kendisi)
 # Alet hız çarpanı: Doğru aletle 3 kat daha hızlı
 blocks = {
     'grass':   {'texture': 'assets/textures/blocks/grass',   'color': color.white, 'base_break_time': 0.6,  'preferred_tool': 'shovel',  'is_passable': False},
@@ -1032,9 +1046,9 @@ blocks = {
     'leaves':  {'texture': 'assets/textures/blocks/leaves',  'color': color.white, 'base_break_time': 0.1,  'preferred_tool': None,    'is_passable': True}, 
     'crafting_table': {'texture': 'assets/textures/blocks/crafting_table', 'color': color.white, 'base_break_time': 2.5, 'preferred_tool': 'axe', 'is_passable': False},
     'log':     {'texture': 'assets/textures/blocks/log',     'color': color.white, 'base_break_time': 2.0,  'preferred_tool': 'axe',     'is_passable': False},
-    'coal_ore':    {'texture': 'assets/textures/blocks/coal_ore',    'color': color.white, 'base_break_time': 3.0,  'preferred_tool': 'pickaxe', 'is_passable': False},
-    'iron_ore':    {'texture': 'assets/textures/blocks/iron_ore',    'color': color.white, 'base_break_time': 4.0,  'preferred_tool': 'pickaxe', 'is_passable': False},
-    'diamond_ore': {'texture': 'assets/textures/blocks/diamond_ore', 'color': color.white, 'base_break_time': 6.0,  'preferred_tool': 'pickaxe', 'is_passable': False},
+    'coal_ore':    {'texture': 'assets/textures/blocks/coal_ore',    'color': color.white, 'base_break_time': 3.0,  'preferred_tool': 'pickaxe', 'is_passable': False, 'drop': 'coal'},
+    'iron_ore':    {'texture': 'assets/textures/blocks/iron_ore',    'color': color.white, 'base_break_time': 4.0,  'preferred_tool': 'pickaxe', 'is_passable': False, 'drop': 'iron_ingot'},
+    'diamond_ore': {'texture': 'assets/textures/blocks/diamond_ore', 'color': color.white, 'base_break_time': 6.0,  'preferred_tool': 'pickaxe', 'is_passable': False, 'drop': 'diamond'},
     'wool':        {'texture': 'assets/textures/blocks/wool',        'color': color.white, 'base_break_time': 0.8,  'preferred_tool': 'shears',  'is_passable': False},
 }
 
@@ -1093,6 +1107,9 @@ items['diamond'] = {'texture': 'assets/textures/items/diamond', 'type': 'materia
 items['wool'] = {'texture': 'assets/textures/blocks/wool', 'type': 'block'}
 items['shears'] = {'texture': 'assets/textures/items/shears', 'type': 'tool', 'damage': 10, 'effective_blocks': ['leaves']}
 
+# Tamsayı ID kayıt defteri (Sıcak yollar string yerine dizi indeksler)
+registry = BlockRegistry(blocks, tools, items)
+
 # Madencilik mantığı için global değişkenler
 mining_progress = 0
 target_block = None
@@ -1301,35 +1318,8 @@ def play_block_sound(sound_type, volume=1.0):
 
 def get_break_time(block_type, held_item):
     """Blok ve tutulan alete göre gerçek kırma süresini hesapla"""
-    if block_type not in blocks:
-        return 0.5
-    
-    base_time = blocks[block_type]['base_break_time']
-    
-    # Kırılamaz bloklar
-    if base_time < 0:
-        return float('inf')
-    
-    preferred = blocks[block_type]['preferred_tool']
-    
-    # Tutulan öğenin doğru alet olup olmadığını kontrol et
-    if held_item in tools:
-        if preferred and preferred in held_item:
-            # Alet seviyesine göre hız çarpanı ekleyelim
-            multiplier = 3.0
-            if 'diamond' in held_item: multiplier = 8.0
-            elif 'iron' in held_item: multiplier = 5.0
-            elif 'stone' in held_item: multiplier = 3.0
-            
-            return base_time / multiplier  
-        else:
-            return base_time  # Alet ama yanlış tür
-    else:
-        # Bir blok veya çıplak el kullanılıyor
-        if preferred:
-            return base_time * 1.5  # Uygun alet olmadan daha yavaş
-        else:
-            return base_time
+    # Alet seviyesi, doğru alet ve kırılamaz blok kuralları registry'de önceden hesaplandı
+    return registry.get_break_time(registry.id_of(block_type), registry.id_of(held_item))
 
 # El Animasyon Sınıfı
 class Hand(Entity):
@@ -2201,7 +2191,12 @@ class PlayerStats:
             print(f'[MADENCİLİK] {self.total_blocks_mined} blok kırıldı!')
 
 # Optimizasyon: Dünya verilerini görsel varlıklardan ayrı sakla
-world_data = {}   # Blok tiplerini saklar: {(x,y,z): 'grass'}
+# Bloklar chunk başına sabit boyutlu NumPy dizilerinde tutulur (bkz. voxel_world.py)
+# Depolama modu: 'full' tüm blokları saklar, 'overlay' araziyi üreteçten yeniden
+# hesaplar ve sadece düzenlemeleri saklar (bellek düzenleme sayısıyla büyür;
+# uzak chunk'lar sıkıştırılmak yerine bırakılır ve dokunulunca ana iş parçacığında yeniden üretilir)
+world_storage_mode = 'full'
+world_data = VoxelWorld(registry, storage_mode=world_storage_mode)
 world_voxels = {} # Not used in chunk system, keeping for reference if needed or can be removed
 
 # --- YAPRAK ÇÜRÜME SİSTEMİ ---
@@ -2223,7 +2218,7 @@ leaves_pending_set = set() # O(1) arama için set
 def is_leaf_supported(x, y, z):
     """Yaprağın yakınında (mesafe 4) odun olup olmadığını kontrol eder (Yüksek performanslı arama)"""
     for dx, dy, dz in LEAF_OFFSETS:
-        if world_data.get((x + dx, y + dy, z + dz)) == 'log':
+        if world_data.get_block(x + dx, y + dy, z + dz) == 'log':
             return True
     return False
 
@@ -2237,7 +2232,7 @@ def check_for_leaf_decay(pos):
                 if dx == 0 and dy == 0 and dz == 0: continue
                 nx, ny, nz = x + dx, y + dy, z + dz
                 
-                if (nx, ny, nz) not in leaves_pending_set and world_data.get((nx, ny, nz)) == 'leaves':
+                if (nx, ny, nz) not in leaves_pending_set and world_data.get_block(nx, ny, nz) == 'leaves':
                     leaves_pending_set.add((nx, ny, nz))
                     delay = random.uniform(0.5, 3.2)
                     heapq.heappush(leaves_to_decay, (curr_t + delay, nx, ny, nz))
@@ -2388,12 +2383,11 @@ class DroppedItem(Entity):
         # Pozisyon güncelle
         new_pos = self.position + self.velocity * time.dt
         
-        # Zemin kontrolü
+        # Zemin kontrolü (Sütun yükseklik haritasından)
         ground_y = -10  # Varsayılan
-        for check_y in range(int(new_pos.y), -15, -1):
-            if (int(new_pos.x), check_y, int(new_pos.z)) in world_data:
-                ground_y = check_y + 1.2
-                break
+        floor_block = world_data.block_below(int(new_pos.x), int(new_pos.y), int(new_pos.z))
+        if floor_block is not None:
+            ground_y = floor_block + 1.2
         
         if new_pos.y <= ground_y:
             new_pos.y = ground_y
@@ -2499,20 +2493,18 @@ class ThrownEgg(Entity):
         
         # 1. Blok çarpışma kontrolü (duvar/tavan)
         bx, by, bz = int(next_pos.x), int(next_pos.y), int(next_pos.z)
-        if (bx, by, bz) in world_data:
+        if world_data.has_block(bx, by, bz):
             hit = True
             hit_pos = Vec3(bx + 0.5, by + 0.5, bz + 0.5)
         
-        # 2. Zemin kontrolü (aşağıdan yukarı tara)
+        # 2. Zemin kontrolü (Sütun yükseklik haritasından)
         ground_y = -15
-        for check_y in range(int(next_pos.y), -16, -1):
-            check_x, check_z = int(next_pos.x), int(next_pos.z)
-            if (check_x, check_y, check_z) in world_data:
-                ground_y = check_y + 1
-                if next_pos.y <= ground_y + 0.1:  # Zemine çok yakınsa
-                    hit = True
-                    hit_pos = Vec3(next_pos.x, ground_y, next_pos.z)
-                break
+        floor_block = world_data.block_below(int(next_pos.x), int(next_pos.y), int(next_pos.z))
+        if floor_block is not None:
+            ground_y = floor_block + 1
+            if next_pos.y <= ground_y + 0.1:  # Zemine çok yakınsa
+                hit = True
+                hit_pos = Vec3(next_pos.x, ground_y, next_pos.z)
         
         # Pozisyonu güncelle
         if not hit:
@@ -3319,12 +3311,10 @@ class Animal(Entity):
                  self.state_timer = 0
                  # Çimen yeme: Altındaki blok çimense toprağa çevir
                  bx, by, bz = int(self.x), int(self.y - 0.5), int(self.z)
-                 if world_data.get((bx, by, bz)) == 'grass':
-                    world_data[(bx, by, bz)] = 'dirt'
-                    # Chunk'ı güncelle (Basitçe en yakın chunk'ı bul ve tetikle)
-                    cx, cz = bx // chunk_size, bz // chunk_size
-                    if (cx, cz) in chunks:
-                        chunks[(cx, cz)].generate_mesh()
+                 if world_data.get_block(bx, by, bz) == 'grass':
+                    world_data.set_block(bx, by, bz, 'dirt')
+                    # Sadece değişen bloğun yüzlerini yamala
+                    update_block(bx, by, bz)
                     # Efekt
                     spawn_particles(Vec3(bx, by+1, bz), 'grass')
                     self.on_eat_grass()
@@ -3437,14 +3427,12 @@ class Animal(Entity):
             
             # 1 blok yüksekliğinde engel varsa ve üstü boşsa zıpla
             is_blocked = False
-            if (ax, ay, az) in world_data:
-                b = world_data[(ax, ay, az)]
-                if not blocks.get(b, {}).get('is_passable', False):
-                    is_blocked = True
+            if registry.solid[world_data.get_id(ax, ay, az)]:
+                is_blocked = True
             
             if is_blocked and self.grounded:
                 # Üstü boş mu?
-                if (ax, ay+1, az) not in world_data:
+                if not world_data.has_block(ax, ay+1, az):
                     self.velocity.y = 6.5 # Zıpla!
             
             if not is_blocked or self.velocity.y > 0:
@@ -3467,9 +3455,8 @@ class Animal(Entity):
             bx = int(next_x + (r if tx > 0 else -r))
             can_move = True
             for dy in [0, 1]:
-                if (bx, int(self.y + dy), int(self.z)) in world_data:
-                    if not blocks.get(world_data[(bx, int(self.y + dy), int(self.z))], {}).get('is_passable', False):
-                        can_move = False; break
+                if registry.solid[world_data.get_id(bx, int(self.y + dy), int(self.z))]:
+                    can_move = False; break
             if can_move: self.x = next_x; moved_x = True
         
         # Z
@@ -3478,9 +3465,8 @@ class Animal(Entity):
             bz = int(next_z + (r if tz > 0 else -r))
             can_move = True
             for dy in [0, 1]:
-                if (int(self.x), int(self.y + dy), bz) in world_data:
-                    if not blocks.get(world_data[(int(self.x), int(self.y + dy), bz)], {}).get('is_passable', False):
-                        can_move = False; break
+                if registry.solid[world_data.get_id(int(self.x), int(self.y + dy), bz)]:
+                    can_move = False; break
             if can_move: self.z = next_z; moved_z = True
 
         # Fizik
@@ -3491,12 +3477,10 @@ class Animal(Entity):
         self.grounded = False
         bx, bz = int(self.x), int(self.z)
         floor_y = -15
-        for y_check in range(int(self.y + 0.1), -16, -1):
-            if (bx, y_check, bz) in world_data:
-                b_type = world_data[(bx, y_check, bz)]
-                if not blocks.get(b_type, {}).get('is_passable', False):
-                    floor_y = y_check + 1.0
-                    self.grounded = True; break
+        floor_block = world_data.block_below(bx, int(self.y + 0.1), bz, solid=True)
+        if floor_block is not None:
+            floor_y = floor_block + 1.0
+            self.grounded = True
         
         if self.y <= floor_y:
             self.y = floor_y; self.velocity.y = 0
@@ -4164,81 +4148,92 @@ class Chicken(Animal):
         else:
             self.speed = 2.0 if self.state != 'fleeing' else 4.0
 
+def spawn_chunk_animals(cx, cz):
+    """Chunk'ın hayvanlarını yerleştirir (chunk RNG'si ile, tohuma göre deterministik)"""
+    animal_types = (Cow, Sheep, Pig, Chicken)
+    spawned = 0
+    for kind, spawn_x, spawn_z in terrain.populate(cx, cz, len(animal_types)):
+        # Zemin yüksekliğini bul (Sütun yükseklik haritasından)
+        top = world_data.top_block_y(spawn_x, spawn_z)
+        animal_types[kind](Vec3(spawn_x, top + 1 if top is not None else 0, spawn_z))
+        spawned += 1
+    return spawned
+
 def spawn_animals_in_world():
     """Dünyaya hayvanları yerleştirir"""
-    for _ in range(12): # İnekler
-        spawn_x = random.randint(15, scale - 15)
-        spawn_z = random.randint(15, scale - 15)
-        # Zemin yüksekliğini bul
-        ground_y = 0
-        for y in range(40, -10, -1):
-            if (spawn_x, y, spawn_z) in world_data:
-                ground_y = y + 1; break
-        Cow(Vec3(spawn_x, ground_y, spawn_z))
-
-    for _ in range(12): # Koyunlar
-        spawn_x = random.randint(15, scale - 15)
-        spawn_z = random.randint(15, scale - 15)
-        ground_y = 0
-        for y in range(40, -10, -1):
-            if (spawn_x, y, spawn_z) in world_data:
-                ground_y = y + 1; break
-        Sheep(Vec3(spawn_x, ground_y, spawn_z))
-    
-    for _ in range(12): # Domuzlar
-        spawn_x = random.randint(15, scale - 15)
-        spawn_z = random.randint(15, scale - 15)
-        ground_y = 0
-        for y in range(40, -10, -1):
-            if (spawn_x, y, spawn_z) in world_data:
-                ground_y = y + 1; break
-        Pig(Vec3(spawn_x, ground_y, spawn_z))
-    
-    for _ in range(12): # Tavuklar
-        spawn_x = random.randint(15, scale - 15)
-        spawn_z = random.randint(15, scale - 15)
-        ground_y = 0
-        for y in range(40, -10, -1):
-            if (spawn_x, y, spawn_z) in world_data:
-                ground_y = y + 1; break
-        Chicken(Vec3(spawn_x, ground_y, spawn_z))
-    
-    print("[HAYVANLAR] Çiftlik hayatı güçlendirildi: 48 canlı eklendi!")
+    spawned = sum(spawn_chunk_animals(cx, cz) for cx, cz in world_data.chunk_keys())
+    print(f"[HAYVANLAR] Çiftlik hayatı güçlendirildi: {spawned} canlı eklendi!")
 
 # Arazi Oluşturma
-noise = PerlinNoise(octaves=2, seed=random.randint(1, 10000)) # Daha az oktav = daha pürüzsüz
-scale = 256 # Dünya boyutu 256x256 olarak güncellendi
-
-def generate_tree_data(x, y, z):
-    # Sadece world_data'ya yazmak için yardımcı
-    # Gövde
-    for i in range(1, 5):
-        world_data[(x, y + i, z)] = 'log'
-    
-    # Yapraklar
-    for lx in range(-2, 3):
-        for lz in range(-2, 3):
-            if abs(lx) == 2 and abs(lz) == 2: continue
-            world_data[(x + lx, y + 5, z + lz)] = 'leaves'
-            world_data[(x + lx, y + 6, z + lz)] = 'leaves'
-            
-    for lx in range(-1, 2):
-        for lz in range(-1, 2):
-            if abs(lx) == 1 and abs(lz) == 1: continue 
-            world_data[(x + lx, y + 7, z + lz)] = 'leaves'
-            
-    world_data[(x, y + 8, z)] = 'leaves'
-
-# Doku Atlası Eşleşmesi
-block_uvs = {
-    'grass': 5/6,  
-    'stone': 4/6,
-    'dirt': 3/6,
-    'wood': 2/6,
-    'bedrock': 1/6,
-    'leaves': 0/6
+# Dünya tohumu: aynı tohum = aynı dünya (None = dünya kaydındaki tohum, kayıt yoksa rastgele seç ve kaydet)
+world_seed = None
+world_save_dir = 'saves/world' # Dünya kaydı (tohum); önbellekten ayrı, silinirse yeni dünya başlar
+if world_seed is None:
+    world_seed, new_seed = load_or_create_seed(world_save_dir, lambda: random.randint(1, 10000))
+    print(f"[DÜNYA] Tohum: {world_seed} ({'yeni, kaydedildi' if new_seed else 'kayıtlı'})")
+else:
+    print(f"[DÜNYA] Tohum: {world_seed}")
+scale = 256 # Başlangıç noktası (scale // 2); dünya sınırsız, chunk'lar oyuncu yaklaştıkça üretilir
+# Vektörel NumPy üreteci (bkz. terrain_gen.py)
+terrain = TerrainGenerator(world_seed, registry)
+# Arazi üretimi ve mesh işçileri aynı anda çalışır; ikisi tek çekirdek bütçesini paylaşır (ana döngüye bir çekirdek kalır)
+worker_cores = max(2, (os.cpu_count() or 1) - 1) # Arka plan işçilerine ayrılan toplam çekirdek
+generation_workers = max(1, worker_cores // 2) # Arazi üretim süreçleri (1 = tek çekirdek)
+generation_benchmark = False # True: başlangıçta 1..N çekirdek hızlanmasını ölç ve yazdır
+generation_radius = lod_full_radius + 1 # Verisi üretilen chunk yarıçapı (meshler tam mesh halkasına kadar, +1 komşu dolgusu için)
+spawn_area_radius = 2 # Oyun başlamadan senkron üretilen alan (chunk)
+generation_per_frame = 2 # Kare başına dünyaya eklenen chunk sayısı
+generation_trace_memory = False # True: başlangıç alanında aşama bellek farklarını ölç (tracemalloc, yavaş)
+terrain_cache_dir = 'cache/terrain' # Üretilen chunk'ların disk önbelleği (None = kapalı)
+terrain_cache_prune_other_worlds = False # True: diğer tohumların önbellek klasörlerini de sil (disk alanı)
+if terrain_cache_dir:
+    terrain.cache = TerrainCache(terrain_cache_dir, world_seed, terrain.version, terrain_cache_prune_other_worlds)
+    if terrain.cache.invalidated:
+        print(f"[ÖNBELLEK] Üreteç değişti, {terrain.cache.invalidated} eski önbellek silindi")
+
+# Vektörel mesher ayarı (chunk_mesher, mesh işçilerinde çalışır)
+greedy_meshing = False # True: aynı düzlem/dokudaki yüzler tek dörtgende birleşir (daha az üçgen ve collider)
+
+# Greedy mesh'lerde birleşik dörtgen atlas satırını karo karo tekrarlar (UV kodlaması: chunk_mesher)
+greedy_chunk_shader = Shader(name='greedy_chunk_shader', language=Shader.GLSL, vertex='''#version 140
+uniform mat4 p3d_ModelViewProjectionMatrix;
+uniform mat4 p3d_ModelViewMatrix;
+in vec4 p3d_Vertex;
+in vec2 p3d_MultiTexCoord0;
+out vec2 tile_uv;
+out vec3 view_pos;
+
+void main() {
+    gl_Position = p3d_ModelViewProjectionMatrix * p3d_Vertex;
+    view_pos = (p3d_ModelViewMatrix * p3d_Vertex).xyz;
+    tile_uv = p3d_MultiTexCoord0;
 }
-uv_height = 1.0 / 6.0
+''', fragment=f'''#version 140
+uniform sampler2D p3d_Texture0;
+uniform vec4 p3d_ColorScale;
+uniform struct {{ vec4 ambient; }} p3d_LightModel;
+uniform struct {{ vec4 color; vec4 position; }} p3d_LightSource[1];
+uniform struct {{ vec4 color; float start; float end; }} p3d_Fog;
+in vec2 tile_uv;
+in vec3 view_pos;
+out vec4 fragColor;
+
+void main() {{
+    float row = floor(tile_uv.y / {ROW_STRIDE:.1f});
+    vec2 tile = fract(vec2(tile_uv.x, tile_uv.y - row * {ROW_STRIDE:.1f} - {TILE_BIAS:.1f}));
+    vec2 uv = vec2({PADDING_U} + tile.x * {1 - 2 * PADDING_U},
+                   1.0 - (row + 1.0) * {ATLAS_UV_HEIGHT} + {PADDING_V} + tile.y * {ATLAS_UV_HEIGHT - 2 * PADDING_V});
+    vec4 color = texture(p3d_Texture0, uv) * p3d_ColorScale;
+    // Ortam + güneş (yüz normali ekran türevlerinden)
+    vec3 normal = normalize(cross(dFdx(view_pos), dFdy(view_pos)));
+    float sun = max(dot(normal, normalize(p3d_LightSource[0].position.xyz)), 0.0);
+    color.rgb *= min(p3d_LightModel.ambient.rgb + p3d_LightSource[0].color.rgb * sun, vec3(1.0));
+    // Doğrusal sis (scene.fog_density = (başlangıç, bitiş))
+    float fog = clamp((length(view_pos) - p3d_Fog.start) / max(p3d_Fog.end - p3d_Fog.start, 0.001), 0.0, 1.0);
+    color.rgb = mix(color.rgb, p3d_Fog.color.rgb, fog);
+    fragColor = color;
+}}
+''')
 
 # Chunk Sistemi
 chunk_size = 16
@@ -4247,17 +4242,35 @@ chunks = {} # {(cx, cz): Chunk}
 # Dünya hiyerarşisi (Passable blokların oyuncuya takılmaması için)
 solid_world = Entity()
 passable_world = Entity()
+lod_world = Entity() # Uzak chunk'ların LOD yüzeyleri (collider'sız)
+region_world = Entity() # Uzak mesh'lerin birleştirildiği bölgeler (collider'sız)
+
+# Mesh işçi havuzu (Sonuçlar ana iş parçacığında update() içinde uygulanır)
+mesh_workers = max(1, worker_cores - generation_workers) # Sabit mesh işçisi sayısı (bütçenin kalanı)
+mesh_use_processes = True # True: işçi süreçler + paylaşımlı bellek (GIL'siz), False: iş parçacıkları
+mesh_benchmark = False # True: başlangıçta 1..N süreç mesh hızlanmasını ölç ve yazdır
+mesh_upload_budget_ms = 4.0 # Kare başına mesh yüklemeye ayrılan süre (en az bir mesh yüklenir)
+mesh_pool = create_mesh_pool(registry, mesh_workers, processes=mesh_use_processes)
+mesh_uploads = MeshUploadQueue() # Biten mesh'ler burada bekler, öncelik sırasıyla yüklenir
 
-# Threading için Kuyruk (Ana iş parçacığında mesh güncellemek için)
-# (chunk_ref, vertices, uvs, p_verts, p_uvs)
-mesh_callback_queue = deque()
+# Tek blok düzenlemeleri: etkilenen yüzler mesh'e yerinde yamanır (mesh_patch, greedy modda tam yeniden meshleme)
+local_mesher = ChunkMesher(registry) # Ana iş parçacığında yama ve LOD yüzeyleri için
+edit_latency = EditLatencyStats() # Düzenlemeden görünür mesh'e gecikme
 
 class Chunk(Entity):
     def __init__(self, cx, cz):
         super().__init__(parent=solid_world, model=Mesh(), texture='assets/textures/blocks/atlas.png', collider='mesh')
         self.cx = cx
         self.cz = cz
-        self.is_generating = False
+        self.is_generating = False # Havuzda bu chunk'ın bir mesh işi var
+        self.mesh_version = 0 # Düzenleme sürümü: her mesh isteğinde artar
+        self.applied_version = 0 # Ekrandaki mesh'in üretildiği sürüm
+        self.triangle_counts = (0, 0) # (birleştirme öncesi, mesh'teki) - chunk debugger için
+        self.has_mesh = False # Mesh en az bir kez yüklendi
+        # Mesh verisi sadece GeomVertexData'da durur; CPU'da dörtgen başına yalnız yüz anahtarı kalır
+        self.mesh_keys = None # (solid, passable) yüz anahtarları, GPU'daki dörtgen sırasıyla (greedy'de None)
+        self.patches = None # İlk yamada GPU verisinden kurulan (solid, passable) PatchableMesh
+        self.edit_time = None # Yeniden meshleme bekleyen ilk düzenlemenin zamanı
         
         # Keskin pikseller için filtreleme
         if self.texture:
@@ -4278,202 +4291,189 @@ class Chunk(Entity):
             self.passable_entity.texture.repeat = False
             self.passable_entity.texture.repeat = False
         
+        if greedy_meshing:
+            self.shader = greedy_chunk_shader
+            self.passable_entity.shader = greedy_chunk_shader
+        
         self.generate_mesh()
 
-    def generate_mesh(self):
+    def generate_mesh(self, edit_time=None):
+        # Her istek sürümü artırır; iş sürerken gelen istekler iş bitince tek bir yeniden meshlemede birleşir
+        self.mesh_version += 1
+        if edit_time is not None and self.edit_time is None:
+            self.edit_time = edit_time
         if self.is_generating:
+            mesh_pool.stats.coalesced += 1
             return
+        self.submit_mesh_job()
+
+    def submit_mesh_job(self):
         self.is_generating = True
-        
-        # Arka planda hesaplama yap
-        t = threading.Thread(target=self.calculate_mesh_bg)
-        t.start()
-        
-    def calculate_mesh_bg(self):
-        # Mesh verilerini arka planda hesapla
-        verts = []
-        uvs = []
-        p_verts = [] # Passable vertices
-        p_uvs = []   # Passable uvs
-        
-        start_x = self.cx * chunk_size
-        end_x = start_x + chunk_size
-        start_z = self.cz * chunk_size
-        end_z = start_z + chunk_size
-        
-        try:
-            for x in range(start_x, end_x):
-                for z in range(start_z, end_z):
-                    for y in range(-10, 40): 
-                        if (x, y, z) in world_data:
-                            block = world_data[(x, y, z)]
-                            # Passable kontrolü
-                            is_p = blocks.get(block, {}).get('is_passable', False)
-                            if is_p:
-                                self.add_face_data(x, y, z, block, p_verts, p_uvs)
-                            else:
-                                self.add_face_data(x, y, z, block, verts, uvs)
-            
-            # Sonuçları kuyruğa ekle
-            mesh_callback_queue.append((self, verts, uvs, p_verts, p_uvs))
-            
-        except Exception as e:
-            print(f"Chunk Oluşturma Hatası: {e}")
-            self.is_generating = False
+        # Arka planda hesaplama yap (Komşu dilimleriyle dolgulu dizi, mesh havuzunun kuyruğuna)
+        mesh_pool.submit((self, self.mesh_version), partial(world_data.padded_chunk_array, self.cx, self.cz),
+                         self.cx * chunk_size, self.cz * chunk_size, greedy_meshing)
 
-    def assign_mesh(self, verts, uvs, p_verts, p_uvs):
-        # Ana iş parçacığında çalışır
-        
-        # Katı bloklar
-        self.model.vertices = verts
-        self.model.uvs = uvs
-        self.model.generate()
-        self.collider = 'mesh' 
+    def finish_mesh_job(self, version, mesh_data):
+        # Ana iş parçacığında çalışır (mesh_data None = hatalı iş)
+        self.is_generating = False
+        if mesh_data is not None and version > self.applied_version:
+            # Eski sürümden üretilmiş olsa da ekrandakinden yenidir
+            self.assign_mesh(*mesh_data)
+            self.applied_version = version
+        if self.mesh_version > version:
+            # İş sürerken düzenleme geldi: güncel veriyle yeniden meshle
+            mesh_pool.stats.stale += 1
+            self.submit_mesh_job()
+        elif self.edit_time is not None:
+            edit_latency.record('remesh', elapsed_since(self.edit_time))
+            self.edit_time = None
+
+    def assign_mesh(self, solid, passable):
+        # Ana iş parçacığında çalışır (solid/passable: chunk_mesher.MeshBuffers)
+        self.triangle_counts = (solid.source_triangle_count + passable.source_triangle_count,
+                                solid.triangle_count + passable.triangle_count)
+        self.mesh_keys = None if solid.keys is None else (solid.keys, passable.keys)
+        self.patches = None
+        self.has_mesh = True
+        
+        # Katı bloklar (İndeksli mesh: dörtgen başına 4 köşe + 6 indeks, listeye çevrilmeden yazılır)
+        upload_mesh(self, solid.vertices, solid.uvs, solid.indices)
         
         # Geçilebilir bloklar
-        self.passable_entity.model.vertices = p_verts
-        self.passable_entity.model.uvs = p_uvs
-        self.passable_entity.model.generate()
-        self.passable_entity.collider = 'mesh'
-        
-        self.is_generating = False
+        upload_mesh(self.passable_entity, passable.vertices, passable.uvs, passable.indices)
+        mark_region_changed('chunk', (self.cx, self.cz))
+
+    def mesh_arrays(self):
+        """Ekrandaki (katı, geçilebilir) mesh'lerin (köşe, UV) dizileri - bölge birleştirme için"""
+        if self.patches is not None:
+            return [(patch.vertices[:patch.count].reshape(-1, 3), patch.uvs[:patch.count].reshape(-1, 2))
+                    for patch in self.patches]
+        return [read_mesh(self), read_mesh(self.passable_entity)]
+
+    def release_patches(self):
+        """Yama dizilerini bırakır (etkileşim halkasından çıkınca); mesh GPU verisinde güncel"""
+        if self.patches is not None:
+            self.mesh_keys = tuple(patch.quad_keys() for patch in self.patches)
+            self.patches = None
+
+    def patch_cells(self, cells):
+        """
+        Hücrelerin tüm yüzlerini mesh'ten çıkarıp güncel bloklarla yeniden ekler.
+
+        Args:
+            cells: Bu chunk'taki dünya koordinatları [(x, y, z), ...]
+        Returns:
+            False ise yama yapılamaz (greedy mod, mesh işi sürüyor veya mesh
+            yok); çağıran generate_mesh() ile yeniden meshlemelidir.
+        """
+        if greedy_meshing or self.is_generating or self.applied_version != self.mesh_version:
+            return False
+        if self.patches is None:
+            if self.mesh_keys is None:
+                return False
+            self.patches = tuple(PatchableMesh(*read_mesh(entity), keys)
+                                 for entity, keys in zip((self, self.passable_entity), self.mesh_keys))
+            self.mesh_keys = None
+
+        ox, oz = self.cx * chunk_size, self.cz * chunk_size
+        xs = np.array([x - ox for x, _, _ in cells])
+        ys = np.array([y - MIN_Y for _, y, _ in cells])
+        zs = np.array([z - oz for _, _, z in cells])
+        ids = [world_data.get_id(x, y, z) for x, y, z in cells]
+        neighbors = [[world_data.get_id(x + dx, y + dy, z + dz) for dx, dy, dz in NEIGHBOR_OFFSETS]
+                     for x, y, z in cells]
+
+        # Blok katı <-> geçilebilir değişmiş olabilir: eski yüzler iki mesh'ten de çıkar
+        old_keys = face_keys(xs[:, None], ys[:, None], zs[:, None], np.arange(FACE_COUNT)).ravel().tolist()
+        quads = local_mesher.cell_quads(xs, ys, zs, ids, neighbors, ox, oz)
+        for entity, patch, (keys, vertices, uvs) in zip((self, self.passable_entity), self.patches, quads):
+            patch.remove(old_keys)
+            patch.add(keys, vertices, uvs)
+            if not upload_patch(entity, patch):
+                rebuild_from_patch(entity, patch)
+        triangles = sum(patch.count for patch in self.patches) * 2
+        self.triangle_counts = (triangles, triangles)
+        mark_region_changed('chunk', (self.cx, self.cz))
+        return True
     
     def on_destroy(self):
+        # Başlamamış mesh işlerini iptal et (sonuçları zaten uygulanmaz)
+        mesh_pool.cancel(lambda job: job[0] is self)
+        mesh_uploads.cancel(lambda job: job[0] is self)
         if hasattr(self, 'passable_entity'):
             destroy(self.passable_entity)
             
-    def add_face_data(self, x, y, z, block_type, verts, uvs):
-        # Blok adını indeksle eşle (Atlas sırası ile AYNI olmalı)
-        mapping = [
-            'grass',          # 0: Side
-            'grass_top',      # 1: Top
-            'dirt',           # 2: Dirt
-            'stone',          # 3: Stone
-            'wood',           # 4: Wood planks
-            'log',            # 5: Side
-            'log_top',        # 6: Top
-            'leaves',         # 7: Leaves
-            'bedrock',        # 8: Bedrock
-            'crafting_table', # 9: Crafting Table Side
-            'crafting_table_top', # 10: Crafting Table Top
-            'crafting_table_front', # 11: Crafting Table Front
-            'coal_ore',       # 12: Coal
-            'iron_ore',       # 13: Iron
-            'diamond_ore',    # 14: Diamond
-            'wool'            # 15: Wool
-        ]
-        
-        uv_height = 1.0 / len(mapping) 
-        
-        def get_texture_idx(b_type, face_dir):
-            if b_type == 'grass':
-                if face_dir == 'top': return 1 
-                if face_dir == 'bottom': return 2
-                return 0 
-            if b_type == 'log':
-                if face_dir == 'top' or face_dir == 'bottom': return 6
-                return 5
-            if b_type == 'crafting_table':
-                if face_dir == 'top': return 10
-                if face_dir == 'bottom': return 4 
-                # Tüm yan yüzlerde (ön, arka, sağ, sol) aletlerin olduğu dokuyu (front) kullan
-                return 11 
-            if b_type in mapping:
-                return mapping.index(b_type)
-            return 0
-
-        padding_v = 0.005
-        padding_u = 0.02
-        # Yan Yüzler için genel UV hesaplama fonksiyonu
-        def add_face_verts(v0, v1, v2, v3, face_dir):
-            idx = get_texture_idx(block_type, face_dir)
-            row = idx
-            
-            # V koordinatları (Y ekseni) - Atlasta yukarıdan aşağıya
-            v_max = 1.0 - (row * uv_height) - padding_v
-            v_min = 1.0 - ((row + 1) * uv_height) + padding_v
-            
-            # U koordinatları (X ekseni)
-            u_min = 0.0 + padding_u
-            u_max = 1.0 - padding_u
-            
-            uv0 = (u_min, v_max) # Top Left
-            uv1 = (u_max, v_max) # Top Right
-            uv2 = (u_max, v_min) # Bottom Right
-            uv3 = (u_min, v_min) # Bottom Left
-            
-            # Triangles: (v2, v1, v0) and (v0, v3, v2)
-            # v0=BL, v1=TL, v2=TR, v3=BR
-            verts.extend([v2, v1, v0, v0, v3, v2])
-            uvs.extend([uv1, uv0, uv3, uv3, uv2, uv1])
-
-        def should_draw_face(nx, ny, nz):
-            if (nx, ny, nz) not in world_data:
-                return True
-            neighbor = world_data[(nx, ny, nz)]
-            self_is_p = blocks.get(block_type, {}).get('is_passable', False)
-            neighbor_is_p = blocks.get(neighbor, {}).get('is_passable', False)
-            if self_is_p:
-                if neighbor == block_type: return False 
-                return True 
-            if neighbor_is_p:
-                return True
-            return False
-
-        # Üst Yüz (y+1)
-        if should_draw_face(x, y+1, z):
-            add_face_verts((x,y+1,z+1), (x+1,y+1,z+1), (x+1,y+1,z), (x,y+1,z), 'top')
-            
-        # Alt Yüz (y-1)
-        if should_draw_face(x, y-1, z):
-            add_face_verts((x,y,z), (x+1,y,z), (x+1,y,z+1), (x,y,z+1), 'bottom')
-            
-        # Sağ Yüz (x+1)
-        if should_draw_face(x+1, y, z):
-            add_face_verts((x+1, y, z), (x+1, y+1, z), (x+1, y+1, z+1), (x+1, y, z+1), 'side')
-            
-        # Sol Yüz (x-1)
-        if should_draw_face(x-1, y, z):
-            add_face_verts((x, y, z+1), (x, y+1, z+1), (x, y+1, z), (x, y, z), 'side')
-            
-        # Ön Yüz (z+1)
-        if should_draw_face(x, y, z+1):
-            add_face_verts((x+1, y, z+1), (x+1, y+1, z+1), (x, y+1, z+1), (x, y, z+1), 'front')
-            
-        # Arka Yüz (z-1)
-        if should_draw_face(x, y, z-1):
-            add_face_verts((x, y, z), (x, y+1, z), (x+1, y+1, z), (x+1, y, z), 'back')
+def mesh_upload_priority(job):
+    """
+    Mesh yükleme sırası (küçük önce). Oyuncunun chunk'ında (veya bitişiğinde)
+    düzenleme yüzünden bekleyen yeniden meshlemeler her zaman önce gelir;
+    diğerleri uzaklığa göre sıralanır, kameranın arkasındakiler iki kat uzak sayılır.
+    """
+    chunk = job[0]
+    p_pos = player.position
+    pcx, pcz = int(p_pos.x // chunk_size), int(p_pos.z // chunk_size)
+    if chunk.edit_time is not None and max(abs(chunk.cx - pcx), abs(chunk.cz - pcz)) <= 1:
+        return (0, chunk.edit_time)
+
+    dx = chunk.cx * chunk_size + chunk_size / 2 - p_pos.x
+    dz = chunk.cz * chunk_size + chunk_size / 2 - p_pos.z
+    distance = math.hypot(dx, dz)
+    # Kamera yönüyle açı (yatay düzlemde): önde 1, yanda 1.5, arkada 2 kat
+    fx, fz = camera.forward.x, camera.forward.z
+    forward_len = math.hypot(fx, fz)
+    facing = (fx * dx + fz * dz) / (forward_len * distance) if forward_len > 1e-6 and distance > 1e-6 else 1.0
+    return (1, distance * (1.5 - 0.5 * facing))
+
+def apply_mesh_result(job, mesh_data):
+    chunk, version = job
+    # Bu arada kaldırılan chunk'ların sonuçlarını atla
+    if chunks.get((chunk.cx, chunk.cz)) is chunk:
+        chunk.finish_mesh_job(version, mesh_data)
 
 # Yerleştirme/Kırma Mantığını Yeniden Uygula
-def update_chunk(x, z):
-    cx, cz = int(x // chunk_size), int(z // chunk_size)
-    if (cx, cz) in chunks:
-        chunks[(cx, cz)].generate_mesh()
-    # Komşuları güncelle
-    if x % chunk_size == 0 and (cx-1, cz) in chunks: chunks[(cx-1, cz)].generate_mesh()
-    if x % chunk_size == chunk_size-1 and (cx+1, cz) in chunks: chunks[(cx+1, cz)].generate_mesh()
-    if z % chunk_size == 0 and (cx, cz-1) in chunks: chunks[(cx, cz-1)].generate_mesh()
-    if z % chunk_size == chunk_size-1 and (cx, cz+1) in chunks: chunks[(cx, cz+1)].generate_mesh()
+def update_block(x, y, z):
+    """
+    Tek blok düzenlemesinden sonra bloğun ve 6 komşusunun yüzlerini günceller.
+    Hücreler chunk'lara göre gruplanır (sınırdaki komşu chunk'lar dahil); her
+    chunk mesh'i yerinde yamanır, yamanamayan chunk baştan meshlenir.
+    """
+    start = time.perf_counter()
+    cells_by_chunk = {}
+    for dx, dy, dz in ((0, 0, 0),) + NEIGHBOR_OFFSETS:
+        nx, ny, nz = x + dx, y + dy, z + dz
+        if MIN_Y <= ny < MAX_Y:
+            cells_by_chunk.setdefault((nx // chunk_size, nz // chunk_size), []).append((nx, ny, nz))
+
+    patched = True
+    for key, cells in cells_by_chunk.items():
+        chunk = chunks.get(key)
+        if chunk is None:
+            continue
+        if not chunk.patch_cells(cells):
+            chunk.generate_mesh(edit_time=start)
+            patched = False
+    if patched:
+        edit_latency.record('patch', elapsed_since(start))
+    invalidate_lod(x // chunk_size, z // chunk_size, x, z)
 
 def place_block_logic(pos, block_type):
     x, y, z = int(pos.x), int(pos.y), int(pos.z)
-    world_data[(x, y, z)] = block_type
-    update_chunk(x, z)
+    # Dikey dünya sınırlarının dışına blok konulamaz
+    if not world_data.set_block(x, y, z, block_type):
+        return False
+    update_block(x, y, z)
     play_block_sound('place')
+    return True
 
 def break_block_logic(pos):
     x, y, z = int(pos.x), int(pos.y), int(pos.z)
-    if (x,y,z) in world_data:
-        block_type = world_data[(x,y,z)]  # Bloğun tipini al
-        del world_data[(x,y,z)]
-        update_chunk(x, z)
+    block_type = world_data.remove_block(x, y, z)  # Bloğun tipini al ve sil
+    if block_type is not None:
+        update_block(x, y, z)
         play_block_sound('break')
         
         # Düşen item oluştur (doğrudan envantere ekleme)
-        drop_item = block_type
-        if block_type == 'coal_ore': drop_item = 'coal'
-        elif block_type == 'iron_ore': drop_item = 'iron_ingot'
-        elif block_type == 'diamond_ore': drop_item = 'diamond'
+        drop_item = registry.get_drop(registry.id_of(block_type))
         
         # print(f'Eşya düşürüldü: {drop_item} Konum: {pos}')
         spawn_dropped_item(Vec3(x + 0.5, y + 0.2, z + 0.5), drop_item)
@@ -4515,7 +4515,7 @@ def vein_mine_logic(pos, block_type):
         idx += 1
         
         c_tuple = (int(curr.x), int(curr.y), int(curr.z))
-        if world_data.get(c_tuple) == block_type:
+        if world_data.get_block(*c_tuple) == block_type:
             to_break.append(curr)
             
             for move in directions:
@@ -4539,20 +4539,14 @@ def vein_mine_logic(pos, block_type):
         b_pos = to_break[index]
         bx, by, bz = int(b_pos.x), int(b_pos.y), int(b_pos.z)
         
-        if (bx, by, bz) in world_data:
-            bt = world_data[(bx, by, bz)]
-            
-            # Dünyadan sil
-            del world_data[(bx, by, bz)]
-            
+        # Dünyadan sil
+        bt = world_data.remove_block(bx, by, bz)
+        if bt is not None:
             # Efektler
             spawn_particles(Vec3(bx+0.5, by+0.5, bz+0.5), bt)
             
             # Item düşür
-            drop_item = bt
-            if bt == 'coal_ore': drop_item = 'coal'
-            elif bt == 'iron_ore': drop_item = 'iron_ingot'
-            elif bt == 'diamond_ore': drop_item = 'diamond'
+            drop_item = registry.get_drop(registry.id_of(bt))
             spawn_dropped_item(Vec3(bx + 0.5, by + 0.2, bz + 0.5), drop_item)
             
             # Ses (Giderek tizleşen/değişen ses efekti)
@@ -4564,7 +4558,7 @@ def vein_mine_logic(pos, block_type):
             check_for_leaf_decay(b_pos)
             
             # Chunk ve Mesh güncelleme
-            update_chunk(bx, bz)
+            update_block(bx, by, bz)
             
             # Ek Açlık Maliyeti
             if 'player_stats' in globals():
@@ -4579,19 +4573,21 @@ def vein_mine_logic(pos, block_type):
 
 # Dünya Meshini Oluştur
 def generate_world_mesh():
+    global startup_mesh_start
     print("Dünya Meshi Arka Planda Oluşturuluyor...")
     
-    # Chunkları tanımla
-    active_chunks = set()
-    for (x,y,z) in world_data.keys():
-        cx = x // chunk_size
-        cz = z // chunk_size
-        active_chunks.add((cx, cz))
+    if mesh_benchmark:
+        # 1..N süreç hızlanma eğrisi (başlangıç alanının tüm chunk'ları)
+        padded = [world_data.padded_chunk_array(cx, cz) for cx, cz in world_data.chunk_keys()]
+        for workers, seconds, speedup in benchmark_mesh_workers(registry, padded, mesh_workers, greedy_meshing):
+            print(f"[MESH] {workers} çekirdek: {seconds:.2f} sn ({speedup:.2f}x)")
     
-    # Chunk nesnelerini oluştur (Thread içinde mesh hesaplayacaklar)
-    for (cx, cz) in active_chunks:
-        if (cx, cz) not in chunks:
-            chunks[(cx, cz)] = Chunk(cx, cz)
+    # Chunk nesnelerini oluştur (Komşu verisi hazır olanlar, mesh havuzunda hesaplanacaklar)
+    startup_mesh_start = time.perf_counter()
+    for (cx, cz) in world_data.chunk_keys():
+        mesh_chunk_if_ready(cx, cz)
+
+startup_mesh_start = None # Başlangıç meshleri bitince süresi yazdırılır
 
 # Culling (Gizleme) Mantığı
 def cull_chunks():
@@ -4599,8 +4595,8 @@ def cull_chunks():
     p_pos = player.position
     p_forward = player.forward
     
-    # Culling mesafesi (örneğin 3 chunk = 48 birim)
-    cull_dist_sq = (chunk_size * 3) ** 2
+    # Tam mesh halkası (ötesini LOD yüzeyleri çizer, bkz. update_lod)
+    pcx, pcz = int(p_pos.x // chunk_size), int(p_pos.z // chunk_size)
     
     for (cx, cz), chunk in chunks.items():
         # Chunk merkezini bul (yaklaşık)
@@ -4609,13 +4605,20 @@ def cull_chunks():
         # Mesafeyi kontrol et (Kare alma işlemi kök almaktan hızlıdır)
         dist_sq = (chunk_center.x - p_pos.x)**2 + (chunk_center.z - p_pos.z)**2
         
-        if dist_sq > cull_dist_sq:
+        region = regions.get(region_of(cx, cz))
+        ring = max(abs(cx - pcx), abs(cz - pcz))
+        if ring > interaction_radius:
+            chunk.release_patches() # Düzenleme halkası dışında yama dizileri tutulmaz
+        if ring > lod_full_radius or (ring > interaction_radius and region is not None and ('chunk', (cx, cz)) in region.members):
+            # LOD halkası veya bölge düğümü çiziyor (etkileşim halkasındaki chunk üyelikten bağımsız görünür ve çarpışır)
             chunk.enabled = False
+            chunk.passable_entity.enabled = False
         else:
             # Mesafe yakınsa, arkada mı diye bak
             # Oyuncunun çok yakınındaysa (örn 1 chunk) her zaman göster
             if dist_sq < (chunk_size * 1.5) ** 2:
                 chunk.enabled = True
+                chunk.passable_entity.enabled = True
             else:
                 # Görüş açısı kontrolü (Dot Product)
                 to_chunk = (chunk_center - p_pos).normalized()
@@ -4630,48 +4633,358 @@ def cull_chunks():
                      chunk.enabled = True
                      chunk.passable_entity.enabled = True
 
+# --- UZAK CHUNK LOD YÜZEYLERİ ---
+# Tam mesh halkasının dışı, voxel verisi yerine sütun yükseklik haritasından seyreltilmiş yüzeylerle çizilir
+lod_rings = ((5, 2), (view_distance, 4)) # (son halka, sütun örnekleme adımı): yakındakiler 2x, uzaktakiler 4x
+lod_builds_per_frame = 4 # Kare başına kurulan LOD yüzeyi
+lod_chunks = {} # {(cx, cz): LodChunk}
+lod_keys = [] # Son merkez için [(anahtar, adım)], yakından uzağa
+last_lod_center = None
+lod_grass = registry.id_of('grass')
+lod_leaves = registry.id_of('leaves')
+
+def lod_columns(x0, z0, size):
+    """
+    Bölgenin sütun yükseklikleri ve üst blokları (size x size).
+    Verisi yüklü chunk'larda yükseklik haritası (düzenlemeler dahil, sıkıştırılmış
+    olsa da bellekte), diğerlerinde üretecin yüzey gürültüsü kullanılır.
+    """
+    heights = terrain.surface_heights(x0, z0, size, size)
+    ids = np.full((size, size), lod_grass, dtype=np.uint8)
+    for cx in range(x0 // chunk_size, (x0 + size - 1) // chunk_size + 1):
+        for cz in range(z0 // chunk_size, (z0 + size - 1) // chunk_size + 1):
+            data = world_data.get_chunk(cx, cz)
+            if data is None:
+                continue
+            # Bölge ile chunk'ın kesişimi (bölge ve chunk-yerel dilimler)
+            ax, bx = max(x0, cx * chunk_size), min(x0 + size, (cx + 1) * chunk_size)
+            az, bz = max(z0, cz * chunk_size), min(z0 + size, (cz + 1) * chunk_size)
+            region = (slice(ax - x0, bx - x0), slice(az - z0, bz - z0))
+            local = (slice(ax - cx * chunk_size, bx - cx * chunk_size), slice(az - cz * chunk_size, bz - cz * chunk_size))
+            top_any, top_solid = data.top_any[local], data.top_solid[local]
+            heights[region] = top_any
+            # Katı olmayan üst blok (ağaç tepesi) yaprak, gerisi çimen sayılır
+            ids[region] = np.where(top_any > top_solid, lod_leaves, lod_grass)
+    return heights, ids
+
+class LodChunk(Entity):
+    """Uzak chunk'ın yükseklik haritası yüzeyi (collider'sız, karo UV'li)"""
+    def __init__(self, cx, cz):
+        super().__init__(parent=lod_world, model=Mesh(), texture='assets/textures/blocks/atlas.png',
+                         shader=greedy_chunk_shader)
+        if self.texture:
+            self.texture.filtering = 'nearest'
+        self.cx = cx
+        self.cz = cz
+        self.state = None # (adım, veri yüklü mü): değişince yeniden kurulur
+        self.has_surface = False # Yüzey kuruldu (bölge birleştirme verisi GeomVertexData'dan okunur)
+        self.triangle_count = 0
+
+    def rebuild(self, step, has_data):
+        x0, z0 = self.cx * chunk_size, self.cz * chunk_size
+        heights, ids = lod_columns(x0 - step, z0 - step, chunk_size + 2 * step)
+        surface = local_mesher.surface_lod(heights, ids[step:-step, step:-step], x0, z0, step)
+        upload_mesh(self, surface.vertices, surface.uvs, surface.indices, collider=False)
+        self.has_surface = True
+        self.triangle_count = surface.triangle_count
+        self.state = (step, has_data)
+        mark_region_changed('lod', (self.cx, self.cz))
+
+def invalidate_lod(cx, cz, x=None, z=None):
+    """
+    Chunk'ın verisi değişti: LOD yüzeyi (ve yükseklik dolgusu chunk'a uzanan
+    komşu yüzeyler) update_lod'da yeniden kurulur. x, z verilirse sadece dolgusu
+    o sütunu kapsayan komşular işaretlenir.
+    """
+    for dx in (-1, 0, 1):
+        for dz in (-1, 0, 1):
+            lod = lod_chunks.get((cx + dx, cz + dz))
+            if lod is None or lod.state is None:
+                continue
+            if x is not None and (dx or dz):
+                step = lod.state[0]
+                x0, z0 = lod.cx * chunk_size, lod.cz * chunk_size
+                if not (x0 - step <= x < x0 + chunk_size + step and z0 - step <= z < z0 + chunk_size + step):
+                    continue
+            lod.state = None
+
+def update_lod():
+    """Görüş mesafesindeki uzak halkalara LOD yüzeyi kurar (kare başına sınırlı), menzil dışındakileri kaldırır"""
+    global last_lod_center, lod_keys
+    center = (int(player.x // chunk_size), int(player.z // chunk_size))
+    if center != last_lod_center:
+        last_lod_center = center
+        lod_keys = []
+        for key in chunk_keys_around(*center, view_distance):
+            ring = max(abs(key[0] - center[0]), abs(key[1] - center[1]))
+            if ring > lod_full_radius:
+                lod_keys.append((key, next(step for last, step in lod_rings if ring <= last)))
+        wanted = {key for key, _ in lod_keys}
+        for key in [k for k in lod_chunks if k not in wanted]:
+            destroy(lod_chunks.pop(key))
+
+    built = 0
+    for key, step in lod_keys:
+        state = (step, world_data.has_chunk(*key))
+        lod = lod_chunks.get(key)
+        if lod is not None and lod.state == state:
+            continue
+        if lod is None:
+            lod = lod_chunks[key] = LodChunk(*key)
+        lod.rebuild(*state)
+        built += 1
+        if built >= lod_builds_per_frame:
+            break
+
+# --- BÖLGE BİRLEŞTİRME ---
+# Etkileşim halkasının dışındaki chunk mesh'leri ve LOD yüzeyleri region_size x region_size chunk'lık
+# bölgelerde birleştirilir: bölge başına katman (katı, geçilebilir, LOD) başına tek düğüm ve çizim çağrısı
+interaction_radius = 1 # Bu halkaya kadar chunk'lar ayrı düğüm kalır (düzenlemeler anında yamanır)
+region_size = 4 # Bölge kenarı (chunk)
+region_merges_per_frame = 1 # Kare başına yeniden birleştirilen bölge
+regions = {} # {(rx, rz): ChunkRegion}
+last_region_center = None
+
+def region_of(cx, cz):
+    return (cx // region_size, cz // region_size)
+
+def is_region_member(kind, key, center):
+    """kind 'chunk': tam mesh'li ve etkileşim halkası ile LOD halkası arasında; 'lod': kurulmuş LOD yüzeyi"""
+    if kind == 'lod':
+        lod = lod_chunks.get(key)
+        return lod is not None and lod.has_surface
+    chunk = chunks.get(key)
+    ring = max(abs(key[0] - center[0]), abs(key[1] - center[1]))
+    return chunk is not None and chunk.has_mesh and interaction_radius < ring <= lod_full_radius
+
+def mark_region_changed(kind, key):
+    """Üyenin mesh'i değişti: bölgesi (üyeyse veya üye olacaksa) yeniden birleştirilir"""
+    region = regions.get(region_of(*key))
+    if region is not None and ((kind, key) in region.members or is_region_member(kind, key, last_region_center)):
+        region.dirty = True
+
+class ChunkRegion(Entity):
+    """Bölgedeki uzak mesh'lerin birleşimi (collider'sız); üyelerin kendi düğümleri gizlenir"""
+    def __init__(self, rx, rz):
+        super().__init__(parent=region_world)
+        self.rx = rx
+        self.rz = rz
+        atlas = 'assets/textures/blocks/atlas.png'
+        self.solid_layer = Entity(parent=self, model=Mesh(), texture=atlas)
+        self.passable_layer = Entity(parent=self, model=Mesh(), texture=atlas, transparent=True, double_sided=True)
+        self.lod_layer = Entity(parent=self, model=Mesh(), texture=atlas, shader=greedy_chunk_shader)
+        if greedy_meshing:
+            self.solid_layer.shader = greedy_chunk_shader
+            self.passable_layer.shader = greedy_chunk_shader
+        for layer in (self.solid_layer, self.passable_layer, self.lod_layer):
+            if layer.texture:
+                layer.texture.filtering = 'nearest'
+                layer.texture.repeat = False
+        self.members = frozenset() # Birleşik geometrideki (tür, chunk anahtarı) üyeleri
+        self.dirty = True
+        self.merge_count = 0
+
+    def chunk_keys(self):
+        return [(self.rx * region_size + dx, self.rz * region_size + dz)
+                for dx in range(region_size) for dz in range(region_size)]
+
+    def wanted_members(self, center):
+        return frozenset((kind, key) for key in self.chunk_keys() for kind in ('chunk', 'lod')
+                         if is_region_member(kind, key, center))
+
+    def merge(self, center):
+        members = self.wanted_members(center)
+        layers = ([], [], [])  # Katı, geçilebilir, LOD (köşe, UV) parçaları
+        for kind, key in members:
+            if kind == 'chunk':
+                solid, passable = chunks[key].mesh_arrays()
+                layers[0].append(solid)
+                layers[1].append(passable)
+            else:
+                layers[2].append(read_mesh(lod_chunks[key]))
+        for layer, parts in zip((self.solid_layer, self.passable_layer, self.lod_layer), layers):
+            if parts:
+                vertices = np.concatenate([vertices for vertices, _ in parts])
+                uvs = np.concatenate([uvs for _, uvs in parts])
+            else:
+                vertices, uvs = np.zeros((0, 3), dtype=np.float32), np.zeros((0, 2), dtype=np.float32)
+            upload_mesh(layer, vertices, uvs, quad_indices(len(vertices) // 4), collider=False)
+        # LOD düğümleri burada gizlenir; chunk düğümlerini cull_chunks üyeliğe göre gizler
+        for kind, key in self.members | members:
+            if kind == 'lod' and key in lod_chunks:
+                lod_chunks[key].enabled = (kind, key) not in members
+        self.members = members
+        self.dirty = False
+        self.merge_count += 1
+
+def update_regions():
+    """Oyuncu chunk değiştirince bölge üyeliklerini yeniler, kirli bölgeleri yakından uzağa birleştirir"""
+    global last_region_center
+    center = (int(player.x // chunk_size), int(player.z // chunk_size))
+    if center != last_region_center:
+        last_region_center = center
+        low, high = region_of(center[0] - view_distance, center[1] - view_distance), region_of(center[0] + view_distance, center[1] + view_distance)
+        wanted = {(rx, rz) for rx in range(low[0], high[0] + 1) for rz in range(low[1], high[1] + 1)}
+        for key in [k for k in regions if k not in wanted]:
+            destroy(regions.pop(key))
+        for key in wanted:
+            region = regions.get(key)
+            if region is None:
+                regions[key] = ChunkRegion(*key)
+            elif region.wanted_members(center) != region.members:
+                region.dirty = True
+                if any(kind == 'chunk' and max(abs(k[0] - center[0]), abs(k[1] - center[1])) <= interaction_radius
+                       for kind, k in region.members):
+                    # Etkileşim halkasına giren chunk bölgeden hemen çıkarılır (aynı geometri iki kez çizilmesin)
+                    region.merge(center)
+
+    def distance(region):
+        return max(abs(region.rx * region_size + region_size / 2 - center[0]),
+                   abs(region.rz * region_size + region_size / 2 - center[1]))
+
+    for region in sorted((r for r in regions.values() if r.dirty), key=distance)[:region_merges_per_frame]:
+        region.merge(center)
+
+def world_draw_stats():
+    """Dünya geometrisi: (geom'lu etkin mesh düğümü, çizim çağrısı) - görüş konisi elemesi öncesi"""
+    nodes = calls = 0
+    for root in (solid_world, passable_world, lod_world, region_world):
+        # Devre dışı entity'ler (stash) aramaya girmez
+        for path in root.findAllMatches('**/+GeomNode'):
+            geoms = path.node().getNumGeoms()
+            if geoms:
+                nodes += 1
+                calls += geoms
+    return nodes, calls
+
+# Soğuk Depolama (Uzak chunk verilerini sıkıştır)
+cold_storage_distance = 6     # Bu kadar chunk uzaktaki veriler sıkıştırılır
+cold_storage_margin = 1       # Eşiğin bu kadar chunk ötesi beklenir (sınırda gidip gelmeyi önler)
+cold_storage_idle = 10.0      # Son erişimden bu kadar saniye geçmemiş chunk sıkıştırılmaz (uzak hayvanlar vb.)
+cold_storage_interval = 2.0   # Tarama aralığı (saniye)
+last_cold_storage_check = 0
+
+def compress_far_chunks():
+    global last_cold_storage_check
+    if time.time() - last_cold_storage_check < cold_storage_interval:
+        return
+    last_cold_storage_check = time.time()
+
+    pcx = int(player.x) // chunk_size
+    pcz = int(player.z) // chunk_size
+    compressed = 0
+    for (cx, cz) in world_data.chunk_keys():
+        if max(abs(cx - pcx), abs(cz - pcz)) < cold_storage_distance + cold_storage_margin:
+            continue
+        # Mesh thread'i bu chunk'ı veya komşu dilimlerini okuyorsa bekle
+        if any(chunks.get((cx + dx, cz + dz)) and chunks[(cx + dx, cz + dz)].is_generating
+               for dx, dz in ((0, 0), (1, 0), (-1, 0), (0, 1), (0, -1))):
+            continue
+        if world_data.compress_chunk(cx, cz, idle=cold_storage_idle):
+            compressed += 1
+
+    if compressed:
+        print(f"[SOĞUK DEPO] {compressed} chunk sıkıştırıldı | {world_data.cold_stats.summary()}")
+
 # Arazi Oluşturma (Katı dolguya sabitlendi)
+def chunk_keys_around(ccx, ccz, radius):
+    """Kare yarıçap içindeki chunk'lar, yakından uzağa sıralı"""
+    keys = [(ccx + dx, ccz + dz) for dx in range(-radius, radius + 1) for dz in range(-radius, radius + 1)]
+    keys.sort(key=lambda k: (k[0] - ccx) ** 2 + (k[1] - ccz) ** 2)
+    return keys
+
 def generate_terrain():
+    # Sadece başlangıç alanı senkron üretilir, gerisini update_chunk_generation doldurur
     print("Arazi Verileri Oluşturuluyor...")
-    bottom_level = -10 # Sabit ana kaya seviyesi
-    
-    for z in range(scale):
-        for x in range(scale):
-            # Pürüzsüz arazi - Daha geniş düzlükler için frekansı düşürdük
-            y = noise([x * 0.03, z * 0.03])
-            surface_y = math.floor(y * 8) # Tepeleri alçalt (Amplitude 10 -> 8)
-            
-            # Üstte çimen
-            world_data[(x, surface_y, z)] = 'grass'
-            
-            # Ağaç Şansı - Azaltıldı (0.015 -> 0.010)
-            if random.random() < 0.010 and 2 < x < scale - 2 and 2 < z < scale - 2:
-                generate_tree_data(x, surface_y, z)
-            
-            # Ana kayaya kadar doldur
-            for depth in range(surface_y - 1, bottom_level - 1, -1):
-                if depth >= surface_y - 3:
-                     world_data[(x, depth, z)] = 'dirt'
-                elif depth > bottom_level:
-                     # Ore spawning logic
-                     rand = random.random()
-                     if rand < 0.03: # %3 Coal
-                         world_data[(x, depth, z)] = 'coal_ore'
-                     elif rand < 0.045: # %1.5 Iron
-                         world_data[(x, depth, z)] = 'iron_ore'
-                     elif rand < 0.047 and depth < 0: # %0.2 Diamond (only deep)
-                         world_data[(x, depth, z)] = 'diamond_ore'
-                     else:
-                         world_data[(x, depth, z)] = 'stone'
-                else:
-                     world_data[(x, depth, z)] = 'bedrock'
-
-generate_terrain()
+    spawn_chunk = ((scale // 2) // chunk_size, (scale // 2) // chunk_size)
+    keys = chunk_keys_around(*spawn_chunk, spawn_area_radius)
+    
+    if generation_benchmark:
+        # 1..N çekirdek hızlanma eğrisi (sonuç verisi işçi sayısından bağımsızdır)
+        bench_keys = chunk_keys_around(*spawn_chunk, generation_radius)
+        for workers, seconds, speedup in benchmark_workers(terrain, bench_keys, generation_workers):
+            print(f"[ÜRETİM] {workers} çekirdek: {seconds:.2f} sn ({speedup:.2f}x)")
+        terrain.stage_stats.take() # Ölçüm aşama istatistiklerine karışmasın
+    
+    # Başlangıç alanı bu süreçte seri üretilir: küçük alan için süreç havuzu
+    # açmak (spawn + numpy içe aktarma) üretimin kendisinden çok daha pahalı.
+    # Havuz sadece arka plan üretiminde (ChunkGenerationQueue) kullanılır.
+    workers = 1
+    if generation_trace_memory:
+        tracemalloc.start()
+    
+    start = time.perf_counter()
+    for cx, cz, blocks in generate_chunks(terrain, keys, workers):
+        world_data.load_chunk(cx, cz, terrain.generate_chunk, blocks, terrain.structure_spill)
+        # Komşulara taşan ağaçlar (üretilmemiş komşular için kaynak kuyruğa alınır)
+        world_data.stamp_structure(terrain.structure_spill(cx, cz), (cx, cz))
+    
+    # Nüfus aşaması: hayvanları oluştur
+    spawn_animals_in_world()
+
+    elapsed = time.perf_counter() - start
+    if generation_trace_memory:
+        tracemalloc.stop()
+    
+    # Aşama raporu: süre, yazılan blok, bellek farkı
+    for line in terrain.stage_stats.report():
+        print(f"[AŞAMA] {line}")
+    if terrain.cache is not None:
+        # Tüm chunk'lar önbellekten geldiyse sıcak başlangıç
+        start_kind = "sıcak" if terrain.cache_misses == 0 else "soğuk"
+        print(f"[ÖNBELLEK] {start_kind} başlangıç: {terrain.cache_hits} isabet, {terrain.cache_misses} ıskalama, {elapsed * 1000:.0f} ms")
+    print(f"[DÜNYA] {len(world_data.chunks)} chunk {elapsed:.2f} sn'de üretildi ({workers} işçi), voxel belleği: {world_data.memory_bytes() / (1024 * 1024):.1f} MB (mod: {world_data.storage_mode})")
+
+# Arka plan üretim kuyruğu (başlangıç alanı dışındaki chunk'lar)
+chunk_generator = ChunkGenerationQueue(terrain, generation_workers)
+last_generation_center = None
+
+def mesh_chunk_if_ready(cx, cz):
+    # Dört komşusunun verisi hazır olan chunk meshlenir (kenar yüzleri sonradan değişmez)
+    if (cx, cz) in chunks or not world_data.has_chunk(cx, cz):
+        return
+    if all(world_data.has_chunk(cx + dx, cz + dz) for dx, dz in ((1, 0), (-1, 0), (0, 1), (0, -1))):
+        chunks[(cx, cz)] = Chunk(cx, cz)
+
+def update_chunk_generation():
+    """Oyuncu etrafındaki eksik chunk'ları ister, biten sonuçları dünyaya ekler"""
+    global last_generation_center
+    center = (int(player.x // chunk_size), int(player.z // chunk_size))
+    
+    def in_mesh_range(key):
+        # cull_chunks ile aynı halka: ötesindeki mesh'ler hiç çizilmezdi
+        return max(abs(key[0] - center[0]), abs(key[1] - center[1])) <= lod_full_radius
+    
+    if center != last_generation_center:
+        last_generation_center = center
+        around = chunk_keys_around(*center, generation_radius)
+        chunk_generator.request([key for key in around if not world_data.has_chunk(*key)])
+        for key in around:
+            if in_mesh_range(key):
+                mesh_chunk_if_ready(*key)
+        # Uzaktaki meshleri kaldır (veri world_data'da kalır, soğuk depoya gider)
+        for key in [k for k in chunks if max(abs(k[0] - center[0]), abs(k[1] - center[1])) > lod_full_radius + 1]:
+            destroy(chunks.pop(key))
+    
+    for cx, cz, blocks in chunk_generator.poll(generation_per_frame):
+        if world_data.has_chunk(cx, cz):
+            continue  # Bu arada yüklendi (düzenlemeleri ezme)
+        world_data.load_chunk(cx, cz, terrain.generate_chunk, blocks, terrain.structure_spill)
+        # Taşan yapılar meshlenmiş bir komşuyu (örn. çaprazdaki) ve dolgusu değişen komşularını değiştirebilir
+        for key in world_data.stamp_structure(terrain.structure_spill(cx, cz), (cx, cz)):
+            if key in chunks:
+                chunks[key].generate_mesh()
+            invalidate_lod(*key)
+        spawn_chunk_animals(cx, cz)
+        for dx, dz in ((0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)):
+            if in_mesh_range((cx + dx, cz + dz)):
+                mesh_chunk_if_ready(cx + dx, cz + dz)
+
+# Toplu yazma: chunk istatistikleri üretim sonunda tek seferde hesaplanır
+with world_data.bulk_edit():
+    generate_terrain()
 generate_world_mesh()
 
-# Hayvanları oluştur
-spawn_animals_in_world()
-
 # Oyuncu Kurulumu
 player = FirstPersonController()
 player.mouse_sensitivity = (40, 40)
@@ -4685,17 +4998,11 @@ def find_safe_spawn_position():
     spawn_x = scale // 2
     spawn_z = scale // 2
     
-    # Yukarıdan aşağıya tara, ilk katı bloğu bul
-    for y in range(60, 0, -1):
-        # Ayakların altındaki blok katı mı?
-        block_below = world_data.get((spawn_x, y - 1, spawn_z))
-        # Oyuncunun duracağı yer boş mu? (2 blok yükseklik)
-        block_at_feet = world_data.get((spawn_x, y, spawn_z))
-        block_at_head = world_data.get((spawn_x, y + 1, spawn_z))
-        
-        if block_below and block_below != 'air' and not block_at_feet and not block_at_head:
-            # Güvenli pozisyon bulundu: Katı zemin var, üstü boş
-            return Vec3(spawn_x + 0.5, y + 0.1, spawn_z + 0.5)
+    # Sütunun en üst bloğu zemindir; üstü her zaman boştur (2 blok yükseklik)
+    top = world_data.top_block_y(spawn_x, spawn_z)
+    if top is not None and 0 < top + 1 <= 60:
+        # Güvenli pozisyon bulundu: Katı zemin var, üstü boş
+        return Vec3(spawn_x + 0.5, top + 1.1, spawn_z + 0.5)
     
     # Güvenli pozisyon bulunamadıysa yüksekte spawn et
     return Vec3(spawn_x + 0.5, 50, spawn_z + 0.5)
@@ -5741,15 +6048,15 @@ class ChunkDebugger(Entity):
             else:
                 main_color = color.cyan if self.mode == 4 else color.rgba(255,255,255,100)
         else:
-            main_color = color.red if (cx, cz) in world_data else color.gray
+            main_color = color.red if world_data.has_chunk(cx, cz) else color.gray
 
         # 1. Wireframe Mode
         if self.mode == 1:
             v = Entity(
                 parent=self,
                 model='wireframe_cube',
-                scale=(chunk_size, 50, chunk_size),
-                position=(cx * chunk_size + chunk_size/2, 15, cz * chunk_size + chunk_size/2),
+                scale=(chunk_size, WORLD_HEIGHT, chunk_size),
+                position=(cx * chunk_size + chunk_size/2, MIN_Y + WORLD_HEIGHT/2, cz * chunk_size + chunk_size/2),
                 color=main_color,
                 always_on_top=True
             )
@@ -5760,9 +6067,9 @@ class ChunkDebugger(Entity):
             y_pos = player.y - 0.45
             # Zemin bul
             bx, bz = int(cx * chunk_size + 8), int(cz * chunk_size + 8)
-            for ty in range(int(player.y), -15, -1):
-                if (bx, ty, bz) in world_data:
-                    y_pos = ty + 1.05; break
+            floor_block = world_data.block_below(bx, int(player.y), bz)
+            if floor_block is not None:
+                y_pos = floor_block + 1.05
 
             v = Entity(
                 parent=self,
@@ -5780,8 +6087,8 @@ class ChunkDebugger(Entity):
                 v = Entity(
                     parent=self,
                     model='cube',
-                    scale=(chunk_size, 55, chunk_size),
-                    position=(cx * chunk_size + chunk_size/2, 15, cz * chunk_size + chunk_size/2),
+                    scale=(chunk_size, WORLD_HEIGHT + 5, chunk_size),
+                    position=(cx * chunk_size + chunk_size/2, MIN_Y + WORLD_HEIGHT/2, cz * chunk_size + chunk_size/2),
                     color=color.rgba(0, 255, 0, 40),
                     always_on_top=True
                 )
@@ -5834,19 +6141,24 @@ class ChunkDebugger(Entity):
         info += f"Coords: {cx}, {cz} (P: {int(player.x)}, {int(player.z)})\n"
         
         if chunk:
-            try:
-                tri_count = (len(chunk.model.vertices) + len(chunk.passable_entity.model.vertices)) // 3
-            except: tri_count = 0
+            source_tris, tri_count = chunk.triangle_counts
             
-            # Optimized block counting
-            block_count = sum(1 for (x,y,z) in world_data if x // chunk_size == cx and z // chunk_size == cz)
+            # Artımlı tutulan chunk istatistikleri (O(1))
+            stats = world_data.chunk_stats(cx, cz) or {'blocks': 0, 'exposed_faces': 0, 'counts': {}}
+            top_types = sorted(stats['counts'].items(), key=lambda kv: -kv[1])[:3]
             
             status = "LOADED"
             if chunk.is_generating: status = "<yellow>GENERATING</yellow>"
             elif not chunk.enabled: status = "<gray>CULLED</gray>"
             
-            info += f"Bloklar: {block_count}\n"
-            info += f"Üçgenler: {tri_count}\n"
+            info += f"Bloklar: {stats['blocks']}\n"
+            info += f"Açık Yüzler: {stats['exposed_faces']}\n"
+            info += "Türler: " + ", ".join(f"{name} {n}" for name, n in top_types) + "\n"
+            if source_tris != tri_count:
+                saved = 100 * (1 - tri_count / source_tris)
+                info += f"Üçgenler: {source_tris} -> {tri_count} (greedy, -%{saved:.0f})\n"
+            else:
+                info += f"Üçgenler: {tri_count}\n"
             info += f"Durum: {status}\n"
         else:
             info += "Durum: <red>BAŞLATILAMADI</red>\n"
@@ -6040,6 +6352,7 @@ class PerformanceMonitor(Entity):
         rain_sys = globals().get('rain_system')
         p_count = len(rain_sys.rain_particles) if rain_sys else 0
         total_e = len(animals_list) + len(items_list) + p_count
+        mesh_nodes, draw_calls = world_draw_stats()
         
         # Gösterge Paneli İçeriği
         info = [
@@ -6048,6 +6361,16 @@ class PerformanceMonitor(Entity):
             f"   RAM: {mem:.1f} MB",
             f"<scale:1.1> + Dünya Durumu</scale>",
             f"   CHUNK: {chunks_count} | VARLIK: {total_e}",
+            f"   TOHUM: {globals().get('world_seed')} | ÜRETİM KUYRUĞU: {chunk_generator.queue_depth} | YAPI KUYRUĞU: {len(world_data.pending_sources)}",
+            f"   AŞAMA (ms): {terrain.stage_stats.summary()}",
+            f"   MESH KUYRUĞU ({mesh_pool.backend}): {mesh_pool.queue_depth} (çalışan {mesh_pool.running}/{mesh_pool.workers}) | {mesh_pool.stats.summary()}",
+            f"   MESH YÜKLEME (bütçe {mesh_upload_budget_ms:.1f} ms): {mesh_uploads.summary()}",
+            f"   ÇİZİM: {draw_calls} çağrı | {mesh_nodes} mesh düğümü | {len(regions)} bölge ({region_size}x{region_size}, {sum(r.dirty for r in regions.values())} kirli)",
+            f"   LOD: {len(lod_chunks)} chunk | {sum(lod.triangle_count for lod in lod_chunks.values())} üçgen (tam mesh halkası {lod_full_radius}, görüş {view_distance})",
+            f"   DÜZENLEME → GÖRÜNÜR: {edit_latency.summary()}",
+            f"   BLOK: {world_data.total_blocks} | YÜZ: {world_data.total_exposed_faces}",
+            f"   SOĞUK DEPO: {world_data.cold_stats.summary()}",
+            f"   DÜZENLEME: {world_data.edit_count()} blok ({world_data.edit_save_bytes() / 1024:.1f} KB)",
             f"   Canli: {len(animals_list)} | Eşya: {len(items_list)}",
             f"<scale:1.1> + Navigasyon</scale>",
             f"   XYZ: {player.x:.1f}, {player.y:.1f}, {player.z:.1f}",
@@ -6843,8 +7166,11 @@ def get_player_damage(held_item):
 
 # Oyun Mantığı
 def update():
-    global current_block, mining_progress, target_block, last_action_time, current_held_item, step_timer, day_night_cycle, player_last_position
+    global current_block, mining_progress, target_block, last_action_time, current_held_item, step_timer, day_night_cycle, player_last_position, startup_mesh_start
     
+    # Voxel erişim saati (soğuk depo boşta kalma süresi buna göre ölçülür)
+    world_data.clock = time.time()
+
     # 0. Gece-Gündüz Döngüsü Güncelleme
     day_night_cycle.update(time.dt)
     
@@ -6902,7 +7228,7 @@ def update():
         target_t, lx, ly, lz = heapq.heappop(leaves_to_decay)
         leaves_pending_set.discard((lx, ly, lz))
         
-        if world_data.get((lx, ly, lz)) == 'leaves':
+        if world_data.get_block(lx, ly, lz) == 'leaves':
             if not is_leaf_supported(lx, ly, lz):
                 if random.random() < 0.2:
                     spawn_leaf_decay_particle(Vec3(lx+0.5, ly+0.5, lz+0.5))
@@ -6932,7 +7258,7 @@ def update():
         if step_timer >= step_freq:
             # Karakterin altındaki bloğu tespit et
             bx, by, bz = int(player.x), int(player.y - 1.1), int(player.z)
-            under = world_data.get((bx, by, bz))
+            under = world_data.get_block(bx, by, bz)
             
             vol = 0.6 if not is_sprinting else 0.8
             if is_sneaking: vol = 0.2 # Gizlice yürüme butonu
@@ -7143,8 +7469,8 @@ def update():
                 target_pos_vec = hit_point - hit_normal * 0.1
                 tx, ty, tz = math.floor(target_pos_vec.x), math.floor(target_pos_vec.y), math.floor(target_pos_vec.z)
                 
-                if (tx, ty, tz) in world_data:
-                    block_type = world_data[(tx, ty, tz)]
+                block_type = world_data.get_block(tx, ty, tz)
+                if block_type is not None:
                     required_break_time = get_break_time(block_type, current_held_item)
                     
                     if mining_progress == 0: target_block = (tx, ty, tz)
@@ -7194,7 +7520,7 @@ def update():
                     look_pos_vec = hit_point - hit_normal * 0.1
                     lx, ly, lz = math.floor(look_pos_vec.x), math.floor(look_pos_vec.y), math.floor(look_pos_vec.z)
                     
-                    if (lx, ly, lz) in world_data and world_data[(lx, ly, lz)] == 'crafting_table':
+                    if world_data.get_block(lx, ly, lz) == 'crafting_table':
                         crafting_system.open()
                         last_action_time = time.time()
                     # Yerleştirme
@@ -7207,8 +7533,8 @@ def update():
                         if not ((tx == p_bx and tz == p_bz and ty == p_by) or
                                 (tx == p_bx and tz == p_bz and ty == p_by + 1)):
                             hand_entity.swing()
-                            place_block_logic(Vec3(tx, ty, tz), current_block)
-                            inventory.use_selected_item()
+                            if place_block_logic(Vec3(tx, ty, tz), current_block):
+                                inventory.use_selected_item()
                             last_action_time = time.time()
         else:
             mining_progress = 0
@@ -7220,8 +7546,8 @@ def update():
         if 'selection_box' in globals():
             selection_box.enabled = False
     
-    if target_block and target_block in world_data:
-        block_type = world_data[target_block]
+    block_type = world_data.get_block(*target_block) if target_block else None
+    if block_type is not None:
         max_time = get_break_time(block_type, current_held_item)
         if max_time == float('inf'): max_time = 10
         mining_progress_bar.update_progress(mining_progress, max_time=max_time)
@@ -7232,14 +7558,19 @@ def update():
         mining_progress_bar.update_progress(0, max_time=0.25)
         block_indicator.enabled = False
 
-    processed_count = 0
-    while mesh_callback_queue and processed_count < 5:
-        chunk, verts, uvs, p_verts, p_uvs = mesh_callback_queue.popleft()
-        if chunk and chunk.enabled is not None:
-            chunk.assign_mesh(verts, uvs, p_verts, p_uvs)
-        processed_count += 1
+    # Biten mesh'ler öncelik kuyruğuna, kuyruktan süre bütçesi kadar yükleme
+    mesh_uploads.extend(mesh_pool.poll())
+    mesh_uploads.drain(mesh_upload_priority, apply_mesh_result, mesh_upload_budget_ms / 1000)
+    if startup_mesh_start is not None and not mesh_pool.queue_depth and not mesh_uploads:
+        print(f"[MESH] Başlangıç meshleri: {len(chunks)} chunk, {time.perf_counter() - startup_mesh_start:.2f} sn "
+              f"({mesh_pool.workers} {mesh_pool.backend})")
+        startup_mesh_start = None
         
+    update_chunk_generation()
     cull_chunks()
+    update_lod()
+    update_regions()
+    compress_far_chunks()
 
 # --- GENEL GİRİŞLER (INPUT) ---
 # ============================================
@@ -7738,4 +8069,9 @@ debug_overlay = PerformanceMonitor()
 chunk_visualizer = ChunkDebugger()
 item_name_display = ItemNameDisplay()
 
+# ursina sys.exit ile çıkar (app.run() sonrası çalışmaz): işçi süreçler ve
+# paylaşımlı bellek çıkışta atexit ile kapatılır
+atexit.register(mesh_pool.shutdown)
+atexit.register(chunk_generator.shutdown)
+
 app.run()
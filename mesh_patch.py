@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""
+PyCraft Mesh Yükleme ve Artımlı Mesh Yaması
+Mesher'ın float32/uint32 tamponları Python listesine çevrilmeden memoryview
+ile doğrudan Panda3D GeomVertexData ve indeks dizilerine yazılır; mesh
+collider da aynı dizilerden kurulur (upload_mesh).
+
+Tek blok düzenlemelerinde chunk'ı baştan meshlemek yerine sadece etkilenen
+yüzleri (bloğun ve 6 komşusunun yüzleri) çıkarıp ekler.
+
+Yamalanan chunk mesh'i (katı / geçilebilir) için CPU tarafında dörtgen dizileri
+ve yüz indeksi {yüz anahtarı: dörtgen yuvası} tutulur; diziler ilk yamada
+GeomVertexData'dan okunur (read_mesh), düzenleme bitince bırakılabilir. Silinen dörtgenin yerine
+son dörtgen taşınır (yuvalar sıkışık kalır, indeks tamponu değişmez desenli
+kalır). Değişen yuvalar Panda3D GeomVertexData / indeks dizilerine yerinde
+yazılır, collider'daki üçgen çiftleri de aynı yuvalarda güncellenir.
+Sadece normal (greedy olmayan) mesh'ler yamanabilir.
+"""
+
+import time
+
+import numpy as np
+from panda3d.core import (CollisionPolygon, Geom, GeomTriangles, GeomVertexArrayFormat, GeomVertexData,
+                          GeomVertexFormat, Point3)
+from ursina.collider import Collider
+
+from chunk_mesher import quad_indices
+
+
+def _vertex_format():
+    # ursina Mesh ile aynı düzen: 0 = köşe (3f), 1 = doku koordinatı (2f)
+    vertex_format = GeomVertexFormat()
+    vertex_format.addArray(GeomVertexFormat.getV3().arrays[0])
+    vertex_format.addArray(GeomVertexArrayFormat('texcoord', 2, Geom.NT_float32, Geom.C_texcoord))
+    return GeomVertexFormat.registerFormat(vertex_format)
+
+
+VERTEX_FORMAT = _vertex_format()
+
+
+class PatchableMesh:
+    """Tek mesh'in dörtgen dizileri + yüz indeksi"""
+
+    def __init__(self, vertices, uvs, keys):
+        count = len(keys)
+        capacity = max(16, count + count // 4)
+        self.vertices = np.zeros((capacity, 4, 3), dtype=np.float32)
+        self.uvs = np.zeros((capacity, 4, 2), dtype=np.float32)
+        self.keys = np.zeros(capacity, dtype=np.int64)
+        self.vertices[:count] = vertices.reshape(-1, 4, 3)
+        self.uvs[:count] = uvs.reshape(-1, 4, 2)
+        self.keys[:count] = keys
+        self.count = count
+        self.index = {key: slot for slot, key in enumerate(self.keys[:count].tolist())}
+        # Son yüklemeden beri değişen yuvalar ve o andaki dörtgen sayısı
+        self.dirty = set()
+        self.uploaded_count = count
+
+    def remove(self, keys):
+        for key in keys:
+            slot = self.index.pop(key, None)
+            if slot is None:
+                continue
+            last = self.count - 1
+            if slot != last:
+                # Son dörtgeni boşalan yuvaya taşı
+                moved = int(self.keys[last])
+                self.vertices[slot] = self.vertices[last]
+                self.uvs[slot] = self.uvs[last]
+                self.keys[slot] = moved
+                self.index[moved] = slot
+                self.dirty.add(slot)
+            self.count = last
+
+    def add(self, keys, vertices, uvs):
+        needed = self.count + len(keys)
+        if needed > len(self.keys):
+            self._grow(needed)
+        for key, quad_vertices, quad_uvs in zip(keys.tolist(), vertices, uvs):
+            slot = self.count
+            self.vertices[slot] = quad_vertices
+            self.uvs[slot] = quad_uvs
+            self.keys[slot] = key
+            self.index[key] = slot
+            self.dirty.add(slot)
+            self.count += 1
+
+    def _grow(self, needed):
+        capacity = max(needed, len(self.keys) * 2)
+        for name in ('vertices', 'uvs', 'keys'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def quad_keys(self):
+        """Mesh'teki dörtgen sırasıyla yüz anahtarları (kopya)"""
+        return self.keys[:self.count].copy()
+
+    def take_dirty(self):
+        """Yüklenmesi gereken yuvalar (sıralı) ve önceki dörtgen sayısı"""
+        slots = np.array(sorted(slot for slot in self.dirty if slot < self.count), dtype=np.intp)
+        old_count = self.uploaded_count
+        self.dirty.clear()
+        self.uploaded_count = self.count
+        return slots, old_count
+
+
+def _array_view(array_data, dtype):
+    return np.frombuffer(memoryview(array_data).cast('B'), dtype=dtype)
+
+
+def upload_mesh(entity, vertices, uvs, indices, collider=True):
+    """
+    Düz tamponları entity'nin mesh'ine ve (collider=True ise) mesh collider'ına yazar.
+
+    model.vertices / model.uvs listeleri doldurulmaz; veri tek kopya olarak
+    GeomVertexData'da durur.
+
+    Args:
+        vertices (4N, 3), uvs (4N, 2) float32; indices (6N,) uint32 (quad_indices düzeni)
+    """
+    model = entity.model
+    usage = Geom.UHStatic if model.static else Geom.UHDynamic
+    model.generate()  # Eski geom'ları temizler (listeler boş: yeni geom kurulmaz)
+    if len(vertices):
+        vdata = GeomVertexData('vertex_data', VERTEX_FORMAT, usage)
+        vdata.uncleanSetNumRows(len(vertices))
+        _array_view(vdata.modifyArray(0), np.float32)[:] = vertices.ravel()
+        _array_view(vdata.modifyArray(1), np.float32)[:] = uvs.ravel()
+        triangles = GeomTriangles(usage)
+        triangles.setIndexType(Geom.NT_uint32)
+        index_array = triangles.modifyVertices()
+        index_array.uncleanSetNumRows(len(indices))
+        _array_view(index_array, np.uint32)[:] = indices
+        geom = Geom(vdata)
+        geom.addPrimitive(triangles)
+        model.geomNode.addGeom(geom)
+    if collider:
+        entity.collider = Collider(entity, _collision_polygons(vertices.reshape(-1, 4, 3)))
+
+
+def read_mesh(entity):
+    """
+    Entity mesh'inin köşe (4N, 3) ve UV (4N, 2) dizilerinin kopyası.
+
+    Mesh verisinin tek kalıcı kopyası GeomVertexData'dadır; yama ve bölge
+    birleştirme için gerektiğinde buradan okunur.
+    """
+    geom_node = getattr(entity.model, 'geomNode', None)
+    if geom_node is None or geom_node.getNumGeoms() == 0:
+        return np.zeros((0, 3), dtype=np.float32), np.zeros((0, 2), dtype=np.float32)
+    vdata = geom_node.getGeom(0).getVertexData()
+    vertices = _array_view(vdata.getArray(0), np.float32).reshape(-1, 3).copy()
+    uvs = _array_view(vdata.getArray(1), np.float32).reshape(-1, 2).copy()
+    return vertices, uvs
+
+
+def upload_patch(entity, patch):
+    """
+    Yamayı entity'nin mesh'ine ve mesh collider'ına yerinde yazar.
+
+    Returns:
+        False ise mesh henüz GPU'da yok veya collider uyumsuz; çağıran
+        tam yüklemeye (rebuild_from_patch) dönmelidir.
+    """
+    if not patch.dirty and patch.count == patch.uploaded_count:
+        return True
+    geom_node = getattr(entity.model, 'geomNode', None)
+    if geom_node is None or geom_node.getNumGeoms() == 0:
+        return False
+    collider = entity.collider
+    collision = collider.node_path.node() if collider is not None and collider.node_path is not None else None
+    if collision is None or collision.getNumSolids() != patch.uploaded_count * 2:
+        return False
+
+    slots, old_count = patch.take_dirty()
+    count = patch.count
+
+    geom = geom_node.modifyGeom(0)
+    vdata = geom.modifyVertexData()
+    if count != old_count:
+        vdata.setNumRows(count * 4)
+    if len(slots):
+        _array_view(vdata.modifyArray(0), np.float32).reshape(-1, 4, 3)[slots] = patch.vertices[slots]
+        _array_view(vdata.modifyArray(1), np.float32).reshape(-1, 4, 2)[slots] = patch.uvs[slots]
+    if count != old_count:
+        # İndeks deseni sabit: sadece eklenen dörtgenlerin indeksleri yazılır
+        indices = geom.modifyPrimitive(0).modifyVertices()
+        indices.setNumRows(count * 6)
+        if count > old_count:
+            _array_view(indices, np.uint32)[old_count * 6:] = quad_indices(count)[old_count * 6:]
+
+    # Collider: dörtgen başına MeshCollider ile aynı sırada iki üçgen
+    for slot in slots.tolist():
+        first, second = _quad_polygons(*patch.vertices[slot].tolist())
+        if slot < old_count:
+            collision.setSolid(slot * 2, first)
+            collision.setSolid(slot * 2 + 1, second)
+        else:
+            collision.addSolid(first)
+            collision.addSolid(second)
+    for solid in range(old_count * 2 - 1, count * 2 - 1, -1):
+        collision.removeSolid(solid)
+    return True
+
+
+def _quad_polygons(v0, v1, v2, v3):
+    # Dörtgenin üçgenleri (2,1,0) ve (0,3,2); ursina MeshCollider gibi ters sırayla
+    p0, p1, p2, p3 = Point3(*v0), Point3(*v1), Point3(*v2), Point3(*v3)
+    return CollisionPolygon(p0, p1, p2), CollisionPolygon(p2, p3, p0)
+
+
+def _collision_polygons(quads):
+    """(N, 4, 3) dörtgen köşelerinden dörtgen başına iki CollisionPolygon"""
+    polygons = []
+    for corners in quads.tolist():
+        polygons.extend(_quad_polygons(*corners))
+    return polygons
+
+
+def rebuild_from_patch(entity, patch):
+    """Yamanın tüm dizileriyle mesh ve collider'ı baştan kurar"""
+    count = patch.count
+    patch.dirty.clear()
+    patch.uploaded_count = count
+    upload_mesh(entity, patch.vertices[:count].reshape(-1, 3), patch.uvs[:count].reshape(-1, 2),
+                quad_indices(count))
+
+
+class EditLatencyStats:
+    """Düzenlemeden görünür mesh'e gecikme: yerinde yama ve tam yeniden meshleme"""
+
+    def __init__(self):
+        self.counts = {'patch': 0, 'remesh': 0}
+        self.totals = {'patch': 0.0, 'remesh': 0.0}
+        self.last = {'patch': 0.0, 'remesh': 0.0}
+
+    def record(self, kind, seconds):
+        self.counts[kind] += 1
+        self.totals[kind] += seconds
+        self.last[kind] = seconds
+
+    def average_ms(self, kind):
+        return self.totals[kind] / self.counts[kind] * 1000 if self.counts[kind] else 0.0
+
+    def summary(self):
+        return (f"yama ort {self.average_ms('patch'):.2f} ms ({self.counts['patch']})"
+                f" | yeniden mesh ort {self.average_ms('remesh'):.1f} ms ({self.counts['remesh']})")
+
+
+def elapsed_since(start):
+    return time.perf_counter() - start
@@ -0,0 +1,375 @@
+# -*- coding: utf-8 -*-
+"""
+PyCraft Mesh İşçi Havuzu
+Chunk mesh işleri her yeniden çizimde yeni bir iş parçacığı açmak yerine
+sabit boyutlu bir havuzun iş kuyruğuna gönderilir.
+
+İki arka uç MeshPoolBase'in ortak arayüzünü sunar:
+    MeshWorkerPool  - iş parçacıkları (tek çekirdek / varsayılan)
+    ProcessMeshPool - işçi süreçler; GIL'i aşar, çekirdek sayısıyla ölçeklenir
+
+Süreç arka ucunda dolgulu chunk dizileri multiprocessing.shared_memory
+üzerindeki sabit boyutlu yuvalara kopyalanır; işçi diziyi kopyasız okur,
+sonucu ham float32/uint32 tampon baytları olarak döndürür (Python listesi
+pickle edilmez).
+
+İşler arka planda çalışır, sonuçlar ana döngüde poll() ile alınır
+(Panda3D nesneleri sadece ana iş parçacığında değiştirilir). Kuyruk
+derinliği ve iş başına gecikme (gönderimden sonucun hazır olmasına kadar)
+izleme için tutulur. Alınan sonuçlar MeshUploadQueue'da bekler ve her
+karede o anki önceliğe göre süre bütçesi dolana kadar uygulanır.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from chunk_mesher import ChunkMesher, MeshBuffers
+from process_pool import create_process_pool, worker_main
+from voxel_world import CHUNK_SIZE, WORLD_HEIGHT
+
+PADDED_SHAPE = (CHUNK_SIZE + 2, WORLD_HEIGHT + 2, CHUNK_SIZE + 2)
+PADDED_BYTES = PADDED_SHAPE[0] * PADDED_SHAPE[1] * PADDED_SHAPE[2]
+SLOTS_PER_WORKER = 4  # İşçi başına paylaşımlı bellekte bekleyebilen iş
+
+
+class MeshJobStats:
+    """İş gecikmesi istatistikleri (saniye)"""
+
+    def __init__(self):
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.coalesced = 0  # İş sürerken gelip tek yeniden meshlemede birleşen istekler
+        self.stale = 0      # Eski sürümden üretildiği için ardından yeniden meshlenen sonuçlar
+        self.total_latency = 0.0
+        self.total_run = 0.0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+
+    def record(self, latency, run_time):
+        self.completed += 1
+        self.total_latency += latency
+        self.total_run += run_time
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+
+    @property
+    def average_latency(self):
+        return self.total_latency / self.completed if self.completed else 0.0
+
+    @property
+    def average_run(self):
+        return self.total_run / self.completed if self.completed else 0.0
+
+    def summary(self):
+        return (f"{self.completed} iş | gecikme ort {self.average_latency * 1000:.1f} ms"
+                f" / maks {self.max_latency * 1000:.1f} ms | hesap ort {self.average_run * 1000:.1f} ms"
+                f" | birleşen {self.coalesced} | eski {self.stale} | iptal {self.cancelled}")
+
+
+class MeshPoolBase:
+    """
+    Mesh havuzlarının ortak arayüzü: bekleyen Future listesi, poll, iptal ve istatistik.
+
+    submit(job, read_padded, origin_x, origin_z, greedy) işi kuyruğa ekler;
+    read_padded dolgulu chunk dizisini döndüren çağrılabilirdir. poll(limit)
+    biten işleri gönderim sırasıyla [(job, (solid, passable)), ...] olarak
+    döndürür; hata veren işin sonucu None olur. Alt sınıflar submit, running
+    ve gerekirse _release / _collect'i tanımlar.
+    """
+
+    backend = None
+
+    def __init__(self, pool, workers):
+        self.pool = pool
+        self.workers = workers
+        self.pending = []  # [(job, Future)] gönderim sırasıyla
+        self.stats = MeshJobStats()
+
+    @property
+    def queue_depth(self):
+        """Henüz bitmemiş (bekleyen + çalışan) iş sayısı"""
+        return sum(1 for _, future in self.pending if not future.done())
+
+    def submit(self, job, read_padded, origin_x, origin_z, greedy=False):
+        raise NotImplementedError
+
+    def poll(self, limit=None):
+        """En fazla limit adet (None = hepsi) tamamlanmış iş: [(job, sonuç), ...]"""
+        results = []
+        remaining = []
+        for job, future in self.pending:
+            if (limit is not None and len(results) >= limit) or not future.done():
+                remaining.append((job, future))
+                continue
+            results.append((job, self._collect(future)))
+        self.pending = remaining
+        return results
+
+    def cancel(self, match):
+        """match(job) doğru olan ve henüz başlamamış işleri iptal eder, iptal sayısını döndürür"""
+        kept = []
+        cancelled = 0
+        for job, future in self.pending:
+            if match(job) and future.cancel():
+                self._release(future)
+                cancelled += 1
+            else:
+                kept.append((job, future))
+        self.pending = kept
+        self.stats.cancelled += cancelled
+        return cancelled
+
+    def _release(self, future):
+        pass
+
+    def _collect(self, future):
+        try:
+            result, start, end = future.result()
+        except Exception as e:
+            print(f"[MESH] İş hatası: {e}")
+            self.stats.failed += 1
+            return None
+        self.stats.record(end - future.submit_time, end - start)
+        return result
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+class MeshWorkerPool(MeshPoolBase):
+    """Sabit sayıda iş parçacığıyla mesh iş kuyruğu (read_padded işçide çağrılır)"""
+
+    backend = 'iş parçacığı'
+
+    def __init__(self, registry, workers=2):
+        super().__init__(ThreadPoolExecutor(max_workers=workers, thread_name_prefix='mesh'), workers)
+        self.mesher = ChunkMesher(registry)
+        self._running = 0
+        self._lock = threading.Lock()
+
+    @property
+    def running(self):
+        return self._running
+
+    def submit(self, job, read_padded, origin_x, origin_z, greedy=False):
+        submit_time = time.perf_counter()
+        future = self.pool.submit(self._run, read_padded, origin_x, origin_z, greedy)
+        future.submit_time = submit_time
+        self.pending.append((job, future))
+        return future
+
+    def _run(self, read_padded, origin_x, origin_z, greedy):
+        with self._lock:
+            self._running += 1
+        start = time.perf_counter()
+        try:
+            return self.mesher.build(read_padded(), origin_x, origin_z, greedy), start, time.perf_counter()
+        finally:
+            with self._lock:
+                self._running -= 1
+
+
+# --- SÜREÇ ARKA UCU ---
+_worker_mesher = None
+_worker_memory = None
+
+
+def _init_mesh_worker(registry, memory_name):
+    # Mesher ve paylaşımlı bellek her işçide bir kez hazırlanır
+    global _worker_mesher, _worker_memory
+    _worker_mesher = ChunkMesher(registry)
+    _worker_memory = shared_memory.SharedMemory(name=memory_name)
+
+
+def _mesh_slot(slot, origin_x, origin_z, greedy):
+    """İşçi süreç: yuvadaki dolgulu diziyi meshler, ham tampon baytlarını döndürür"""
+    start = time.perf_counter()
+    padded = np.ndarray(PADDED_SHAPE, dtype=np.uint8, buffer=_worker_memory.buf, offset=slot * PADDED_BYTES)
+    meshes = _worker_mesher.build(padded, origin_x, origin_z, greedy)
+    del padded  # Paylaşımlı belleğe açık referans kalmasın
+    packed = tuple((m.vertices.tobytes(), m.uvs.tobytes(), m.indices.tobytes(), m.source_faces,
+                    None if m.keys is None else m.keys.tobytes()) for m in meshes)
+    return packed, start, time.perf_counter()
+
+
+def _unpack_buffers(vertices, uvs, indices, source_faces, keys):
+    return MeshBuffers(
+        np.frombuffer(vertices, dtype=np.float32).reshape(-1, 3),
+        np.frombuffer(uvs, dtype=np.float32).reshape(-1, 2),
+        np.frombuffer(indices, dtype=np.uint32),
+        source_faces,
+        None if keys is None else np.frombuffer(keys, dtype=np.int64),
+    )
+
+
+class ProcessMeshPool(MeshPoolBase):
+    """
+    İşçi süreçlerde mesh kuyruğu (MeshWorkerPool ile aynı arayüz).
+
+    read_padded gönderimde ana iş parçacığında çağrılır ve dizi boş bir
+    paylaşımlı bellek yuvasına kopyalanır. Boş yuva yoksa iş yerel kuyrukta
+    bekler ve poll() sırasında yuva boşaldıkça gönderilir.
+    """
+
+    backend = 'süreç'
+
+    def __init__(self, registry, workers=2, slots=None):
+        self.slot_count = slots or workers * SLOTS_PER_WORKER
+        self.memory = shared_memory.SharedMemory(create=True, size=self.slot_count * PADDED_BYTES)
+        self.slots = np.ndarray((self.slot_count,) + PADDED_SHAPE, dtype=np.uint8, buffer=self.memory.buf)
+        self.free_slots = deque(range(self.slot_count))
+        self.waiting = deque()  # Yuva bekleyen işler
+        super().__init__(create_process_pool(workers, _init_mesh_worker, (registry, self.memory.name)), workers)
+
+    @property
+    def queue_depth(self):
+        return super().queue_depth + len(self.waiting)
+
+    @property
+    def running(self):
+        # Süreçlerdeki çalışan iş sayısı bilinmez; havuza gönderilmiş bitmemiş işler
+        return min(self.workers, super().queue_depth)
+
+    def submit(self, job, read_padded, origin_x, origin_z, greedy=False):
+        self.waiting.append((job, read_padded, origin_x, origin_z, greedy, time.perf_counter()))
+        self._dispatch()
+
+    def _dispatch(self):
+        while self.waiting and self.free_slots:
+            job, read_padded, origin_x, origin_z, greedy, submit_time = self.waiting.popleft()
+            slot = self.free_slots.popleft()
+            try:
+                self.slots[slot] = read_padded()
+                # İşçi süreçler iş gönderilirken başlatılabilir
+                with worker_main(__name__):
+                    future = self.pool.submit(_mesh_slot, slot, origin_x, origin_z, greedy)
+            except Exception:
+                self.free_slots.append(slot)
+                raise
+            future.submit_time = submit_time
+            future.slot = slot
+            self.pending.append((job, future))
+
+    def poll(self, limit=None):
+        results = super().poll(limit)
+        self._dispatch()
+        return results
+
+    def cancel(self, match):
+        waiting = len(self.waiting)
+        self.waiting = deque(entry for entry in self.waiting if not match(entry[0]))
+        self.stats.cancelled += waiting - len(self.waiting)
+        return waiting - len(self.waiting) + super().cancel(match)
+
+    def _release(self, future):
+        self.free_slots.append(future.slot)
+
+    def _collect(self, future):
+        self._release(future)
+        packed = super()._collect(future)
+        if packed is None:
+            return None
+        return tuple(_unpack_buffers(*mesh) for mesh in packed)
+
+    def shutdown(self):
+        self.pool.shutdown(wait=True, cancel_futures=True)
+        del self.slots
+        self.memory.close()
+        self.memory.unlink()
+
+
+class MeshUploadQueue:
+    """
+    Biten mesh sonuçlarının öncelikli yükleme kuyruğu (ana iş parçacığı).
+
+    Öncelik sonuç geldiğinde değil drain() sırasında hesaplanır (oyuncu
+    hareket ettikçe / döndükçe değişir). drain() sonuçları öncelik sırasıyla
+    uygular ve kare başına süre bütçesi dolunca durur; bütçe ne olursa olsun
+    her karede en az bir sonuç uygulanır.
+    """
+
+    def __init__(self):
+        self.entries = []  # [(job, sonuç)]
+        self.last_applied = 0  # Son karede uygulanan sonuç
+        self.last_time = 0.0   # Son karede yüklemeye harcanan süre (saniye)
+        self.applied = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def extend(self, results):
+        self.entries.extend(results)
+
+    def cancel(self, match):
+        """match(job) doğru olan bekleyen sonuçları atar, atılan sayısını döndürür"""
+        kept = [entry for entry in self.entries if not match(entry[0])]
+        dropped = len(self.entries) - len(kept)
+        self.entries = kept
+        return dropped
+
+    def drain(self, priority, apply, budget):
+        """
+        Args:
+            priority: priority(job) -> sıralama anahtarı (küçük önce)
+            apply: apply(job, sonuç) sonucu uygular
+            budget: Kare başına süre bütçesi (saniye)
+        """
+        start = time.perf_counter()
+        self.entries.sort(key=lambda entry: priority(entry[0]))
+        applied = 0
+        while applied < len(self.entries):
+            job, result = self.entries[applied]
+            applied += 1
+            apply(job, result)
+            if time.perf_counter() - start >= budget:
+                break
+        del self.entries[:applied]
+        self.applied += applied
+        self.last_applied = applied
+        self.last_time = time.perf_counter() - start
+        return applied
+
+    def summary(self):
+        return (f"{len(self.entries)} bekliyor | son kare {self.last_applied} mesh"
+                f" {self.last_time * 1000:.1f} ms | toplam {self.applied}")
+
+
+def create_mesh_pool(registry, workers, processes=False):
+    """processes=True ve workers > 1 ise süreç havuzu, aksi halde iş parçacığı havuzu"""
+    if processes and workers > 1:
+        return ProcessMeshPool(registry, workers)
+    return MeshWorkerPool(registry, workers)
+
+
+def benchmark_mesh_workers(registry, padded_arrays, max_workers, greedy=False):
+    """
+    1..max_workers süreç ile dolgulu dizilerin tamamını meshleme süresi
+    (havuz başlatma hariç, ilk işle ısındırılır).
+
+    Returns: [(işçi, saniye, hızlanma), ...]
+    """
+    results = []
+    for workers in range(1, max_workers + 1):
+        pool = ProcessMeshPool(registry, workers)
+        try:
+            pool.submit(None, lambda: padded_arrays[0], 0, 0, greedy)
+            while not pool.poll(1):
+                time.sleep(0.001)
+            start = time.perf_counter()
+            for i, padded in enumerate(padded_arrays):
+                pool.submit(i, lambda padded=padded: padded, 0, 0, greedy)
+            done = 0
+            while done < len(padded_arrays):
+                done += len(pool.poll(len(padded_arrays)))
+                time.sleep(0.0005)
+            elapsed = time.perf_counter() - start
+        finally:
+            pool.shutdown()
+        results.append((workers, elapsed, results[0][1] / elapsed if results else 1.0))
+    return results
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+PyCraft Süreç Havuzu Yardımcıları
+
+main.py içe aktarılırken oyun penceresini açar (Ursina()). 'spawn' ile
+başlatılan alt süreçler varsayılan olarak __main__ dosyasını yeniden
+çalıştırır; bu yüzden havuza iş gönderirken __main__ yerine hafif bir
+işçi modülünün (örn. terrain_gen) içe aktarılması sağlanır.
+"""
+
+import importlib.util
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+
+def create_process_pool(workers, initializer=None, initargs=()):
+    """Tüm platformlarda aynı davranan 'spawn' tabanlı süreç havuzu"""
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=initializer,
+        initargs=initargs,
+    )
+
+
+@contextmanager
+def worker_main(module_name):
+    """
+    Bu blok içinde başlayan alt süreçler __main__ yerine module_name'i yükler.
+    Havuz süreçleri iş gönderilirken başlatıldığından submit() çağrıları
+    bu blok içinde yapılmalıdır.
+    """
+    main = sys.modules['__main__']
+    old_spec = getattr(main, '__spec__', None)
+    main.__spec__ = importlib.util.find_spec(module_name)
+    try:
+        yield
+    finally:
+        main.__spec__ = old_spec
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+PyCraft Yapı Şablonları
+Ağaç gibi çok bloklu yapılar önceden hesaplanmış ofset / blok ID dizileri
+olarak tutulur ve tek vektörel adımda yerleştirilir.
+
+Bir yerleştirme dünya koordinatlı hücre demeti üretir:
+    (xs, ys, zs, ids, replace)
+replace=False hücreler sadece boşluğa yazılır (yapraklar), replace=True
+hücreler her zaman yazılır (gövde). Böylece üst üste binen yapıların sonucu
+yazılma sırasından bağımsızdır. Hücreler chunk dizisine voxel_world.stamp_cells,
+dünyaya VoxelWorld.stamp_structure ile yazılır.
+"""
+
+import numpy as np
+
+from voxel_world import CHUNK_SIZE
+
+
+class StructureTemplate:
+    """
+    Yapı şablonu.
+
+    Args:
+        cells: [(dx, dy, dz, blok_adı, replace), ...] - köke göre ofsetler
+    """
+
+    def __init__(self, name, cells, registry):
+        self.name = name
+        self.offsets = np.array([c[:3] for c in cells], dtype=np.int64)
+        self.block_ids = np.array([registry.id_of(c[3]) for c in cells], dtype=np.uint8)
+        self.replace = np.array([c[4] for c in cells], dtype=bool)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def place(self, xs, ys, zs):
+        """Kök dizileri (M,) için tüm hücreler: (xs, ys, zs, ids, replace), her biri (M * N,)"""
+        xs, ys, zs = (np.asarray(a, dtype=np.int64)[:, None] for a in (xs, ys, zs))
+        count = xs.shape[0]
+        return (
+            (xs + self.offsets[:, 0]).ravel(),
+            (ys + self.offsets[:, 1]).ravel(),
+            (zs + self.offsets[:, 2]).ravel(),
+            np.tile(self.block_ids, count),
+            np.tile(self.replace, count),
+        )
+
+
+def tree_template(registry):
+    """Meşe ağacı: 4 blok gövde, 5x5 (köşesiz) iki kat + artı şeklinde tepe"""
+    cells = []
+    # Yapraklar
+    for dx in range(-2, 3):
+        for dz in range(-2, 3):
+            if abs(dx) == 2 and abs(dz) == 2: continue
+            cells += [(dx, 5, dz, 'leaves', False), (dx, 6, dz, 'leaves', False)]
+    for dx in range(-1, 2):
+        for dz in range(-1, 2):
+            if abs(dx) == 1 and abs(dz) == 1: continue
+            cells.append((dx, 7, dz, 'leaves', False))
+    cells.append((0, 8, 0, 'leaves', False))
+    # Gövde
+    cells += [(0, i, 0, 'log', True) for i in range(1, 5)]
+    return StructureTemplate('tree', cells, registry)
+
+
+def select_cells(cells, mask):
+    return tuple(a[mask] for a in cells)
+
+
+def cells_outside_chunk(cells, cx, cz):
+    """Chunk'a düşmeyen (komşulara taşan) hücreler"""
+    owner = (cells[0] // CHUNK_SIZE == cx) & (cells[2] // CHUNK_SIZE == cz)
+    return select_cells(cells, ~owner)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+PyCraft Arazi Önbelleği
+Üretilen chunk verilerini diske yazar, sonraki açılışta yeniden hesaplamak
+yerine okur.
+
+Kayıtlar (dünya tohumu, üreteç sürümü, chunk koordinatı) ile anahtarlanır:
+    <kök>/<tohum>_<sürüm>/<cx>_<cz>.bin
+Üreteç değişince sürüm değişir; aynı tohumun eski sürüm klasörleri silinir.
+Başka tohumların (dünyaların) klasörleri varsayılan olarak korunur,
+prune_other_worlds=True ile onlar da silinir. Tohumu önbellek değil dünya
+kaydı belirler (bkz. world_save.py); önbellek silinmeye her zaman güvenlidir.
+"""
+
+import os
+import shutil
+import zlib
+
+import numpy as np
+
+from voxel_world import CHUNK_SIZE, WORLD_HEIGHT
+
+CHUNK_SHAPE = (CHUNK_SIZE, WORLD_HEIGHT, CHUNK_SIZE)
+
+
+class TerrainCache:
+    """Chunk başına zlib ile sıkıştırılmış ham uint8 blok dizisi"""
+
+    def __init__(self, root, seed, version, prune_other_worlds=False):
+        self.root = root
+        self.seed = seed
+        self.version = version
+        self.directory = os.path.join(root, f"{seed}_{version}")
+        os.makedirs(self.directory, exist_ok=True)
+        self.invalidated = self._remove_stale(prune_other_worlds)
+
+    def _remove_stale(self, prune_other_worlds):
+        """Aynı tohumun farklı üreteç sürümüne ait kayıtlarını (istenirse diğer tohumları da) siler"""
+        removed = 0
+        prefix = f"{self.seed}_"
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if path == self.directory or not os.path.isdir(path):
+                continue
+            if prune_other_worlds or name.startswith(prefix):
+                shutil.rmtree(path, ignore_errors=True)
+                removed += 1
+        return removed
+
+    def _path(self, cx, cz):
+        return os.path.join(self.directory, f"{cx}_{cz}.bin")
+
+    def load(self, cx, cz):
+        """Kayıtlı chunk dizisi veya None (yok / bozuk)"""
+        try:
+            with open(self._path(cx, cz), 'rb') as f:
+                raw = zlib.decompress(f.read())
+        except (OSError, zlib.error):
+            return None
+        if len(raw) != CHUNK_SIZE * WORLD_HEIGHT * CHUNK_SIZE:
+            return None
+        return np.frombuffer(raw, dtype=np.uint8).reshape(CHUNK_SHAPE).copy()
+
+    def store(self, cx, cz, blocks):
+        # Yarım yazılmış dosya okunmasın diye geçici dosya + atomik değiştirme
+        path = self._path(cx, cz)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(zlib.compress(np.ascontiguousarray(blocks, dtype=np.uint8).tobytes(), 1))
+            os.replace(tmp, path)
+        except OSError:
+            # Önbellek isteğe bağlıdır; yazılamazsa üretim devam eder
+            if os.path.exists(tmp):
+                os.remove(tmp)
@@ -0,0 +1,555 @@
+# -*- coding: utf-8 -*-
+"""
+PyCraft Arazi Üreteci
+Chunk arazisini NumPy ile vektörel olarak üretir.
+
+Yükseklik gürültüsü bir chunk (veya tüm harita) için tek çağrıda hesaplanır;
+sütun dolgusu, madenler ve ana kaya dizi yayınlama (broadcasting) ve
+maskelerle yazılır. Üretim tohum ve chunk koordinatına göre deterministiktir,
+bu yüzden chunk'lar bölge işleri halinde ayrı süreçlerde üretilebilir.
+
+Chunk üretimi sırayla çalışan aşamalardan oluşur (GENERATION_STAGES); her
+aşamanın süresi, yazdığı blok sayısı ve bellek farkı StageStats'ta toplanır.
+"""
+
+import hashlib
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from process_pool import create_process_pool, worker_main
+from structures import cells_outside_chunk, tree_template
+from voxel_world import CHUNK_SIZE, MIN_Y, WORLD_HEIGHT, stamp_cells
+
+# Üreteç çıktısını değiştiren her düzenlemede artırılmalı (önbelleği geçersiz kılar)
+GENERATOR_VERSION = 2
+
+# Arazi parametreleri
+NOISE_OCTAVES = 2        # Daha az oktav = daha pürüzsüz
+NOISE_FREQUENCY = 0.03   # Daha geniş düzlükler için düşük frekans
+HEIGHT_AMPLITUDE = 8     # Tepeleri alçalt (Amplitude 10 -> 8)
+DIRT_DEPTH = 3           # Çimenin altındaki toprak katmanı
+TREE_CHANCE = 0.010      # Ağaç Şansı - Azaltıldı (0.015 -> 0.010)
+TREE_MARGIN = 2          # Harita kenarından uzaklık
+
+# Maden eşikleri (taş hücre başına tek rastgele sayı ile)
+COAL_CHANCE = 0.03       # %3 Coal
+IRON_CHANCE = 0.045      # %1.5 Iron
+DIAMOND_CHANCE = 0.047   # %0.2 Diamond (only deep, y < 0)
+
+# Chunk başına ayrı rastgele akışlar (bkz. chunk_rng)
+TREE_STREAM = 1
+ORE_STREAM = 2
+ANIMAL_STREAM = 3
+
+# Hayvan yerleşimi
+ANIMAL_CHANCE = 0.25     # Chunk başına hayvan çıkma şansı
+ANIMAL_MARGIN = 15       # Harita kenarından uzaklık
+
+# Paralel üretimde bir işin kapsadığı bölge (REGION_SIZE x REGION_SIZE chunk)
+REGION_SIZE = 4
+
+# Üretim aşamaları (çalışma sırası)
+GENERATION_STAGES = ('heightmap', 'column_fill', 'ore_pass', 'decoration', 'population')
+STAGE_LABELS = {
+    'heightmap': 'yükseklik',
+    'column_fill': 'dolgu',
+    'ore_pass': 'maden',
+    'decoration': 'süsleme',
+    'population': 'nüfus',
+}
+
+_GRADIENT_COUNT = 256
+
+
+def chunk_rng(seed, cx, cz, stream):
+    """
+    (tohum, akış, cx, cz)'den türetilen NumPy üreteci.
+    Global random durumuna bağlı olmadığı için her chunk tek başına ve
+    herhangi bir sırada aynı şekilde yeniden üretilebilir.
+    """
+    return np.random.default_rng([seed, stream, cx & 0xFFFFFFFF, cz & 0xFFFFFFFF])
+
+
+def _fade(t):
+    return t * t * t * (t * (t * 6 - 15) + 10)
+
+
+class PerlinNoise2D:
+    """
+    Toplu 2B Perlin gürültüsü (perlin_noise paketinin vektörel karşılığı).
+
+    Paketteki gibi octaves koordinatları ölçekler, gradyan bileşenleri
+    [-1, 1] aralığında düzgün dağılır; böylece çıktı dağılımı aynıdır.
+    """
+
+    def __init__(self, seed, octaves=1):
+        rng = np.random.default_rng(seed)
+        self.octaves = octaves
+        self.perm = rng.permutation(_GRADIENT_COUNT)
+        self.gradients = rng.uniform(-1, 1, (_GRADIENT_COUNT, 2))
+
+    def _corner(self, ix, iz, dx, dz):
+        g = self.gradients[self.perm[(self.perm[ix & 255] + iz) & 255]]
+        return g[..., 0] * dx + g[..., 1] * dz
+
+    def __call__(self, xs, zs):
+        """xs, zs: aynı şekle yayınlanabilen koordinat dizileri"""
+        xs = np.asarray(xs, dtype=np.float64) * self.octaves
+        zs = np.asarray(zs, dtype=np.float64) * self.octaves
+        x0, z0 = np.floor(xs), np.floor(zs)
+        fx, fz = xs - x0, zs - z0
+        ix, iz = x0.astype(np.int64), z0.astype(np.int64)
+
+        u, v = _fade(fx), _fade(fz)
+        n00 = self._corner(ix, iz, fx, fz)
+        n10 = self._corner(ix + 1, iz, fx - 1, fz)
+        n01 = self._corner(ix, iz + 1, fx, fz - 1)
+        n11 = self._corner(ix + 1, iz + 1, fx - 1, fz - 1)
+        nx0 = n00 + u * (n10 - n00)
+        nx1 = n01 + u * (n11 - n01)
+        return nx0 + v * (nx1 - nx0)
+
+
+class StageStats:
+    """
+    Aşama başına toplam süre, yazılan blok ve bellek farkı.
+    Bellek farkı sadece tracemalloc açıkken ölçülür.
+    """
+
+    def __init__(self):
+        self.calls = dict.fromkeys(GENERATION_STAGES, 0)
+        self.time = dict.fromkeys(GENERATION_STAGES, 0.0)
+        self.blocks = dict.fromkeys(GENERATION_STAGES, 0)
+        self.memory = dict.fromkeys(GENERATION_STAGES, 0)
+        self.memory_traced = False
+
+    def record(self, stage, seconds, blocks, memory):
+        self.calls[stage] += 1
+        self.time[stage] += seconds
+        self.blocks[stage] += blocks
+        if memory is not None:
+            self.memory[stage] += memory
+            self.memory_traced = True
+
+    def merge(self, other):
+        for stage in GENERATION_STAGES:
+            self.calls[stage] += other.calls[stage]
+            self.time[stage] += other.time[stage]
+            self.blocks[stage] += other.blocks[stage]
+            self.memory[stage] += other.memory[stage]
+        self.memory_traced |= other.memory_traced
+
+    def take(self):
+        """Toplanan değerleri döndürür ve sıfırlar (işçi süreçler için)"""
+        taken = StageStats()
+        self.__dict__, taken.__dict__ = taken.__dict__, self.__dict__
+        return taken
+
+    def report(self):
+        """Aşama başına tek satır"""
+        lines = []
+        for stage in GENERATION_STAGES:
+            memory = f"{self.memory[stage] / 1024:+.0f} KB" if self.memory_traced else "-"
+            lines.append(f"{STAGE_LABELS[stage]:<10} {self.time[stage] * 1000:8.1f} ms "
+                         f"{self.calls[stage]:5d} çağrı {self.blocks[stage]:9d} blok  bellek {memory}")
+        return lines
+
+    def summary(self):
+        """Çağrı başına ortalama süreler (ms)"""
+        return " | ".join(
+            f"{STAGE_LABELS[stage]} {self.time[stage] * 1000 / self.calls[stage] if self.calls[stage] else 0:.2f}"
+            for stage in GENERATION_STAGES)
+
+
+def _traced_memory():
+    return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+
+
+class _ChunkJob:
+    """Aşamalar arasında taşınan chunk durumu"""
+
+    def __init__(self, cx, cz):
+        self.cx, self.cz = cx, cz
+        self.x0, self.z0 = cx * CHUNK_SIZE, cz * CHUNK_SIZE
+        self.heights = None
+        self.blocks = None
+        self.type_count = 0
+        self.spawns = []
+
+
+class TerrainGenerator:
+    """
+    Deterministik chunk üreteci: generate_chunk(cx, cz) -> (16, WORLD_HEIGHT, 16) uint8.
+
+    Sadece tamsayı ID'leri ve gürültü tablolarını tuttuğu için pickle
+    edilebilir (ayrı süreçlerde de çalıştırılabilir). world_size None ise
+    dünya sınırsızdır (ağaç/hayvan kenar boşlukları uygulanmaz).
+    """
+
+    def __init__(self, seed, registry, world_size=None):
+        self.seed = seed
+        self.world_size = world_size
+        self.noise = PerlinNoise2D(seed, octaves=NOISE_OCTAVES)
+
+        self.grass = registry.id_of('grass')
+        self.dirt = registry.id_of('dirt')
+        self.stone = registry.id_of('stone')
+        self.coal = registry.id_of('coal_ore')
+        self.iron = registry.id_of('iron_ore')
+        self.diamond = registry.id_of('diamond_ore')
+        self.bedrock = registry.id_of('bedrock')
+        self.tree = tree_template(registry)
+
+        # Disk önbelleği (bkz. terrain_cache.py) - isteğe bağlı
+        self.cache = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        self.stage_stats = StageStats()
+
+    @property
+    def version(self):
+        """
+        Önbellek anahtarındaki üreteç sürümü: GENERATOR_VERSION ve çıktıyı
+        etkileyen parametrelerin (blok ID'leri dahil) özeti.
+        """
+        params = (
+            GENERATOR_VERSION, NOISE_OCTAVES, NOISE_FREQUENCY, HEIGHT_AMPLITUDE, DIRT_DEPTH,
+            TREE_CHANCE, TREE_MARGIN, COAL_CHANCE, IRON_CHANCE, DIAMOND_CHANCE,
+            self.tree.offsets.tobytes(), self.tree.block_ids.tobytes(), self.tree.replace.tobytes(),
+            self.world_size, CHUNK_SIZE, MIN_Y, WORLD_HEIGHT,
+            self.grass, self.dirt, self.stone, self.coal, self.iron, self.diamond, self.bedrock,
+        )
+        return f"v{GENERATOR_VERSION}-{hashlib.sha1(repr(params).encode()).hexdigest()[:8]}"
+
+    def chunk_rng(self, cx, cz, stream):
+        return chunk_rng(self.seed, cx, cz, stream)
+
+    # --- YÜKSEKLİK ---
+    def surface_heights(self, x0, z0, width, depth):
+        """Dikdörtgen bölgenin zemin y değerleri, tek vektörel çağrı: (width, depth) [x, z]"""
+        xs = np.arange(x0, x0 + width)[:, None] * NOISE_FREQUENCY
+        zs = np.arange(z0, z0 + depth)[None, :] * NOISE_FREQUENCY
+        return np.floor(self.noise(xs, zs) * HEIGHT_AMPLITUDE).astype(np.int64)
+
+    # --- AĞAÇLAR ---
+    def tree_positions(self, cx, cz, heights=None):
+        """
+        Chunk içindeki ağaç gövdeleri: (xs, zemin_ys, zs) dizileri.
+        heights verilmezse chunk yükseklikleri hesaplanır.
+        """
+        x0, z0 = cx * CHUNK_SIZE, cz * CHUNK_SIZE
+        rolls = self.chunk_rng(cx, cz, TREE_STREAM).random((CHUNK_SIZE, CHUNK_SIZE))
+        lx, lz = np.nonzero(rolls < TREE_CHANCE)
+        xs, zs = lx + x0, lz + z0
+        if self.world_size is not None:
+            inside = ((xs > TREE_MARGIN) & (xs < self.world_size - TREE_MARGIN) &
+                      (zs > TREE_MARGIN) & (zs < self.world_size - TREE_MARGIN))
+            lx, lz, xs, zs = lx[inside], lz[inside], xs[inside], zs[inside]
+        if heights is None:
+            heights = self.surface_heights(x0, z0, CHUNK_SIZE, CHUNK_SIZE)
+        return xs, heights[lx, lz], zs
+
+    def generate_tree_data(self, cx, cz, heights=None):
+        """Chunk'ın kendi ağaçlarının tüm hücreleri (komşulara taşanlar dahil)"""
+        return self.tree.place(*self.tree_positions(cx, cz, heights))
+
+    def structure_spill(self, cx, cz):
+        """
+        Chunk'ın yapılarından komşu chunk'lara taşan hücreler.
+        Chunk dünyaya eklendikten sonra VoxelWorld.stamp_structure ile yazılır.
+        """
+        return cells_outside_chunk(self.generate_tree_data(cx, cz), cx, cz)
+
+    # --- CHUNK ---
+    def cached_chunk(self, cx, cz):
+        """Önbellekteki chunk dizisi veya None"""
+        if self.cache is None:
+            return None
+        blocks = self.cache.load(cx, cz)
+        if blocks is not None:
+            self.cache_hits += 1
+        return blocks
+
+    def generate_chunk(self, cx, cz):
+        """Chunk arazisi: (CHUNK_SIZE, WORLD_HEIGHT, CHUNK_SIZE) uint8 blok ID dizisi"""
+        blocks = self.cached_chunk(cx, cz)
+        if blocks is not None:
+            return blocks
+        blocks = self._build_chunk(cx, cz)
+        if self.cache is not None:
+            self.cache_misses += 1
+            self.cache.store(cx, cz, blocks)
+        return blocks
+
+    def _build_chunk(self, cx, cz):
+        job = _ChunkJob(cx, cz)
+        for stage in GENERATION_STAGES[:-1]:
+            self._run_stage(stage, job)
+        return job.blocks
+
+    def _run_stage(self, stage, job):
+        start, mem_start = time.perf_counter(), _traced_memory()
+        written = getattr(self, '_stage_' + stage)(job)
+        mem_end = _traced_memory()
+        memory = mem_end - mem_start if mem_start is not None and mem_end is not None else None
+        self.stage_stats.record(stage, time.perf_counter() - start, written, memory)
+
+    # --- AŞAMALAR (her biri yazdığı blok sayısını döndürür) ---
+    def _stage_heightmap(self, job):
+        job.heights = self.surface_heights(job.x0, job.z0, CHUNK_SIZE, CHUNK_SIZE)
+        return 0
+
+    def _stage_column_fill(self, job):
+        """Çimen, toprak, taş ve ana kaya sütunları"""
+        surface = job.heights[:, None, :]
+        ys = np.arange(MIN_Y, MIN_Y + WORLD_HEIGHT)[None, :, None]
+        below = ys < surface
+        job.blocks = np.select(
+            [ys == surface, below & (ys >= surface - DIRT_DEPTH), below & (ys > MIN_Y), below],
+            [self.grass, self.dirt, self.stone, self.bedrock], 0).astype(np.uint8)
+        return int(np.count_nonzero(job.blocks))
+
+    def _stage_ore_pass(self, job):
+        """Maden seçimi: taş hücre başına tek rastgele sayı"""
+        ys = np.arange(MIN_Y, MIN_Y + WORLD_HEIGHT)[None, :, None]
+        rand = self.chunk_rng(job.cx, job.cz, ORE_STREAM).random((CHUNK_SIZE, WORLD_HEIGHT, CHUNK_SIZE))
+        ores = np.select(
+            [rand < COAL_CHANCE, rand < IRON_CHANCE, (rand < DIAMOND_CHANCE) & (ys < 0)],
+            [self.coal, self.iron, self.diamond], self.stone)
+        stone = job.blocks == self.stone
+        np.copyto(job.blocks, ores, where=stone, casting='unsafe')
+        return int(np.count_nonzero(stone & (ores != self.stone)))
+
+    def _stage_decoration(self, job):
+        # Ağaçlar: sadece chunk'a düşen hücreler (taşanlar structure_spill ile dünyaya yazılır)
+        cells = self.generate_tree_data(job.cx, job.cz, job.heights)
+        return len(stamp_cells(job.blocks, job.x0, job.z0, cells)[3])
+
+    def _stage_population(self, job):
+        job.spawns = self.animal_spawns(job.cx, job.cz, job.type_count)
+        return 0
+
+    def populate(self, cx, cz, type_count):
+        """
+        Nüfus aşaması: chunk dünyaya eklendiğinde ana süreçte çalışır
+        (blok verisi önbellekten gelse bile). Returns: animal_spawns listesi
+        """
+        job = _ChunkJob(cx, cz)
+        job.type_count = type_count
+        self._run_stage('population', job)
+        return job.spawns
+
+    # --- HAYVANLAR ---
+    def animal_spawns(self, cx, cz, type_count):
+        """Chunk'ta doğacak hayvanlar: [(tür_indeksi, x, z), ...] (en fazla bir tane)"""
+        rng = self.chunk_rng(cx, cz, ANIMAL_STREAM)
+        if rng.random() >= ANIMAL_CHANCE:
+            return []
+        kind = int(rng.integers(type_count))
+        x = cx * CHUNK_SIZE + int(rng.integers(CHUNK_SIZE))
+        z = cz * CHUNK_SIZE + int(rng.integers(CHUNK_SIZE))
+        if self.world_size is not None and not (
+                ANIMAL_MARGIN <= x <= self.world_size - ANIMAL_MARGIN and
+                ANIMAL_MARGIN <= z <= self.world_size - ANIMAL_MARGIN):
+            return []
+        return [(kind, x, z)]
+
+
+# --- PARALEL ÜRETİM ---
+_worker_generator = None
+
+
+def _init_worker(generator):
+    # Üreteç her işçiye bir kez gönderilir
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _generate_region(keys):
+    """
+    İşçi süreç: bölgedeki chunk'ları tek paket dizi (n, 16, WORLD_HEIGHT, 16)
+    ve bu işin aşama istatistikleri ile döndürür.
+    """
+    packed = np.stack([_worker_generator.generate_chunk(cx, cz) for cx, cz in keys])
+    return keys, packed, _worker_generator.stage_stats.take()
+
+
+def _region_jobs(keys, region_size):
+    jobs = {}
+    for cx, cz in keys:
+        jobs.setdefault((cx // region_size, cz // region_size), []).append((cx, cz))
+    return list(jobs.values())
+
+
+def generate_chunks(generator, keys, workers=1, region_size=REGION_SIZE):
+    """
+    Chunk'ları üretir ve (cx, cz, blocks) olarak verir.
+
+    workers > 1 ise bölge işleri süreç havuzunda çalışır; sonuçlar tamamlanma
+    sırasıyla gelir. Her chunk yalnızca (tohum, cx, cz)'ye bağlı olduğundan
+    veri işçi sayısından bağımsız olarak aynıdır.
+    """
+    if workers <= 1:
+        for cx, cz in keys:
+            yield cx, cz, generator.generate_chunk(cx, cz)
+        return
+
+    # Önbellekteki chunk'lar burada okunur, sadece eksikler işçilere gider
+    missing = []
+    for cx, cz in keys:
+        blocks = generator.cached_chunk(cx, cz)
+        if blocks is None:
+            missing.append((cx, cz))
+        else:
+            yield cx, cz, blocks
+    if not missing:
+        return
+    if generator.cache is not None:
+        generator.cache_misses += len(missing)
+    keys = missing
+
+    with create_process_pool(workers, _init_worker, (generator,)) as pool:
+        with worker_main(__name__):
+            futures = [pool.submit(_generate_region, job) for job in _region_jobs(keys, region_size)]
+        for future in as_completed(futures):
+            job, packed, stats = future.result()
+            generator.stage_stats.merge(stats)
+            for (cx, cz), blocks in zip(job, packed):
+                yield cx, cz, blocks
+
+
+def benchmark_workers(generator, keys, max_workers):
+    """
+    1..max_workers işçi ile üretim süresini ölçer (havuz başlatma dahil).
+
+    Returns: [(işçi, saniye, hızlanma), ...]
+    """
+    results = []
+    # Önbellek kapalı ölçülür (üretimin kendisi)
+    cache, generator.cache = generator.cache, None
+    try:
+        for workers in range(1, max_workers + 1):
+            start = time.perf_counter()
+            for _ in generate_chunks(generator, keys, workers):
+                pass
+            elapsed = time.perf_counter() - start
+            results.append((workers, elapsed, results[0][1] / elapsed if results else 1.0))
+    finally:
+        generator.cache = cache
+    return results
+
+
+class ChunkGenerationQueue:
+    """
+    Arka plan chunk üretim kuyruğu.
+
+    request() istenen chunk'ları (yakından uzağa sıralı) işçilere gönderir,
+    artık istenmeyen ve henüz başlamamış işleri iptal eder. poll() biten
+    sonuçları ana döngüde (cx, cz, blocks) olarak döndürür.
+
+    Hata veren işler max_retries kez yeniden gönderilir, sonra bırakılır
+    (failed sayacı). Süreç havuzu çökerse (BrokenProcessPool) üretim tek
+    iş parçacığına düşer.
+    """
+
+    max_retries = 2
+
+    def __init__(self, generator, workers=1):
+        self.generator = generator
+        if workers > 1:
+            self.pool = create_process_pool(workers, _init_worker, (generator,))
+            self._submit = self._submit_process
+        else:
+            # Tek çekirdek: ana döngüyü bloklamamak için tek iş parçacığı
+            self.pool = ThreadPoolExecutor(max_workers=1)
+            self._submit = lambda key: self.pool.submit(self._generate_one, key)
+        self.pending = {}  # {(cx, cz): Future}
+        self.retries = {}  # {(cx, cz): hata sonrası yeniden gönderim sayısı}
+        self.completed = 0
+        self.failed = 0
+        self.total_time = 0.0
+
+    def _generate_one(self, key):
+        # Aynı süreç: istatistikler doğrudan üretecin stage_stats'ına yazılır
+        return [key], self.generator.generate_chunk(*key)[None], None
+
+    def _use_thread_fallback(self):
+        if isinstance(self.pool, ThreadPoolExecutor):
+            return  # Zaten tek iş parçacığında (aynı çöküşün diğer işleri)
+        print("[ÜRETİM] İşçi süreç havuzu çöktü, tek iş parçacığına geçiliyor")
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        self.pool = ThreadPoolExecutor(max_workers=1)
+        self._submit = lambda key: self.pool.submit(self._generate_one, key)
+
+    def _submit_process(self, key):
+        # İşçi süreçler iş gönderilirken başlatılabilir
+        with worker_main(__name__):
+            return self.pool.submit(_generate_region, [key])
+
+    @property
+    def queue_depth(self):
+        return len(self.pending)
+
+    def request(self, keys):
+        """keys: öncelik sırasıyla üretilmesi istenen chunk'lar"""
+        wanted = set(keys)
+        for key, future in list(self.pending.items()):
+            if key not in wanted and future.cancel():
+                del self.pending[key]
+        for key in keys:
+            if key not in self.pending:
+                self._send(key)
+
+    def _send(self, key):
+        try:
+            future = self._submit(key)
+        except BrokenProcessPool:
+            self._use_thread_fallback()
+            future = self._submit(key)
+        future.submit_time = time.perf_counter()
+        self.pending[key] = future
+
+    def poll(self, limit):
+        """En fazla limit adet tamamlanmış chunk döndürür: [(cx, cz, blocks), ...]"""
+        results = []
+        for key, future in list(self.pending.items()):
+            if len(results) >= limit:
+                break
+            if not future.done():
+                continue
+            del self.pending[key]
+            if future.cancelled():
+                continue
+            try:
+                _, packed, stats = future.result()
+            except Exception as e:
+                self._failed(key, e)
+                continue
+            self.retries.pop(key, None)
+            if stats is not None:
+                self.generator.stage_stats.merge(stats)
+            self.completed += 1
+            self.total_time += time.perf_counter() - future.submit_time
+            results.append((key[0], key[1], packed[0]))
+        return results
+
+    def _failed(self, key, error):
+        self.failed += 1
+        if isinstance(error, BrokenProcessPool):
+            self._use_thread_fallback()
+        retries = self.retries.get(key, 0)
+        if retries < self.max_retries:
+            self.retries[key] = retries + 1
+            self._send(key)
+        else:
+            print(f"[ÜRETİM] Chunk {key} üretilemedi: {error}")
+            self.retries.pop(key, None)
+
+    def shutdown(self):
+        # Bekleyen işler iptal edilir, çalışan işçiler beklenip kapatılır
+        self.pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Ortak test düzeni: depo kökü import yoluna eklenir, main.py'deki blok
+tanımlarının küçük bir kopyasından BlockRegistry kurulur (main.py oyunu
+başlattığı için testlerde import edilmez).
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from block_registry import BlockRegistry  # noqa: E402
+
+BLOCKS = {
+    'grass':   {'base_break_time': 0.6, 'preferred_tool': 'shovel', 'is_passable': False},
+    'stone':   {'base_break_time': 1.5, 'preferred_tool': 'pickaxe', 'is_passable': False},
+    'dirt':    {'base_break_time': 0.5, 'preferred_tool': 'shovel', 'is_passable': False},
+    'bedrock': {'base_break_time': -1, 'preferred_tool': None, 'is_passable': False},
+    'leaves':  {'base_break_time': 0.1, 'preferred_tool': None, 'is_passable': True},
+    'log':     {'base_break_time': 2.0, 'preferred_tool': 'axe', 'is_passable': False},
+    'coal_ore': {'base_break_time': 3.0, 'preferred_tool': 'pickaxe', 'is_passable': False, 'drop': 'coal'},
+}
+TOOLS = {
+    'pickaxe': {'type': 'tool'},
+    'wooden_pickaxe': {'type': 'tool'},
+    'stone_shovel': {'type': 'tool'},
+    'diamond_axe': {'type': 'tool'},
+}
+ITEMS = {'coal': {'type': 'item'}}
+
+
+@pytest.fixture(scope='session')
+def registry():
+    return BlockRegistry(BLOCKS, TOOLS, ITEMS)
+
+
+@pytest.fixture
+def random_blocks(registry):
+    """Karışık (katı + geçilebilir + hava) bloklardan chunk dizisi üreten fonksiyon"""
+    from voxel_world import CHUNK_SIZE, WORLD_HEIGHT
+
+    def make(seed, fill=0.5):
+        rng = np.random.default_rng(seed)
+        ids = rng.integers(1, registry.block_count, size=(CHUNK_SIZE, WORLD_HEIGHT, CHUNK_SIZE), dtype=np.uint8)
+        ids[rng.random(ids.shape) > fill] = 0
+        return ids
+    return make
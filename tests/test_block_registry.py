@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from block_registry import ATLAS_ROWS, FACE_BOTTOM, FACE_RIGHT, FACE_TOP
+
+
+def test_ids_start_after_air(registry):
+    assert registry.names[0] is None
+    assert registry.id_of('grass') == 1
+    assert registry.id_of(None) == 0 and registry.id_of('yok') == 0
+    # Bloklar eşyalardan önce numaralanır
+    assert registry.is_block(registry.id_of('coal_ore'))
+    assert not registry.is_block(registry.id_of('pickaxe'))
+
+
+def test_passable_and_drop_tables(registry):
+    leaves, stone = registry.id_of('leaves'), registry.id_of('stone')
+    assert registry.passable[leaves] and not registry.solid[leaves]
+    assert registry.solid[stone] and not registry.passable[stone]
+    assert registry.get_drop(registry.id_of('coal_ore')) == 'coal'
+    assert registry.get_drop(stone) == 'stone'
+
+
+def test_face_rows(registry):
+    grass = registry.atlas_rows[registry.id_of('grass')]
+    assert grass[FACE_TOP] == ATLAS_ROWS.index('grass_top')
+    assert grass[FACE_BOTTOM] == ATLAS_ROWS.index('dirt')
+    assert grass[FACE_RIGHT] == ATLAS_ROWS.index('grass')
+
+
+def test_face_visibility(registry):
+    visible = registry.face_visible
+    stone, dirt, leaves = (registry.id_of(n) for n in ('stone', 'dirt', 'leaves'))
+    assert visible[stone, 0] and visible[leaves, 0]  # Havaya bakan yüz çizilir
+    assert not visible[stone, dirt]                  # Katı - katı gizli
+    assert visible[stone, leaves]                    # Katı - geçilebilir görünür
+    assert not visible[leaves, leaves]               # Aynı geçilebilir blok gizli
+    assert not visible[0].any()                      # Havanın yüzü yok
+
+
+def test_break_times(registry):
+    stone = registry.id_of('stone')
+    bare = registry.get_break_time(stone, 0)
+    assert bare == np.float32(1.5 * 1.5)  # Uygun alet gerekir: çıplak el yavaş
+    assert registry.get_break_time(stone, registry.id_of('pickaxe')) == np.float32(1.5 / 3.0)
+    # Uyan alet yoksa temel süre, yanlış kategori hızlandırmaz
+    assert registry.get_break_time(stone, registry.id_of('stone_shovel')) == np.float32(1.5)
+    assert registry.get_break_time(registry.id_of('log'), registry.id_of('diamond_axe')) == np.float32(2.0 / 8.0)
+    assert np.isinf(registry.get_break_time(registry.id_of('bedrock'), registry.id_of('pickaxe')))
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from chunk_mesher import QUAD_CORNERS, ChunkMesher, face_keys
+from voxel_world import CHUNK_SIZE, MIN_Y, NEIGHBOR_OFFSETS, WORLD_HEIGHT, VoxelWorld
+
+ORIGIN = (32, 48)
+
+
+@pytest.fixture
+def padded(registry, random_blocks):
+    """(2, 3) chunk'ı ve dört komşusu; dolgulu dizi komşulardan gelir"""
+    world = VoxelWorld(registry)
+    for i, key in enumerate(((2, 3), (1, 3), (3, 3), (2, 2), (2, 4))):
+        blocks = random_blocks(i, fill=0.3)
+        world.load_chunk(*key, lambda cx, cz, blocks=blocks: blocks)
+    return world.padded_chunk_array(2, 3)
+
+
+def reference_faces(registry, padded):
+    """Hücre hücre döngüyle görünür yüzler: {yüz anahtarı: (hedef mesh, köşeler)}"""
+    origin = np.array((ORIGIN[0], MIN_Y, ORIGIN[1]), dtype=np.float32)
+    faces = {}
+    for x, y, z in zip(*np.nonzero(padded[1:-1, 1:-1, 1:-1])):
+        block = padded[x + 1, y + 1, z + 1]
+        for face, (dx, dy, dz) in enumerate(NEIGHBOR_OFFSETS):
+            if registry.face_visible[block, padded[x + 1 + dx, y + 1 + dy, z + 1 + dz]]:
+                key = int(face_keys(x, y, z, face))
+                faces[key] = (int(registry.passable[block]), origin + (x, y, z) + QUAD_CORNERS[face])
+    return faces
+
+
+def unit_squares(vertices):
+    """Dörtgenlerin kapladığı birim kareler: (normal ekseni, yön, düzlem, a, b) sayımı"""
+    squares = Counter()
+    for quad in vertices.reshape(-1, 4, 3):
+        normal = np.cross(quad[1] - quad[0], quad[3] - quad[0])
+        axis = int(np.abs(normal).argmax())
+        a, b = (i for i in range(3) if i != axis)
+        low, high = quad.min(axis=0), quad.max(axis=0)
+        for u in range(int(round(low[a])), int(round(high[a]))):
+            for v in range(int(round(low[b])), int(round(high[b]))):
+                squares[(axis, bool(normal[axis] > 0), int(round(quad[0, axis])), u, v)] += 1
+    return squares
+
+
+def test_build_matches_reference(registry, padded):
+    solid, passable = ChunkMesher(registry).build(padded, *ORIGIN)
+    expected = reference_faces(registry, padded)
+    assert solid.face_count + passable.face_count == len(expected)
+    for target, buffers in enumerate((solid, passable)):
+        assert len(buffers.indices) == buffers.face_count * 6
+        quads = buffers.vertices.reshape(-1, 4, 3)
+        for key, quad in zip(buffers.keys.tolist(), quads):
+            mesh, corners = expected[key]
+            assert mesh == target
+            assert np.array_equal(quad, corners)
+        uvs = buffers.uvs
+        assert ((uvs >= 0) & (uvs <= 1)).all()
+
+
+def test_greedy_covers_same_faces(registry, padded):
+    mesher = ChunkMesher(registry)
+    normal = mesher.build(padded, *ORIGIN)
+    greedy = mesher.build(padded, *ORIGIN, greedy=True)
+    for plain, merged in zip(normal, greedy):
+        assert merged.keys is None
+        assert merged.source_faces == plain.face_count
+        assert merged.face_count <= plain.face_count
+        assert unit_squares(merged.vertices) == unit_squares(plain.vertices)
+
+
+def test_greedy_merges_flat_layer(registry):
+    padded = np.zeros((CHUNK_SIZE + 2, WORLD_HEIGHT + 2, CHUNK_SIZE + 2), dtype=np.uint8)
+    padded[1:-1, 1:11, 1:-1] = registry.id_of('stone')
+    solid, _ = ChunkMesher(registry).build(padded, 0, 0, greedy=True)
+    assert solid.face_count == 6  # Kutunun her yüzü tek dörtgen
+    assert solid.source_faces == 2 * CHUNK_SIZE * CHUNK_SIZE + 4 * CHUNK_SIZE * 10
+
+
+def test_cell_quads_match_build(registry, padded):
+    mesher = ChunkMesher(registry)
+    solid, passable = mesher.build(padded, *ORIGIN)
+    built = {key: quad for buffers in (solid, passable)
+             for key, quad in zip(buffers.keys.tolist(), buffers.vertices.reshape(-1, 4, 3))}
+    xs, ys, zs = np.nonzero(padded[1:-1, 1:-1, 1:-1])
+    xs, ys, zs = xs[:50], ys[:50], zs[:50]
+    ids = padded[xs + 1, ys + 1, zs + 1]
+    neighbors = np.stack([padded[xs + 1 + dx, ys + 1 + dy, zs + 1 + dz] for dx, dy, dz in NEIGHBOR_OFFSETS], axis=1)
+    for keys, vertices, _ in mesher.cell_quads(xs, ys, zs, ids, neighbors, *ORIGIN):
+        for key, quad in zip(keys.tolist(), vertices):
+            assert np.array_equal(built[key], quad)
+
+
+def test_empty_chunk(registry):
+    padded = np.zeros((CHUNK_SIZE + 2, WORLD_HEIGHT + 2, CHUNK_SIZE + 2), dtype=np.uint8)
+    for greedy in (False, True):
+        solid, passable = ChunkMesher(registry).build(padded, 0, 0, greedy)
+        assert solid.face_count == passable.face_count == 0
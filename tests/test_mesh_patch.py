@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+pytest.importorskip('ursina')  # mesh_patch Panda3D / ursina collider'ını import eder
+
+from mesh_patch import PatchableMesh  # noqa: E402
+
+
+def quads(keys):
+    """Anahtar başına köşeleri anahtar değeriyle dolu ayırt edilebilir dörtgenler"""
+    keys = np.asarray(keys, dtype=np.int64)
+    vertices = np.repeat(keys.astype(np.float32), 12).reshape(-1, 4, 3)
+    uvs = np.repeat(keys.astype(np.float32), 8).reshape(-1, 4, 2)
+    return keys, vertices, uvs
+
+
+def assert_consistent(mesh):
+    """Her yuvadaki dörtgen kendi anahtarına ait ve indeks yuvaları gösteriyor"""
+    keys = mesh.quad_keys()
+    assert len(mesh.index) == mesh.count == len(keys)
+    for slot, key in enumerate(keys.tolist()):
+        assert mesh.index[key] == slot
+        assert (mesh.vertices[slot] == key).all() and (mesh.uvs[slot] == key).all()
+
+
+def test_remove_moves_last_quad_into_slot():
+    keys, vertices, uvs = quads([10, 11, 12, 13])
+    mesh = PatchableMesh(vertices.reshape(-1, 3), uvs.reshape(-1, 2), keys)
+    mesh.remove([11, 99])
+    assert mesh.quad_keys().tolist() == [10, 13, 12]
+    assert_consistent(mesh)
+    slots, old_count = mesh.take_dirty()
+    assert slots.tolist() == [1] and old_count == 4
+    assert mesh.take_dirty()[1] == 3
+
+
+def test_add_grows_capacity():
+    keys, vertices, uvs = quads(range(20))
+    mesh = PatchableMesh(vertices.reshape(-1, 3), uvs.reshape(-1, 2), keys)
+    capacity = len(mesh.keys)
+    new_keys, new_vertices, new_uvs = quads(range(100, 100 + capacity))
+    mesh.add(new_keys, new_vertices, new_uvs)
+    assert len(mesh.keys) > capacity
+    assert mesh.count == 20 + capacity
+    assert_consistent(mesh)
+    slots, _ = mesh.take_dirty()
+    assert slots.tolist() == list(range(20, 20 + capacity))
+
+
+def test_remove_then_add_round_trip():
+    keys, vertices, uvs = quads([1, 2, 3])
+    mesh = PatchableMesh(vertices.reshape(-1, 3), uvs.reshape(-1, 2), keys)
+    mesh.remove([1, 2, 3])
+    assert mesh.count == 0
+    mesh.add(*quads([2]))
+    assert mesh.quad_keys().tolist() == [2]
+    assert_consistent(mesh)
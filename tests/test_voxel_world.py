@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from voxel_world import CHUNK_SIZE, MIN_Y, NO_BLOCK, WORLD_HEIGHT, VoxelWorld
+
+
+def generator_from(arrays):
+    """Deterministik üreteç yerine sabit dizilerden kopya döndüren üreteç"""
+    return lambda cx, cz: arrays[(cx, cz)].copy()
+
+
+@pytest.fixture(params=['full', 'overlay'])
+def world(request, registry, random_blocks):
+    arrays = {(cx, cz): random_blocks(cx * 7 + cz) for cx in range(2) for cz in range(2)}
+    world = VoxelWorld(registry, request.param)
+    for key in arrays:
+        world.load_chunk(*key, generator_from(arrays))
+    world.arrays = arrays
+    return world
+
+
+def test_load_round_trip(world):
+    for key, blocks in world.arrays.items():
+        assert (world.chunks[key].to_array() == blocks).all()
+    x, y, z = 17, 5, 3
+    assert world.get_id(x, y, z) == world.arrays[(1, 0)][1, y - MIN_Y, 3]
+
+
+def test_set_and_remove_block(world):
+    world.set_block(4, 20, 4, 'stone')
+    assert world.get_block(4, 20, 4) == 'stone'
+    assert world.remove_block(4, 20, 4) == 'stone'
+    assert world.get_block(4, 20, 4) is None
+    assert not world.set_block(4, MIN_Y + WORLD_HEIGHT, 4, 'stone')  # Dikey sınır dışı
+
+
+def test_stats_match_rebuild(world):
+    world.set_block(15, 0, 15, 'leaves')
+    world.remove_block(16, 0, 15)
+    counted = {key: (chunk.total_blocks, chunk.exposed_faces) for key, chunk in world.chunks.items()}
+    for key in world.chunks:
+        world.rebuild_stats(*key)
+    assert counted == {key: (chunk.total_blocks, chunk.exposed_faces) for key, chunk in world.chunks.items()}
+
+
+def test_heightmap_tracks_edits(world, registry):
+    chunk = world.chunks[(0, 0)]
+    blocks = chunk.to_array()
+    ys = np.arange(MIN_Y, MIN_Y + WORLD_HEIGHT)[None, :, None]
+    assert (chunk.top_any == np.where(blocks != 0, ys, NO_BLOCK).max(axis=1)).all()
+    assert (chunk.top_solid == np.where(registry.solid[blocks], ys, NO_BLOCK).max(axis=1)).all()
+
+    top = MIN_Y + WORLD_HEIGHT - 1
+    world.set_block(2, top, 3, 'leaves')
+    assert world.top_block_y(2, 3) == top
+    assert world.top_block_y(2, 3, solid=True) < top
+    world.remove_block(2, top, 3)
+    assert world.top_block_y(2, 3) < top
+
+
+def test_cold_storage_round_trip(world):
+    world.set_block(1, 1, 1, 'dirt')
+    before = {key: chunk.to_array() for key, chunk in world.chunks.items()}
+    for key in world.chunks:
+        assert world.compress_chunk(*key)
+        assert world.chunks[key].sections is None
+    assert world.get_block(1, 1, 1) == 'dirt'
+    for key, chunk in world.chunks.items():
+        assert (chunk.to_array() == before[key]).all()
+
+
+def test_overlay_keeps_only_edits(registry, random_blocks):
+    arrays = {(0, 0): random_blocks(3)}
+    world = VoxelWorld(registry, 'overlay')
+    world.load_chunk(0, 0, generator_from(arrays))
+    assert world.edit_count() == 0
+    world.set_block(0, 0, 0, 'bedrock')
+    world.remove_block(0, 0, 0)
+    assert world.edit_count() == 1
+    world.compress_chunk(0, 0)
+    assert world.get_block(0, 0, 0) is None
+
+
+def test_structure_spill_is_not_an_edit(registry):
+    empty = {key: np.zeros((CHUNK_SIZE, WORLD_HEIGHT, CHUNK_SIZE), dtype=np.uint8) for key in ((0, 0), (1, 0))}
+    leaves = registry.id_of('leaves')
+    # Kaynak (0, 0), hücreler komşu (1, 0) chunk'ına taşıyor
+    cells = (np.array([16, 17]), np.array([5, 5]), np.array([2, 2]),
+             np.array([leaves, leaves], dtype=np.uint8), np.array([False, True]))
+    world = VoxelWorld(registry, 'overlay')
+    world.load_chunk(0, 0, generator_from(empty))
+    assert world.stamp_structure(cells, (0, 0)) == set()
+    assert world.pending_sources == {(1, 0): {(0, 0)}}
+
+    world.load_chunk(1, 0, generator_from(empty), spill=lambda cx, cz: cells)
+    assert world.get_block(16, 5, 2) == 'leaves' and world.get_block(17, 5, 2) == 'leaves'
+    assert world.edit_count() == 0
+    world.compress_chunk(1, 0)
+    assert world.get_block(17, 5, 2) == 'leaves'
+
+
+def test_writes_to_ungenerated_chunk_are_replayed(world, registry):
+    assert world.set_block(40, 3, 1, 'log')
+    assert world.set_block(41, 3, 1, 'log')
+    assert world.remove_block(41, 3, 1) == 'log'
+    assert not world.has_chunk(2, 0)
+
+    world.arrays[(2, 0)] = np.full((CHUNK_SIZE, WORLD_HEIGHT, CHUNK_SIZE), registry.id_of('stone'), dtype=np.uint8)
+    world.load_chunk(2, 0, generator_from(world.arrays))
+    assert world.get_block(40, 3, 1) == 'log'
+    assert world.get_block(41, 3, 1) == 'stone'
+    assert world.pending_writes == {}
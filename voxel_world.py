@@ -0,0 +1,746 @@
+# -*- coding: utf-8 -*-
+"""
+PyCraft Voxel Dünya Deposu
+Blokları chunk bazlı NumPy dizilerinde saklar.
+
+Eski sistemde her blok global bir sözlükte {(x, y, z): 'grass'} olarak
+tutuluyordu. 256x256 bir dünyada bu milyonlarca tuple anahtar ve string
+değer demekti. Burada her chunk 16 blok yüksekliğinde dikey bölümlere
+(section) ayrılır; blok tipleri registry'deki tamsayı ID'leri ile tutulur
+(0 = hava). Tamamen hava olan bölüm hiç yer kaplamaz, tek tip bloktan
+oluşan bölüm tek bir değer olarak saklanır. Oyuncudan uzak chunk'lar
+zlib ile sıkıştırılıp ilk erişimde şeffaf biçimde açılır (soğuk depolama).
+
+'overlay' depolama modunda chunk'lar deterministik üreteçlerinden yeniden
+hesaplanabilir; kalıcı olarak sadece oyuncu/dünya düzenlemeleri seyrek bir
+katmanda tutulur ve uzak chunk'ların bölümleri tamamen bırakılır.
+"""
+
+import sys
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from functools import partial
+
+import numpy as np
+
+# Chunk boyutları (main.py'deki chunk_size ile aynı olmalı)
+CHUNK_SIZE = 16
+SECTION_HEIGHT = 16
+SECTION_COUNT = 4
+MIN_Y = -10   # Ana kaya seviyesi (dahil)
+WORLD_HEIGHT = SECTION_HEIGHT * SECTION_COUNT
+MAX_Y = MIN_Y + WORLD_HEIGHT  # Dikey sınır (hariç)
+
+AIR = 0  # Hava bloğunun ID'si
+NO_BLOCK = MIN_Y - 1  # Yükseklik haritasında boş sütun değeri
+CHUNK_VOLUME = CHUNK_SIZE * WORLD_HEIGHT * CHUNK_SIZE
+
+# 6 komşu (block_registry FACE_* sırası ile aynı)
+NEIGHBOR_OFFSETS = ((0, 1, 0), (0, -1, 0), (1, 0, 0), (-1, 0, 0), (0, 0, 1), (0, 0, -1))
+
+SECTION_BYTES = CHUNK_SIZE * SECTION_HEIGHT * CHUNK_SIZE
+
+STORAGE_MODES = ('full', 'overlay')
+
+
+def _split_sections(blocks):
+    """Yoğun (16, WORLD_HEIGHT, 16) diziyi sıkıştırılmış bölüm listesine böler"""
+    sections = []
+    for si in range(SECTION_COUNT):
+        section = blocks[:, si * SECTION_HEIGHT:(si + 1) * SECTION_HEIGHT, :]
+        first = section.flat[0]
+        if (section == first).all():
+            sections.append(None if first == AIR else int(first))
+        else:
+            sections.append(section.copy())
+    return sections
+
+
+def stamp_cells(blocks, x0, z0, cells):
+    """
+    Hücreleri yoğun chunk dizisine tek adımda yazar (x0, z0: chunk köşesi).
+    Chunk dışına veya dikey sınır dışına düşenler yazılmaz.
+
+    Returns: yazılan hücreler için (yerel_x, y, yerel_z, ids) dizileri
+    """
+    xs, ys, zs, ids, replace = cells
+    lx, ly, lz = xs - x0, ys - MIN_Y, zs - z0
+    inside = ((lx >= 0) & (lx < CHUNK_SIZE) & (lz >= 0) & (lz < CHUNK_SIZE) &
+              (ly >= 0) & (ly < WORLD_HEIGHT))
+    written = []
+    # Önce sadece-boşluğa hücreler, sonra her zaman yazılanlar
+    for mask, only_air in ((inside & ~replace, True), (inside & replace, False)):
+        px, py, pz, pid = lx[mask], ly[mask], lz[mask], ids[mask]
+        if only_air:
+            empty = blocks[px, py, pz] == AIR
+            px, py, pz, pid = px[empty], py[empty], pz[empty], pid[empty]
+        blocks[px, py, pz] = pid
+        written.append((px, py + MIN_Y, pz, pid))
+    return tuple(np.concatenate(parts) for parts in zip(*written))
+
+
+class ColdStorageStats:
+    """Soğuk depolama sayaçları (sıkıştırma/açma süreleri ve kazanılan bayt)"""
+
+    def __init__(self):
+        self.compressed_chunks = 0
+        self.raw_bytes = 0      # Sıkıştırılmış chunk'ların ham boyutu
+        self.packed_bytes = 0   # Sıkıştırılmış boyut
+        self.compress_count = 0
+        self.compress_time = 0.0
+        self.decompress_count = 0
+        self.decompress_time = 0.0
+        # Overlay modu: bölümleri bırakılan ve üreteçten geri getirilen chunk'lar
+        self.evicted_chunks = 0
+        self.regen_count = 0
+        self.regen_time = 0.0
+
+    @property
+    def bytes_saved(self):
+        return self.raw_bytes - self.packed_bytes
+
+    def summary(self):
+        avg_c = self.compress_time / self.compress_count * 1000 if self.compress_count else 0
+        avg_d = self.decompress_time / self.decompress_count * 1000 if self.decompress_count else 0
+        text = (f"{self.compressed_chunks} chunk, {self.bytes_saved / 1024:.0f} KB kazanç, "
+                f"sıkıştırma {avg_c:.2f} ms, açma {avg_d:.2f} ms")
+        if self.evicted_chunks or self.regen_count:
+            avg_r = self.regen_time / self.regen_count * 1000 if self.regen_count else 0
+            text += f", {self.evicted_chunks} tahliye, yeniden üretim {avg_r:.2f} ms"
+        return text
+
+
+class ChunkData:
+    """
+    Tek bir chunk'ın voxel verisi, sütun yükseklik haritası ve istatistikleri.
+
+    sections[i] bölümün y aralığı MIN_Y + i*16 .. +16 olmak üzere:
+    None (tamamen hava), int (tek tip blok) veya (16, 16, 16) uint8 dizi.
+
+    top_solid / top_any her (yerel_x, yerel_z) sütunu için en üstteki katı
+    ve herhangi bir bloğun dünya y değerini tutar (boş sütun = NO_BLOCK).
+    Her düzenlemede sütun bazında (O(sütun)) güncellenir.
+
+    block_counts (blok ID başına adet, hava dahil) ve exposed_faces
+    (çizilen yüz sayısı) VoxelWorld tarafından her düzenlemede artımlı
+    olarak güncellenir; sorgular O(1)'dir.
+
+    compress() dizi bölümlerini zlib ile paketler, evict() ise overlay
+    chunk'larında bölümleri tamamen bırakır (sections = None). Bölümlere
+    dokunan her metod önce _load() ile veriyi geri getirir. Yükseklik haritası
+    ve sayaçlar bellekte kalır, bu yüzden zemin ve istatistik sorguları
+    yükleme gerektirmez.
+
+    Overlay modunda baseline chunk'ın deterministik üretecidir ve edits
+    ({düz_indeks: blok ID}) üretimden sonraki tüm yazmaları tutar. Komşu
+    yapılardan taşan hücreler üretimin parçasıdır; düzenleme sayılmaz,
+    spill'de aynı biçimde ayrı tutulur ve tabana edits'ten önce uygulanır.
+    """
+
+    def __init__(self, registry, storage_stats=None):
+        self.solid_table = registry.solid
+        self.sections = [None] * SECTION_COUNT
+        self.packed = None  # (bölüm düzeni, zlib verisi) - sıkıştırılmışsa
+        self.baseline = None  # Overlay modu: yoğun diziyi üreten çağrılabilir
+        self.edits = None     # Overlay modu: {düz_indeks: blok ID}
+        self.spill = None     # Overlay modu: yapı taşmaları {düz_indeks: blok ID}
+        self.storage_stats = storage_stats or ColdStorageStats()
+        self._pack_lock = threading.Lock()
+        self.top_solid = np.full((CHUNK_SIZE, CHUNK_SIZE), NO_BLOCK, dtype=np.int16)
+        self.top_any = np.full((CHUNK_SIZE, CHUNK_SIZE), NO_BLOCK, dtype=np.int16)
+        self.last_access = 0.0  # Son blok okuma/yazma zamanı (VoxelWorld.clock), soğuk depo için
+
+        # İstatistikler
+        self.block_counts = np.zeros(registry.block_count, dtype=np.int32)
+        self.block_counts[AIR] = CHUNK_VOLUME
+        self.exposed_faces = 0
+
+    @property
+    def total_blocks(self):
+        return CHUNK_VOLUME - int(self.block_counts[AIR])
+
+    # --- SOĞUK DEPOLAMA ---
+    @property
+    def is_compressed(self):
+        return self.packed is not None
+
+    def compress(self, level=1):
+        """
+        Dizi bölümlerini tek bir zlib bloğuna paketler.
+        Hava ve tek tip bölümler zaten küçük olduğundan düzende kalır.
+        """
+        if self.sections is None:
+            return
+        with self._pack_lock:
+            if self.sections is None:
+                return
+            t0 = time.perf_counter()
+            layout = tuple('a' if isinstance(s, np.ndarray) else s for s in self.sections)
+            arrays = [s for s in self.sections if isinstance(s, np.ndarray)]
+            if not arrays:
+                return  # Paketlenecek dizi yok
+            raw = b''.join(a.tobytes() for a in arrays)
+            blob = zlib.compress(raw, level)
+            self.packed = (layout, blob)
+            self.sections = None
+
+            stats = self.storage_stats
+            stats.compressed_chunks += 1
+            stats.raw_bytes += len(raw)
+            stats.packed_bytes += len(blob)
+            stats.compress_count += 1
+            stats.compress_time += time.perf_counter() - t0
+
+    def evict(self):
+        """
+        Overlay chunk'ının bölümlerini bellekten bırakır.
+        Sonraki erişimde üreteç + düzenlemeler ile aynı veri geri kurulur.
+        """
+        if self.baseline is None or self.sections is None:
+            return False
+        with self._pack_lock:
+            if self.sections is None:
+                return False
+            self.sections = None
+            self.storage_stats.evicted_chunks += 1
+        return True
+
+    def _load(self):
+        """Bellekte olmayan bölümleri geri getirir (sıkıştırılmış veya tahliye edilmiş)"""
+        with self._pack_lock:
+            if self.sections is not None:
+                return  # Başka bir iş parçacığı yükledi
+            if self.packed is not None:
+                self._unpack()
+            else:
+                self._regenerate()
+
+    def _unpack(self):
+        t0 = time.perf_counter()
+        layout, blob = self.packed
+        raw = zlib.decompress(blob)
+        shape = (CHUNK_SIZE, SECTION_HEIGHT, CHUNK_SIZE)
+        sections, offset = [], 0
+        for kind in layout:
+            if kind == 'a':
+                sections.append(np.frombuffer(raw, np.uint8, SECTION_BYTES, offset).reshape(shape).copy())
+                offset += SECTION_BYTES
+            else:
+                sections.append(kind)
+        self.sections = sections
+        self.packed = None
+
+        stats = self.storage_stats
+        stats.compressed_chunks -= 1
+        stats.raw_bytes -= len(raw)
+        stats.packed_bytes -= len(blob)
+        stats.decompress_count += 1
+        stats.decompress_time += time.perf_counter() - t0
+
+    def _regenerate(self):
+        t0 = time.perf_counter()
+        blocks = self.baseline()
+        flat = blocks.reshape(-1)
+        for layer in (self.spill, self.edits):
+            if layer:
+                flat[np.fromiter(layer.keys(), dtype=np.int64, count=len(layer))] = \
+                    np.fromiter(layer.values(), dtype=np.uint8, count=len(layer))
+        self.sections = _split_sections(blocks)
+
+        stats = self.storage_stats
+        stats.evicted_chunks -= 1
+        stats.regen_count += 1
+        stats.regen_time += time.perf_counter() - t0
+
+    # --- OVERLAY DÜZENLEMELERİ ---
+    @property
+    def edit_count(self):
+        return len(self.edits) if self.edits else 0
+
+    def stamp(self, x0, z0, cells):
+        """
+        Yapı hücrelerini tek vektörel adımda yazar; yazılan hücrelerin (yerel_x, yerel_z) dizilerini döndürür.
+        Overlay modunda hücreler taşma katmanına gider; üzerine yazılan düzenlemeler katmandan düşer.
+        """
+        blocks = self.to_array()
+        lx, ys, lz, ids = stamp_cells(blocks, x0, z0, cells)
+        if len(ids):
+            self.sections = _split_sections(blocks)
+            self.rebuild_heightmap(blocks)
+            if self.spill is not None:
+                flat = (((lx * WORLD_HEIGHT) + ys - MIN_Y) * CHUNK_SIZE + lz).tolist()
+                self.spill.update(zip(flat, ids.tolist()))
+                for index in flat:
+                    self.edits.pop(index, None)
+        return lx, lz
+
+    def fill(self, blocks):
+        """Yoğun diziden bölümleri ve yükseklik haritasını kurar (arazi üretimi)"""
+        self.sections = _split_sections(blocks)
+        self.packed = None
+        self.rebuild_heightmap(blocks)
+
+    # --- BÖLÜM ERİŞİMİ ---
+    def get_local(self, lx, y, lz):
+        if self.sections is None: self._load()
+        ly = y - MIN_Y
+        section = self.sections[ly // SECTION_HEIGHT]
+        if section is None:
+            return AIR
+        if isinstance(section, np.ndarray):
+            return section[lx, ly % SECTION_HEIGHT, lz]
+        return section
+
+    def _write_section(self, lx, y, lz, block_id):
+        if self.sections is None: self._load()
+        ly = y - MIN_Y
+        si, sy = ly // SECTION_HEIGHT, ly % SECTION_HEIGHT
+        section = self.sections[si]
+        if not isinstance(section, np.ndarray):
+            current = AIR if section is None else section
+            if current == block_id:
+                return
+            # Tek tip bölüm ilk farklı yazmada diziye açılır
+            section = np.full((CHUNK_SIZE, SECTION_HEIGHT, CHUNK_SIZE), current, dtype=np.uint8)
+            self.sections[si] = section
+        section[lx, sy, lz] = block_id
+        # Bölüm tamamen boşaldıysa bırak (hava bölümü yer kaplamaz)
+        if block_id == AIR and not section.any():
+            self.sections[si] = None
+
+    def compact(self):
+        """Tek tip veya boş dizi bölümlerini tek değere indirger"""
+        if self.sections is None: self._load()
+        for si, section in enumerate(self.sections):
+            if isinstance(section, np.ndarray):
+                first = section.flat[0]
+                if (section == first).all():
+                    self.sections[si] = None if first == AIR else int(first)
+
+    def to_array(self):
+        """Chunk'ın yoğun (16, WORLD_HEIGHT, 16) kopyasını döndürür"""
+        if self.sections is None: self._load()
+        arr = np.zeros((CHUNK_SIZE, WORLD_HEIGHT, CHUNK_SIZE), dtype=np.uint8)
+        for si, section in enumerate(self.sections):
+            if section is not None:
+                arr[:, si * SECTION_HEIGHT:(si + 1) * SECTION_HEIGHT, :] = section
+        return arr
+
+    def x_slab(self, lx):
+        """Sabit yerel x dilimi, (WORLD_HEIGHT, 16) [y, z]"""
+        if self.sections is None: self._load()
+        slab = np.zeros((WORLD_HEIGHT, CHUNK_SIZE), dtype=np.uint8)
+        for si, section in enumerate(self.sections):
+            if section is not None:
+                slab[si * SECTION_HEIGHT:(si + 1) * SECTION_HEIGHT, :] = (
+                    section[lx] if isinstance(section, np.ndarray) else section)
+        return slab
+
+    def z_slab(self, lz):
+        """Sabit yerel z dilimi, (16, WORLD_HEIGHT) [x, y]"""
+        if self.sections is None: self._load()
+        slab = np.zeros((CHUNK_SIZE, WORLD_HEIGHT), dtype=np.uint8)
+        for si, section in enumerate(self.sections):
+            if section is not None:
+                slab[:, si * SECTION_HEIGHT:(si + 1) * SECTION_HEIGHT] = (
+                    section[:, :, lz] if isinstance(section, np.ndarray) else section)
+        return slab
+
+    # --- YAZMA VE YÜKSEKLİK HARİTASI ---
+    def set_local(self, lx, y, lz, block_id):
+        """Yerel konuma blok yazar ve yükseklik haritasını günceller"""
+        self._write_section(lx, y, lz, block_id)
+        if self.edits is not None:
+            self.edits[((lx * WORLD_HEIGHT) + y - MIN_Y) * CHUNK_SIZE + lz] = block_id
+
+        # Herhangi blok
+        if block_id != AIR:
+            if y > self.top_any[lx, lz]:
+                self.top_any[lx, lz] = y
+        elif y == self.top_any[lx, lz]:
+            self.top_any[lx, lz] = self._scan_column(lx, lz, y, solid=False)
+
+        # Katı blok
+        if self.solid_table[block_id]:
+            if y > self.top_solid[lx, lz]:
+                self.top_solid[lx, lz] = y
+        elif y == self.top_solid[lx, lz]:
+            self.top_solid[lx, lz] = self._scan_column(lx, lz, y, solid=True)
+
+    def _scan_column(self, lx, lz, below_y, solid):
+        """below_y'nin altındaki en üst bloğu sütunda arar (boş bölümleri atlar)"""
+        if self.sections is None: self._load()
+        limit = below_y - MIN_Y
+        for si in range(min(limit - 1, WORLD_HEIGHT - 1) // SECTION_HEIGHT, -1, -1):
+            section = self.sections[si]
+            if section is None:
+                continue
+            top = min(limit - si * SECTION_HEIGHT, SECTION_HEIGHT)
+            if isinstance(section, np.ndarray):
+                col = section[lx, :top, lz]
+                hits = np.flatnonzero(self.solid_table[col] if solid else col != AIR)
+                if len(hits):
+                    return MIN_Y + si * SECTION_HEIGHT + int(hits[-1])
+            elif (self.solid_table[section] if solid else section != AIR):
+                # Tek tip bölüm: aralıktaki en üst hücre sonuçtur
+                return MIN_Y + si * SECTION_HEIGHT + top - 1
+        return NO_BLOCK
+
+    def find_below(self, lx, y, lz, solid=False):
+        """y dahil aşağıdaki ilk bloğun y değeri (yoksa NO_BLOCK)"""
+        top = int((self.top_solid if solid else self.top_any)[lx, lz])
+        # Sütunun tepesinin üstündeysek tek okuma yeterli (genel durum)
+        if y >= top:
+            return top
+        if y < MIN_Y:
+            return NO_BLOCK
+        return self._scan_column(lx, lz, y + 1, solid)
+
+    def rebuild_heightmap(self, blocks=None):
+        """Toplu yazmalardan sonra yükseklik haritasını baştan hesaplar"""
+        if blocks is None:
+            blocks = self.to_array()
+        ys = np.arange(MIN_Y, MAX_Y, dtype=np.int16)[None, :, None]
+        self.top_any = np.where(blocks != AIR, ys, NO_BLOCK).max(axis=1).astype(np.int16)
+        self.top_solid = np.where(self.solid_table[blocks], ys, NO_BLOCK).max(axis=1).astype(np.int16)
+
+    def nbytes(self):
+        voxels = sum(s.nbytes for s in self.sections or () if isinstance(s, np.ndarray))
+        if self.packed is not None:
+            voxels += len(self.packed[1])
+        if self.edits is not None:
+            voxels += sys.getsizeof(self.edits) + sys.getsizeof(self.spill)
+        return voxels + self.top_solid.nbytes + self.top_any.nbytes + self.block_counts.nbytes
+
+
+class VoxelWorld:
+    """
+    Chunk anahtarlı voxel deposu.
+
+    Yoğun diziler [yerel_x, y - MIN_Y, yerel_z] sırasıyla indekslenir.
+    Koordinatlar main.py'deki gibi tamsayı dünya koordinatlarıdır.
+    """
+
+    def __init__(self, registry, storage_mode='full'):
+        if storage_mode not in STORAGE_MODES:
+            raise ValueError(f"Bilinmeyen depolama modu: {storage_mode}")
+        # ID'ler block_registry.BlockRegistry'den gelir (0 = hava)
+        self.registry = registry
+        self.storage_mode = storage_mode
+        self.id_to_name = registry.names
+        self.name_to_id = registry.ids
+        self.chunks = {}  # {(cx, cz): ChunkData}
+        # Henüz üretilmemiş chunk'lara yapısı taşan kaynak chunk'lar: {(cx, cz): {kaynak, ...}}
+        # Hücreler saklanmaz; chunk geldiğinde kaynağın (deterministik) taşmasından yeniden alınır
+        self.pending_sources = {}
+        # Henüz üretilmemiş chunk'lara yapılan yazmalar: {(cx, cz): {(yerel_x, y, yerel_z): blok ID}}
+        # Boş chunk açılırsa üretim onu atlardı; yazmalar chunk geldiğinde üretimin üzerine uygulanır
+        self.pending_writes = {}
+        self.cold_stats = ColdStorageStats()
+        # Erişim saati: çağıran her karede günceller, chunk'ların last_access değeri buradan yazılır
+        self.clock = 0.0
+
+        # Dünya geneli istatistikler (chunk değerlerinin toplamı)
+        self.total_blocks = 0
+        self.total_exposed_faces = 0
+
+        # Toplu düzenleme modu (arazi üretimi gibi)
+        self._bulk_depth = 0
+        self._bulk_dirty = set()
+
+    # --- CHUNK ERİŞİMİ ---
+    def has_chunk(self, cx, cz):
+        return (cx, cz) in self.chunks
+
+    def chunk_keys(self):
+        """Veri içeren tüm chunk koordinatlarını döndürür"""
+        return list(self.chunks.keys())
+
+    def get_chunk(self, cx, cz):
+        return self.chunks.get((cx, cz))
+
+    def load_chunk(self, cx, cz, generator, blocks=None, spill=None):
+        """
+        Chunk'ı deterministik üreteçten kurar: generator(cx, cz) -> (16, WORLD_HEIGHT, 16) uint8.
+        blocks verilirse (örn. başka süreçte üretilmiş) üreteç çağrılmaz.
+        Overlay modunda üreteç saklanır, sonraki yazmalar düzenleme katmanına gider.
+        spill(kaynak_cx, kaynak_cz) bu chunk'a yapısı taşmış kaynakların hücrelerini verir.
+        Chunk üretilmeden önce yapılan yazmalar en son (düzenleme olarak) uygulanır.
+        """
+        chunk = ChunkData(self.registry, self.cold_stats)
+        chunk.fill(generator(cx, cz) if blocks is None else blocks)
+        if self.storage_mode == 'overlay':
+            chunk.baseline, chunk.edits, chunk.spill = partial(generator, cx, cz), {}, {}
+        chunk.last_access = self.clock
+        self.chunks[(cx, cz)] = chunk
+
+        # Komşulardan bu chunk'a taşıp bekleyen yapılar (overlay'de taşma katmanına yazılır)
+        for source in self.pending_sources.pop((cx, cz), ()):
+            if spill is not None:
+                chunk.stamp(cx * CHUNK_SIZE, cz * CHUNK_SIZE, spill(*source))
+        for (lx, y, lz), block_id in self.pending_writes.pop((cx, cz), {}).items():
+            chunk.set_local(lx, y, lz, block_id)
+
+        self._refresh_stats({(cx, cz)})
+        return chunk
+
+    def stamp_structure(self, cells, source):
+        """
+        Yapı hücrelerini (bkz. structures.py) dünyaya yazar.
+
+        Yüklü chunk'lara chunk başına tek vektörel adımda yazılır. Henüz
+        üretilmemiş chunk'lar için sadece kaynak chunk anahtarı kuyruğa alınır;
+        chunk load_chunk ile geldiğinde hücreler spill(kaynak) ile yeniden
+        hesaplanır. Kuyruk chunk başına birkaç anahtar tutar (hücre dizisi değil).
+
+        Args:
+            source: hücrelerin ait olduğu (yapıları üreten) chunk anahtarı
+        Returns: içeriği değişen yüklü chunk anahtarları ve sınır hücresi
+            değiştiği için dolgusu değişen komşuları
+        """
+        cxs, czs = cells[0] // CHUNK_SIZE, cells[2] // CHUNK_SIZE
+        changed, padding = set(), set()
+        for cx, cz in set(zip(cxs.tolist(), czs.tolist())):
+            chunk = self.chunks.get((cx, cz))
+            if chunk is None:
+                self.pending_sources.setdefault((cx, cz), set()).add(source)
+                continue
+            part = tuple(a[(cxs == cx) & (czs == cz)] for a in cells)
+            lx, lz = chunk.stamp(cx * CHUNK_SIZE, cz * CHUNK_SIZE, part)
+            if len(lx):
+                changed.add((cx, cz))
+                for on_border, key in ((lx == 0, (cx - 1, cz)), (lx == CHUNK_SIZE - 1, (cx + 1, cz)),
+                                       (lz == 0, (cx, cz - 1)), (lz == CHUNK_SIZE - 1, (cx, cz + 1))):
+                    if key in self.chunks and on_border.any():
+                        padding.add(key)
+        self._refresh_stats(changed)
+        return changed | padding
+
+    def _refresh_stats(self, keys):
+        """Değişen chunk'lar ve sınır komşularının istatistikleri (toplu modda çıkışta)"""
+        if self._bulk_depth:
+            self._bulk_dirty.update(keys)
+            return
+        dirty = set()
+        for cx, cz in keys:
+            dirty.update(((cx, cz), (cx - 1, cz), (cx + 1, cz), (cx, cz - 1), (cx, cz + 1)))
+        for key in dirty:
+            if key in self.chunks:
+                self.rebuild_stats(*key)
+
+    def padded_chunk_array(self, cx, cz):
+        """
+        Chunk dizisini her yönde 1 blokluk dolgu ile döndürür.
+
+        X/Z dolgusu komşu chunk'ların bitişik dilimlerinden kopyalanır,
+        Y dolgusu ve olmayan komşular hava kabul edilir.
+        Boyut: (CHUNK_SIZE + 2, WORLD_HEIGHT + 2, CHUNK_SIZE + 2)
+        """
+        pad = np.zeros((CHUNK_SIZE + 2, WORLD_HEIGHT + 2, CHUNK_SIZE + 2), dtype=np.uint8)
+        chunk = self.chunks.get((cx, cz))
+        if chunk is None:
+            return pad
+        chunk.last_access = self.clock
+        pad[1:-1, 1:-1, 1:-1] = chunk.to_array()
+        west, east = self.chunks.get((cx - 1, cz)), self.chunks.get((cx + 1, cz))
+        north, south = self.chunks.get((cx, cz - 1)), self.chunks.get((cx, cz + 1))
+        if west is not None: pad[0, 1:-1, 1:-1] = west.x_slab(CHUNK_SIZE - 1)
+        if east is not None: pad[-1, 1:-1, 1:-1] = east.x_slab(0)
+        if north is not None: pad[1:-1, 1:-1, 0] = north.z_slab(CHUNK_SIZE - 1)
+        if south is not None: pad[1:-1, 1:-1, -1] = south.z_slab(0)
+        return pad
+
+    # --- BLOK ERİŞİMİ ---
+    def get_id(self, x, y, z):
+        """Konumdaki blok ID'sini döndürür (hava veya sınır dışı = 0)"""
+        if not MIN_Y <= y < MAX_Y:
+            return AIR
+        chunk = self.chunks.get((x // CHUNK_SIZE, z // CHUNK_SIZE))
+        if chunk is None:
+            return AIR
+        chunk.last_access = self.clock
+        return chunk.get_local(x % CHUNK_SIZE, y, z % CHUNK_SIZE)
+
+    def get_block(self, x, y, z):
+        """Konumdaki blok adını döndürür (boşsa None)"""
+        return self.id_to_name[self.get_id(x, y, z)]
+
+    def has_block(self, x, y, z):
+        return self.get_id(x, y, z) != AIR
+
+    def set_block(self, x, y, z, block_type):
+        """
+        Bloğu yerleştirir. Dikey sınırların dışındaysa False döner.
+        Chunk henüz üretilmediyse yazma bekletilir ve chunk gelince uygulanır.
+
+        Args:
+            block_type: Blok adı ('grass', 'stone', ...)
+        """
+        if not MIN_Y <= y < MAX_Y:
+            return False
+        key = (x // CHUNK_SIZE, z // CHUNK_SIZE)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            self.pending_writes.setdefault(key, {})[(x % CHUNK_SIZE, y, z % CHUNK_SIZE)] = self.name_to_id[block_type]
+            return True
+        chunk.last_access = self.clock
+        self._write(chunk, x, y, z, self.name_to_id[block_type])
+        return True
+
+    def remove_block(self, x, y, z):
+        """Bloğu siler ve silinen bloğun adını döndürür (boşsa None)"""
+        if not MIN_Y <= y < MAX_Y:
+            return None
+        key = (x // CHUNK_SIZE, z // CHUNK_SIZE)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            # Üretilmemiş chunk: sadece bekleyen yazma geri alınabilir
+            writes = self.pending_writes.get(key)
+            old = writes.pop((x % CHUNK_SIZE, y, z % CHUNK_SIZE), AIR) if writes else AIR
+            if writes is not None and not writes:
+                del self.pending_writes[key]
+            return self.id_to_name[old] if old != AIR else None
+        old = chunk.get_local(x % CHUNK_SIZE, y, z % CHUNK_SIZE)
+        if old == AIR:
+            return None
+        chunk.last_access = self.clock
+        self._write(chunk, x, y, z, AIR)
+        return self.id_to_name[old]
+
+    def _write(self, chunk, x, y, z, block_id):
+        """Bloğu yazar; blok sayıları ve açık yüz sayılarını artımlı günceller"""
+        lx, lz = x % CHUNK_SIZE, z % CHUNK_SIZE
+        old = int(chunk.get_local(lx, y, lz))
+        if old == block_id:
+            return
+        if self._bulk_depth:
+            # Toplu modda istatistikler bulk_edit sonunda yeniden hesaplanır
+            chunk.set_local(lx, y, lz, block_id)
+            self._bulk_dirty.add((x // CHUNK_SIZE, z // CHUNK_SIZE))
+            return
+
+        visible = self.registry.face_visible
+        face_delta = 0
+        for dx, dy, dz in NEIGHBOR_OFFSETS:
+            nx, ny, nz = x + dx, y + dy, z + dz
+            neighbor = int(self.get_id(nx, ny, nz))
+            # Bloğun kendi yüzü
+            face_delta += int(visible[block_id, neighbor]) - int(visible[old, neighbor])
+            # Komşunun bu bloğa bakan yüzü (komşunun chunk'ına yazılır)
+            if neighbor != AIR:
+                d = int(visible[neighbor, block_id]) - int(visible[neighbor, old])
+                if d:
+                    self.chunks[(nx // CHUNK_SIZE, nz // CHUNK_SIZE)].exposed_faces += d
+                    self.total_exposed_faces += d
+        chunk.exposed_faces += face_delta
+        self.total_exposed_faces += face_delta
+
+        chunk.block_counts[old] -= 1
+        chunk.block_counts[block_id] += 1
+        self.total_blocks += (block_id != AIR) - (old != AIR)
+        chunk.set_local(lx, y, lz, block_id)
+
+    @contextmanager
+    def bulk_edit(self):
+        """
+        Çok sayıda yazma için istatistik güncellemesini erteler.
+        Çıkışta etkilenen chunk'lar (ve sınır komşuları) vektörel olarak yeniden sayılır.
+        """
+        self._bulk_depth += 1
+        try:
+            yield
+        finally:
+            self._bulk_depth -= 1
+            if not self._bulk_depth:
+                dirty = set()
+                for cx, cz in self._bulk_dirty:
+                    dirty.update(((cx, cz), (cx - 1, cz), (cx + 1, cz), (cx, cz - 1), (cx, cz + 1)))
+                for key in self._bulk_dirty:
+                    self.chunks[key].compact()
+                self._bulk_dirty.clear()
+                for key in dirty:
+                    if key in self.chunks:
+                        self.rebuild_stats(*key)
+
+    # --- İSTATİSTİKLER ---
+    def rebuild_stats(self, cx, cz):
+        """Chunk istatistiklerini sıfırdan hesaplar (toplu yazmalardan sonra)"""
+        chunk = self.chunks[(cx, cz)]
+        pad = self.padded_chunk_array(cx, cz)
+        center = pad[1:-1, 1:-1, 1:-1]
+        visible = self.registry.face_visible
+        faces = 0
+        for dx, dy, dz in NEIGHBOR_OFFSETS:
+            neighbor = pad[1 + dx:pad.shape[0] - 1 + dx, 1 + dy:pad.shape[1] - 1 + dy, 1 + dz:pad.shape[2] - 1 + dz]
+            faces += int(np.count_nonzero(visible[center, neighbor]))
+        counts = np.bincount(center.ravel(), minlength=len(chunk.block_counts)).astype(np.int32)
+
+        self.total_blocks += (CHUNK_VOLUME - int(counts[AIR])) - chunk.total_blocks
+        self.total_exposed_faces += faces - chunk.exposed_faces
+        chunk.block_counts = counts
+        chunk.exposed_faces = faces
+
+    def chunk_stats(self, cx, cz):
+        """
+        Chunk istatistiklerini döndürür (O(blok türü sayısı)).
+
+        Returns:
+            {'blocks': int, 'exposed_faces': int, 'counts': {blok_adı: adet}} veya None
+        """
+        chunk = self.chunks.get((cx, cz))
+        if chunk is None:
+            return None
+        counts = {self.id_to_name[i]: int(n) for i, n in enumerate(chunk.block_counts) if i != AIR and n}
+        return {'blocks': chunk.total_blocks, 'exposed_faces': chunk.exposed_faces, 'counts': counts}
+
+    # --- YÜKSEKLİK HARİTASI ---
+    def top_block_y(self, x, z, solid=False):
+        """Sütundaki en üst bloğun (solid=True ise katı bloğun) y değeri, yoksa None"""
+        chunk = self.chunks.get((x // CHUNK_SIZE, z // CHUNK_SIZE))
+        if chunk is None:
+            return None
+        top = int((chunk.top_solid if solid else chunk.top_any)[x % CHUNK_SIZE, z % CHUNK_SIZE])
+        return None if top == NO_BLOCK else top
+
+    def block_below(self, x, y, z, solid=False):
+        """y dahil aşağı doğru ilk bloğun y değeri, yoksa None (zemin arama)"""
+        chunk = self.chunks.get((x // CHUNK_SIZE, z // CHUNK_SIZE))
+        if chunk is None:
+            return None
+        found = chunk.find_below(x % CHUNK_SIZE, min(y, MAX_Y - 1), z % CHUNK_SIZE, solid)
+        return None if found == NO_BLOCK else found
+
+    def memory_bytes(self):
+        """Voxel dizilerinin toplam bellek kullanımı (bayt)"""
+        return sum(chunk.nbytes() for chunk in self.chunks.values())
+
+    # --- SOĞUK DEPOLAMA ---
+    def compress_chunk(self, cx, cz, idle=0.0):
+        """
+        Chunk'ı soğuk depoya alır: overlay chunk'ları tahliye edilir, diğerleri
+        sıkıştırılır. İşlem yapıldıysa True döner.
+
+        Args:
+            idle: Son erişimden bu yana en az bu kadar (clock birimi) geçmemişse
+                chunk hâlâ okunuyor sayılır ve dokunulmaz
+        """
+        chunk = self.chunks.get((cx, cz))
+        if chunk is None or chunk.sections is None:
+            return False
+        if self.clock - chunk.last_access < idle:
+            return False
+        if chunk.baseline is not None:
+            return chunk.evict()
+        chunk.compress()
+        return chunk.is_compressed
+
+    # --- OVERLAY ---
+    def edit_count(self):
+        """Düzenleme katmanındaki toplam blok sayısı"""
+        return sum(chunk.edit_count for chunk in self.chunks.values())
+
+    def edit_save_bytes(self):
+        """Düzenleme katmanının kayıt boyutu: düzenleme başına uint16 indeks + uint8 ID"""
+        return self.edit_count() * 3
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+PyCraft Dünya Kaydı
+Dünyanın kalıcı bilgileri (şimdilik tohum) kayıt klasöründeki world.json
+dosyasında tutulur. Kayıt önbellekten ayrıdır: cache/ silinse de aynı dünya
+açılır, sadece arazi yeniden üretilir.
+"""
+
+import json
+import os
+
+WORLD_FILE = 'world.json'
+
+
+def load_or_create_seed(directory, create):
+    """
+    Kayıtlı tohumu döndürür; kayıt yoksa create() ile seçip kaydeder.
+
+    Returns:
+        (tohum, yeni_mi)
+    """
+    path = os.path.join(directory, WORLD_FILE)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return int(json.load(f)['seed']), False
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    seed = create()
+    try:
+        os.makedirs(directory, exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({'seed': seed}, f)
+        os.replace(tmp, path)
+    except OSError:
+        print(f"[DÜNYA] Kayıt yazılamadı: {path}")
+    return seed, True